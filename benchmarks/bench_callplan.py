@@ -0,0 +1,98 @@
+"""Micro-benchmark of the client-side cost of a call, with and without call plans.
+
+It measures the CPU time spent by the client, not the time spent waiting
+for the daemon, which runs in another process. A call is made:
+- "legacy": as before the call plans: a dictionary of every parameter filtered
+  into another one, the whole envelope encoded, a `requests.Request` prepared
+  from scratch, and the proxies resolved from the environment by `requests`;
+- "call": with `LbrydApi.call`, which builds its parameters as a dictionary;
+- "method": with the generated method, which uses the plan of the command.
+The time to build and encode the body of the request alone is also reported.
+
+Build the package with `make` first, then run it from the project root:
+    python benchmarks/bench_callplan.py --calls 2000
+"""
+import argparse
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import requests  # noqa: E402
+
+import pybry  # noqa: E402
+from pybry.callplan import encode_call  # noqa: E402
+from mock_server import MockDaemon  # noqa: E402
+
+URLS = ["lbry://@LBRYPlaylists#d/video#1"]
+
+
+def legacy_call(lbry, url, method, params):
+    """Make a call the way `BaseApi` did before the call plans."""
+    params = {k: v for (k, v) in params.items() if v is not None}
+    data = {"method": method, "params": params, "jsonrpc": "2.0", "id": lbry._next_request_id()}
+    headers = {"Content-Type": "application/json-rpc",
+               "user-agent": "LBRY python3-api"}
+    prepared = requests.Request("POST", url, data=lbry.codec.dumps(data), headers=headers).prepare()
+    response = lbry.session.send(prepared, timeout=lbry.timeout)
+    return lbry.codec.loads(response.content)["result"], response
+
+
+def legacy_body(lbry, method, params):
+    params = {k: v for (k, v) in params.items() if v is not None}
+    return lbry.codec.dumps({"method": method, "params": params, "jsonrpc": "2.0",
+                             "id": lbry._next_request_id()})
+
+
+def cpu_per_call(func, calls):
+    """Return the CPU time, in microseconds, of a call to `func`."""
+    for _ in range(min(calls, 100)):
+        func()
+    start = time.process_time()
+    for _ in range(calls):
+        func()
+    return (time.process_time() - start) / calls * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000, help="calls of each kind")
+    args = parser.parse_args(argv)
+
+    daemon = MockDaemon(subprocess=True).start()
+    url = pybry.lbryd_api.SERVER_ADDRESS = daemon.url
+    # Every argument of `resolve`, as the generated method had them
+    arguments = dict.fromkeys(pybry.lbryd_api.PLANS.resolve.names)
+    arguments["urls"] = URLS
+    plan = pybry.lbryd_api.PLANS.resolve
+
+    try:
+        with pybry.LbrydApi() as lbry:
+            calls = {
+                "legacy": lambda: legacy_call(lbry, url, "resolve", dict(arguments)),
+                "call": lambda: lbry.call("resolve", {"urls": URLS}),
+                "method": lambda: lbry.resolve(urls=URLS),
+            }
+            bodies = {
+                "legacy": lambda: legacy_body(lbry, "resolve", dict(arguments)),
+                "method": lambda: encode_call({"method": "resolve", "params": plan(URLS),
+                                               "jsonrpc": "2.0", "id": lbry._next_request_id()},
+                                              lbry.codec),
+            }
+
+            print(f"{'call':<8} {'CPU us/call':>12} {'body us':>10}")
+            legacy = None
+            for name, func in calls.items():
+                cpu = cpu_per_call(func, args.calls)
+                legacy = legacy or cpu
+                body = f"{cpu_per_call(bodies[name], args.calls * 10):10.2f}" if name in bodies else ""
+                print(f"{name:<8} {cpu:12.1f} {body:>10}   ({cpu / legacy:.0%} of legacy)")
+    finally:
+        daemon.stop()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
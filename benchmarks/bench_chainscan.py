@@ -0,0 +1,77 @@
+"""Benchmark of scanning the chain with `scan_blocks` against serial `getblockhash` and `getblock` calls.
+
+A stand-in `lbrycrd` daemon, in a child process, waits `--latency` milliseconds
+before answering each request, like a node across a network. `--blocks` blocks
+are requested one call at a time, then with `scan_blocks` and every number
+of workers given with `--workers`. For each, it reports the blocks per second,
+the HTTP requests made, and the speedup over the serial calls.
+
+Build the package with `make` first, then run it from the project root:
+    python benchmarks/bench_chainscan.py --blocks 2000 --latency 5 --workers 1 4 8
+"""
+import argparse
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import pybry  # noqa: E402
+from mock_server import MockDaemon  # noqa: E402
+
+
+def serial(lbrycrd, start, end):
+    for height in range(start, end + 1):
+        block_hash, _ = lbrycrd.call("getblockhash", [height])
+        block, _ = lbrycrd.call("getblock", [block_hash, 1])
+        yield block
+
+
+class Counter(pybry.MetricsCollector):
+    def reset(self):
+        self.__init__()
+
+
+def measure(name, blocks, metrics, serial_rate=None):
+    metrics.reset()
+    start = time.perf_counter()
+    count = sum(1 for _ in blocks)
+    elapsed = time.perf_counter() - start
+
+    rate = count / elapsed
+    requests = sum(method["calls"] for method in metrics.to_dict().values())
+    speedup = f"{rate / serial_rate:8.1f}x" if serial_rate else ""
+    print(f"{name:<12} {rate:12.0f} {requests:10} {speedup}")
+    return rate
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--blocks", type=int, default=2000, help="blocks scanned")
+    parser.add_argument("--serial-blocks", type=int, default=200, help="blocks requested with serial calls")
+    parser.add_argument("--latency", type=float, default=5, help="milliseconds before each response")
+    parser.add_argument("--batch-size", type=int, default=100, help="blocks requested in a batch")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8], help="batches requested at once")
+    parser.add_argument("--verbosity", type=int, default=1, help="verbosity of getblock")
+    args = parser.parse_args(argv)
+
+    daemon = MockDaemon(chain=True, subprocess=True, latency=args.latency / 1000).start()
+    pybry.lbrycrd_api.SERVER_ADDRESS = daemon.url
+
+    print(f"{'scan':<12} {'blocks/s':>12} {'requests':>10} {'speedup':>9}")
+    try:
+        metrics = Counter()
+        with pybry.LbrycrdApi("user", "password", pool_maxsize=max(args.workers), hooks=[metrics]) as lbrycrd:
+            serial_rate = measure("serial", serial(lbrycrd, 1, args.serial_blocks), metrics)
+            for workers in args.workers:
+                blocks = lbrycrd.scan_blocks(1, args.blocks, batch_size=args.batch_size,
+                                             max_workers=workers, verbosity=args.verbosity)
+                measure(f"{workers} workers", blocks, metrics, serial_rate)
+    finally:
+        daemon.stop()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""Micro-benchmark of the JSON codecs on large responses.
+
+It decodes and encodes a response shaped like a page of `txo_list`
+with every codec that is installed, and compares them with
+returning the raw bytes, which is what the `raw` mode does.
+
+Build the package with `make` first, then run it from the project root:
+    python benchmarks/bench_codec.py --items 2000 --repeat 20
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fixtures import Fixtures, make_response as make_body  # noqa: E402
+from pybry.codec import CODECS, JsonCodec  # noqa: E402
+
+
+def make_response(items):
+    """Return the body of a JSON-RPC response with a page of `items` TXOs."""
+    return make_body(Fixtures(total_items=items).page("txo_list", 1, items))
+
+
+def timeit(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=2000, help="items in the response page")
+    parser.add_argument("--repeat", type=int, default=20, help="runs of each measurement")
+    args = parser.parse_args(argv)
+
+    body = make_response(args.items)
+    document = JsonCodec.loads(body)
+    print(f"Response of {args.items} items, {len(body) / 1024 / 1024:.2f} MiB")
+    print(f"{'codec':>8} {'decode ms':>10} {'encode ms':>10} {'MiB/s':>8}")
+
+    raw = timeit(lambda: memoryview(body), args.repeat)
+    print(f"{'raw':>8} {raw * 1000:10.3f} {'-':>10} {'-':>8}")
+
+    for name, codec in CODECS.items():
+        decode = timeit(lambda: codec.loads(body), args.repeat)
+        encode = timeit(lambda: codec.dumps(document), args.repeat)
+        print(f"{name:>8} {decode * 1000:10.3f} {encode * 1000:10.3f} "
+              f"{len(body) / 1024 / 1024 / decode:8.1f}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""Benchmark of a `ClaimFeed` against polling `claim_search` for every subscription.
+
+A stand-in `lbrynet` daemon holds a history of claims in `--channels` channels
+with `--tags` tags, and `--new-claims` claims are created before each round.
+Every channel and every tag is watched, first by calling `claim_search` once for
+each of them and diffing its first page with the claims already seen,
+then with a feed. For each, it reports the HTTP requests, the `claim_search`
+calls and the data received per round, the time of a round, and the number
+of times a new claim was delivered to a subscription in total.
+
+Build the package with `make` first, then run it from the project root:
+    python benchmarks/bench_feed.py --channels 200 --rounds 10
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import pybry  # noqa: E402
+from fixtures import ClaimFixtures  # noqa: E402
+from mock_server import MockServer  # noqa: E402
+
+
+class Naive:
+    """Polls the first page of a search for every subscription, and diffs it."""
+
+    def __init__(self, lbry, searches, page_size):
+        self.lbry = lbry
+        self.searches = searches
+        self.page_size = page_size
+        self.seen = [set() for _ in searches]
+
+    def poll(self):
+        new = 0
+        for search, seen in zip(self.searches, self.seen):
+            result, _ = self.lbry.claim_search(page_size=self.page_size, order_by=["creation_height"],
+                                               **search)
+            for claim in result["items"]:
+                if claim["claim_id"] not in seen:
+                    seen.add(claim["claim_id"])
+                    new += 1
+        return new
+
+
+def measure(name, poll, rounds, new_claims, server, metrics):
+    poll()
+    metrics.reset()
+    delivered, elapsed = 0, 0.0
+    for _ in range(rounds):
+        # New claims on the stand-in daemon
+        server.fixtures.total_items += new_claims
+        server.encode.cache_clear()
+
+        start = time.perf_counter()
+        delivered += poll()
+        elapsed += time.perf_counter() - start
+
+    recorded = metrics.to_dict()
+    requests = sum(method["calls"] for method in recorded.values())
+    received = sum(method["response_bytes"] for method in recorded.values())
+    searches = recorded.get("claim_search", {}).get("calls", 0) + \
+        sum(1 for call in metrics.batch_methods if call == "claim_search")
+
+    print(f"{name:<8} {requests / rounds:10.1f} {searches / rounds:10.1f} "
+          f"{received / rounds / 1024:10.1f} {elapsed / rounds * 1000:10.1f} {delivered:10}")
+
+
+class BatchCounter(pybry.MetricsCollector):
+    """Also counts the calls sent in batches."""
+
+    def __init__(self):
+        super().__init__()
+        self.batch_methods = []
+
+    def reset(self):
+        self.__init__()
+
+    def before_request(self, call):
+        super().before_request(call)
+        if call.methods:
+            self.batch_methods.extend(call.methods)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--history", type=int, default=5000, help="claims created before the first round")
+    parser.add_argument("--channels", type=int, default=200, help="channels watched")
+    parser.add_argument("--tags", type=int, default=20, help="tags watched")
+    parser.add_argument("--new-claims", type=int, default=50, help="claims created before each round")
+    parser.add_argument("--rounds", type=int, default=10, help="polls of every subscription")
+    parser.add_argument("--page-size", type=int, default=20, help="claims in the pages of the searches")
+    args = parser.parse_args(argv)
+
+    fixtures = ClaimFixtures(total_items=args.history, channels=args.channels, tags=args.tags)
+    server = MockServer(("127.0.0.1", 0), fixtures)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    pybry.lbryd_api.SERVER_ADDRESS = f"http://127.0.0.1:{server.server_port}"
+
+    searches = [{"channel_ids": [fixtures.channel_id(channel)]} for channel in range(args.channels)]
+    searches += [{"any_tags": [f"tag-{tag}"]} for tag in range(args.tags)]
+
+    print(f"{'polling':<8} {'requests':>10} {'searches':>10} {'KiB':>10} {'ms':>10} {'delivered':>10}")
+    try:
+        metrics = BatchCounter()
+        with pybry.LbrydApi(hooks=[metrics]) as lbry:
+            naive = Naive(lbry, searches, args.page_size)
+            measure("naive", naive.poll, args.rounds, args.new_claims, server, metrics)
+
+        fixtures.total_items = args.history
+        server.encode.cache_clear()
+        metrics = BatchCounter()
+        with pybry.LbrydApi(hooks=[metrics]) as lbry:
+            feed = pybry.ClaimFeed(lbry, page_size=args.page_size)
+            for search in searches:
+                feed.subscribe(**search)
+
+            def poll():
+                return sum(len(subscriptions) for _, subscriptions in feed.poll(force=True))
+
+            measure("feed", poll, args.rounds, args.new_claims, server, metrics)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""Benchmark of the import of the package, in the regular and the lazy builds.
+
+It generates both builds in temporary directories, and measures in fresh
+interpreters the time to import `pybry` and create a wrapper, cold
+(without bytecode caches) and warm, the memory of the process and the memory
+allocated by the import, the size of the generated wrappers, and the time
+of the first access to a method, which creates it in the lazy build.
+It fails if importing the package imports the modules of the optional
+features, such as `aiohttp` or `pybry.models`, which are only imported when they are used.
+
+Run it from the project root; it doesn't need a previous build:
+    python benchmarks/bench_import.py --repeat 10
+"""
+import argparse
+import contextlib
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Run in a fresh interpreter; prints the import time, the maximum resident
+# memory once imported, and the time to access the first method
+PROBE = """
+import resource, time
+start = time.perf_counter()
+import pybry
+lbry = pybry.LbrydApi()
+imported = time.perf_counter()
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+lbry.claim_search
+print(imported - start, time.perf_counter() - imported, rss)
+"""
+
+# Prints the memory allocated by the import, which tracing slows down
+HEAP_PROBE = """
+import tracemalloc
+tracemalloc.start()
+import pybry
+lbry = pybry.LbrydApi()
+print(tracemalloc.get_traced_memory()[0])
+"""
+
+# Modules that only the asynchronous wrappers and the optional features import
+OPTIONAL_MODULES = ("aiohttp", "sqlite3", "opentelemetry", "pybry.models", "pybry.cache",
+                    "pybry.instrumentation", "pybry.transport", "pybry.resilience",
+                    "pybry.pagination", "pybry.fanout")
+
+# Exits with an error if importing the package imported any of `OPTIONAL_MODULES`
+ISOLATION_PROBE = f"""
+import sys
+import pybry
+pybry.LbrydApi(), pybry.LbrycrdApi("user", "password")
+imported = [name for name in {OPTIONAL_MODULES!r} if name in sys.modules]
+if imported:
+    sys.exit("Importing pybry imported " + ", ".join(imported))
+"""
+
+
+def build(directory, lazy):
+    """Generate the package in `directory`, and return its path."""
+    shutil.copy(os.path.join(ROOT, "generator.py"), directory)
+    shutil.copytree(os.path.join(ROOT, "template"), os.path.join(directory, "template"))
+    argv = [sys.executable, "generator.py", os.path.join(ROOT, "docs", "api.json")]
+    subprocess.run(argv + (["--lazy"] if lazy else []), cwd=directory, check=True,
+                   stdout=subprocess.DEVNULL)
+    return directory
+
+
+def probe(directory, warm, source=PROBE):
+    env = dict(os.environ, PYTHONPATH=directory)
+    if warm:
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+    else:
+        env["PYTHONDONTWRITEBYTECODE"] = "1"
+        for cache in ("__pycache__", os.path.join("pybry", "__pycache__")):
+            shutil.rmtree(os.path.join(directory, cache), ignore_errors=True)
+
+    output = subprocess.run([sys.executable, "-c", source], env=env, cwd=directory, check=True,
+                            stdout=subprocess.PIPE, universal_newlines=True).stdout
+    return [float(value) for value in output.split()]
+
+
+def isolated(directory):
+    """Return whether importing the package leaves `OPTIONAL_MODULES` unimported."""
+    env = dict(os.environ, PYTHONPATH=directory)
+    return subprocess.run([sys.executable, "-c", ISOLATION_PROBE], env=env, cwd=directory).returncode == 0
+
+
+def wrappers_size(directory):
+    names = ("lbryd_api.py", "async_lbryd_api.py", "lbryd_commands.py")
+    paths = [os.path.join(directory, "pybry", name) for name in names]
+    return sum(os.path.getsize(path) for path in paths if os.path.exists(path))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10, help="interpreters started for each measurement")
+    args = parser.parse_args(argv)
+
+    print(f"{'build':>8} {'cold ms':>8} {'warm ms':>8} {'access ms':>10} {'RSS MiB':>8} {'heap KiB':>9} {'size KiB':>9}")
+
+    with contextlib.ExitStack() as stack:
+        for name, lazy in (("regular", False), ("lazy", True)):
+            directory = build(stack.enter_context(tempfile.TemporaryDirectory()), lazy)
+            if not isolated(directory):
+                return 1
+
+            cold = [probe(directory, warm=False) for _ in range(args.repeat)]
+            # Writes the bytecode caches
+            probe(directory, warm=True)
+            warm = [probe(directory, warm=True) for _ in range(args.repeat)]
+            heap = probe(directory, warm=True, source=HEAP_PROBE)[0]
+
+            print(f"{name:>8} {min(r[0] for r in cold) * 1000:8.1f}"
+                  f" {min(r[0] for r in warm) * 1000:8.1f}"
+                  f" {statistics.median(r[1] for r in warm) * 1000:10.3f}"
+                  f" {statistics.median(r[2] for r in warm) / 1024:8.1f}"
+                  f" {heap / 1024:9.1f}"
+                  f" {wrappers_size(directory) / 1024:9.1f}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""Benchmark of projecting a large page on a few fields, against decoding it whole.
+
+A stand-in `lbrynet` daemon, in a child process, answers a page of `--page-size`
+items of `txo_list`. The page is requested `--repeat` times, decoded whole
+and then projected on `--fields`, then with `fields`, decoded as it is received,
+and with `fields` and a decode pool of `--workers` processes.
+For each, it reports the time until the first item, the time until the last one,
+and the peak of the memory allocated while reading the page, measured in another pass.
+
+Build the package with `make` first, then run it from the project root:
+    python benchmarks/bench_projection.py --page-size 5000 --fields txid nout amount height
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import pybry  # noqa: E402
+from mock_server import MockDaemon  # noqa: E402
+
+
+def whole(lbry, args):
+    projection = pybry.Projection(args.fields)
+    result = lbry.txo_list(page_size=args.page_size)
+    for item in result["items"]:
+        yield projection(item)
+
+
+def projected(lbry, args):
+    return lbry.txo_list(page_size=args.page_size, fields=args.fields)
+
+
+def measure(name, read, lbry, args):
+    first = last = 0.0
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        items = iter(read(lbry, args))
+        kept = [next(items)]
+        first += time.perf_counter() - start
+        kept.extend(items)
+        last += time.perf_counter() - start
+
+    tracemalloc.start()
+    kept = list(read(lbry, args))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(f"{name:<10} {len(kept):8} {first / args.repeat * 1000:10.1f} {last / args.repeat * 1000:10.1f} "
+          f"{peak / 1024 / 1024:10.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--page-size", type=int, default=5000, help="items of the page")
+    parser.add_argument("--fields", nargs="+", default=["txid", "nout", "amount", "height"],
+                        help="projected fields")
+    parser.add_argument("--repeat", type=int, default=5, help="requests of the page for each reading")
+    parser.add_argument("--workers", type=int, default=2, help="processes of the decode pool")
+    parser.add_argument("--transport", choices=["requests", "http"], default="requests",
+                        help="transport of the wrapper")
+    args = parser.parse_args(argv)
+
+    daemon = MockDaemon(total_items=args.page_size, subprocess=True).start()
+    pybry.lbryd_api.SERVER_ADDRESS = daemon.url
+
+    print(f"{'reading':<10} {'items':>8} {'first ms':>10} {'last ms':>10} {'peak MiB':>10}")
+    try:
+        with pybry.LbrydApi(transport=args.transport, result_mode="result") as lbry:
+            # The daemon encodes the page once, before anything is measured
+            lbry.txo_list(page_size=args.page_size)
+            measure("whole", whole, lbry, args)
+            measure("fields", projected, lbry, args)
+
+        with ProcessPoolExecutor(args.workers) as pool:
+            with pybry.LbrydApi(transport=args.transport, decode_pool=pool) as lbry:
+                list(projected(lbry, args))
+                measure("pool", projected, lbry, args)
+    finally:
+        daemon.stop()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""Benchmark of a `PersistentStore` shared by several worker processes.
+
+`--workers` processes each request the same `--txs` transactions from
+a stand-in `lbrycrd` daemon, with `getrawtransaction`, like the workers
+of a web server answering the same pages. They run without a store,
+then with a store they share, whose file is empty at first, and then
+with the same file again, like workers started after a restart.
+For each run, it reports the requests received by the daemon
+and the time until every worker is done.
+
+Build the package with `make` first, then run it from the project root:
+    python benchmarks/bench_store.py --workers 8 --txs 500 --latency 2
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import pybry  # noqa: E402
+from fixtures import ChainFixtures  # noqa: E402
+from mock_server import MockDaemon  # noqa: E402
+
+
+def work(url, path, txs, requests):
+    """Request every transaction, and count the requests sent to the daemon."""
+    pybry.lbrycrd_api.SERVER_ADDRESS = url
+    store = pybry.PersistentStore(path) if path else None
+    metrics = pybry.MetricsCollector()
+    with pybry.LbrycrdApi("user", "password", store=store, hooks=[metrics],
+                            result_mode="meta") as lbrycrd:
+        for height in range(1, txs + 1):
+            lbrycrd.call("getrawtransaction", [ChainFixtures.txid(height, 0), 1])
+    with requests.get_lock():
+        requests.value += sum(method["calls"] for method in metrics.to_dict().values())
+
+
+def measure(name, url, path, args):
+    requests = multiprocessing.Value("i", 0)
+    workers = [multiprocessing.Process(target=work, args=(url, path, args.txs, requests))
+               for _ in range(args.workers)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<12} {requests.value:10} {elapsed * 1000:10.0f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=8, help="worker processes")
+    parser.add_argument("--txs", type=int, default=500, help="transactions requested by every worker")
+    parser.add_argument("--latency", type=float, default=2, help="milliseconds before each response")
+    args = parser.parse_args(argv)
+
+    daemon = MockDaemon(chain=True, subprocess=True, latency=args.latency / 1000).start()
+    print(f"{'store':<12} {'requests':>10} {'ms':>10}")
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "store.db")
+            measure("none", daemon.url, None, args)
+            measure("cold", daemon.url, path, args)
+            measure("warm", daemon.url, path, args)
+    finally:
+        daemon.stop()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""Benchmark of the transports of the synchronous wrappers, with and without compression.
+
+Stand-in `lbrynet` daemons, in child processes, listen on a local port and
+on a Unix domain socket. Every transport, `requests`, `http` and `unix`, makes
+`--calls` single calls to `version`, then requests `--pages` pages of `--page-size`
+claims with `claim_search`, first uncompressed, then asking for gzip.
+For each, it reports the calls and the pages per second, and the size
+of a page as received.
+
+Build the package with `make` first, then run it from the project root:
+    python benchmarks/bench_transport.py --calls 2000 --pages 50 --page-size 500
+"""
+import argparse
+import gzip
+import os
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import pybry  # noqa: E402
+from mock_server import MockDaemon  # noqa: E402
+
+
+def rate(func, count):
+    func()
+    start = time.perf_counter()
+    for _ in range(count):
+        func()
+    return count / (time.perf_counter() - start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000, help="single calls of each transport")
+    parser.add_argument("--pages", type=int, default=50, help="pages requested by each transport")
+    parser.add_argument("--page-size", type=int, default=500, help="claims in a page")
+    args = parser.parse_args(argv)
+
+    directory = tempfile.mkdtemp()
+    socket_path = os.path.join(directory, "lbrynet.sock")
+    total_items = args.page_size * 2
+    daemons = [MockDaemon(total_items=total_items, subprocess=True).start(),
+               MockDaemon(total_items=total_items, subprocess=True, unix_socket=socket_path).start()]
+    tcp, unix = daemons
+
+    transports = [("requests", tcp.url, lambda compress: pybry.RequestsTransport(compress=compress)),
+                  ("http", tcp.url, lambda compress: pybry.HttpTransport(compress=compress)),
+                  ("unix", unix.url, lambda compress: pybry.UnixTransport(socket_path, compress=compress))]
+
+    print(f"{'transport':<10} {'gzip':<6} {'calls/s':>10} {'pages/s':>10} {'page KiB':>10}")
+    try:
+        for name, url, make in transports:
+            pybry.lbryd_api.SERVER_ADDRESS = url
+            for compress in (False, True):
+                with pybry.LbrydApi(transport=make(compress), result_mode="result") as lbry:
+                    calls = rate(lbry.version, args.calls)
+                    pages = rate(lambda: lbry.claim_search(page_size=args.page_size), args.pages)
+
+                    body = lbry.call("claim_search", {"page_size": args.page_size}, raw=True)
+                    size = len(gzip.compress(body, compresslevel=1)) if compress else len(body)
+                print(f"{name:<10} {'yes' if compress else 'no':<6} {calls:10.0f} {pages:10.1f} {size / 1024:10.1f}")
+    finally:
+        for daemon in daemons:
+            daemon.stop()
+        os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
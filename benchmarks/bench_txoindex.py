@@ -0,0 +1,87 @@
+"""Benchmark of the local TXO index against scanning the history on the daemon.
+
+It measures, against a stand-in `lbrynet` daemon with a history of `--items` TXOs,
+a report computed by listing the whole history with `txo_list`, the first sync
+of a `TxoIndex`, a sync after `--new-items` TXOs were added, the sync of the spent TXOs,
+which lists every unspent one, and the same report answered by the index.
+The stand-in daemon lists every TXO as unspent, which makes its last sync slower
+than with a real wallet.
+
+Build the package with `make` first, then run it from the project root:
+    python benchmarks/bench_txoindex.py --items 20000 --new-items 100
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from decimal import Decimal
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import pybry  # noqa: E402
+from mock_server import MockDaemon  # noqa: E402
+
+
+def timed(func):
+    start = time.perf_counter()
+    value = func()
+    return time.perf_counter() - start, value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=20000, help="TXOs in the history of the wallet")
+    parser.add_argument("--new-items", type=int, default=100, help="TXOs added before the second sync")
+    parser.add_argument("--page-size", type=int, default=500, help="items requested in each page")
+    parser.add_argument("--repeat", type=int, default=20, help="runs of the local query")
+    args = parser.parse_args(argv)
+
+    daemon = MockDaemon(total_items=args.items).start()
+    pybry.lbryd_api.SERVER_ADDRESS = daemon.url
+    low = args.items // 2
+
+    def scan():
+        # The report as computed without an index: the amount received above a height
+        return sum(Decimal(txo["amount"]) for txo in lbry.iter_txo_list(page_size=args.page_size)
+                   if txo["height"] >= low)
+
+    def query():
+        return index.sum_amount(min_height=low)
+
+    try:
+        with pybry.LbrydApi() as lbry, tempfile.TemporaryDirectory() as directory:
+            index = pybry.TxoIndex(lbry, os.path.join(directory, "wallet.db"), page_size=args.page_size)
+
+            scanned, _ = timed(scan)
+            first, _ = timed(index.sync)
+
+            # New blocks on the stand-in daemon
+            daemon._server.fixtures.total_items += args.new_items
+            daemon._server.encode.cache_clear()
+            index.track_spent = False
+            incremental, counts = timed(index.sync)
+            index.track_spent = True
+            spent, _ = timed(index.sync)
+
+            expected = scan()
+            queried = min(timed(query)[0] for _ in range(args.repeat))
+            if query() != expected:
+                raise AssertionError(f"The index returned {query()} instead of {expected}")
+
+            index.close()
+    finally:
+        daemon.stop()
+
+    print(f"{'operation':<24} {'ms':>10}")
+    print(f"{'daemon scan':<24} {scanned * 1000:10.1f}")
+    print(f"{'first sync':<24} {first * 1000:10.1f}")
+    print(f"{'incremental sync':<24} {incremental * 1000:10.1f}   ({counts['txos']} TXOs received)")
+    print(f"{'sync of spent TXOs':<24} {spent * 1000:10.1f}   ({args.items + args.new_items} UTXOs received)")
+    print(f"{'index query':<24} {queried * 1000:10.3f}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
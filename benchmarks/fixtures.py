@@ -0,0 +1,259 @@
+"""Canned results for the stand-in daemons, derived from the API documentation.
+
+The results of the commands whose `returns` field is documented as JSON
+are built from that shape: every field gets a plausible value
+based on its name and description. Paginated commands return pages
+of any size, whose items differ by their index, so the responses
+can be made as large as needed.
+"""
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from generator import get_lbry_api_function_docs, is_paginated, parse_returns  # noqa: E402
+
+API_JSON = os.path.join(ROOT, "docs", "api.json")
+
+INT_FIELDS = {"nout", "height", "confirmations", "page", "page_size", "total_pages",
+              "total_items", "timestamp", "blobs_completed", "blobs_in_stream",
+              "blobs_remaining", "total_bytes", "total_bytes_lower_bound", "written_bytes"}
+
+# Commands that list the newest transactions first, like the daemon
+NEWEST_FIRST = {"txo_list", "transaction_list", "utxo_list"}
+
+
+def fill(key, description, index):
+    """Return a value for a documented field.
+
+    :param str key: Name of the field
+    :param str description: Its description in the API documentation
+    :param int index: Index of the item the field belongs to
+    """
+    description = description.lower()
+
+    if key in INT_FIELDS or description.startswith("(int)"):
+        return index
+    if description.startswith("(bool)") or description.startswith("true if") or key.startswith("is_"):
+        return index % 2 == 0
+    if description.startswith("(float)") or "decimal" in description or key.startswith("amount"):
+        return f"{index % 100}.{index % 1000:03d}"
+    if key in ("txid", "claim_id", "sd_hash", "stream_hash", "channel_claim_id") or "hash" in description:
+        return f"{index:040x}"
+    if key in ("value", "metadata", "claim", "reposted_claim", "signing_channel", "purchase_receipt"):
+        return {"title": f"Title {index}", "description": "Description of the claim " * 4,
+                "tags": ["tag-a", "tag-b"], "languages": ["en"]}
+    return f"{key}-{index}"
+
+
+def build(shape, index, key=""):
+    """Return a result shaped like the documented `shape`, with values for the item `index`."""
+    if isinstance(shape, dict):
+        return {k: build(v, index, k) for k, v in shape.items()}
+    if isinstance(shape, list):
+        return [build(item, index, key) for item in shape[:1]]
+    return fill(key, shape if isinstance(shape, str) else "", index)
+
+
+class Fixtures:
+    """Results of the `lbrynet` commands built from the API documentation."""
+
+    def __init__(self, doc=API_JSON, total_items=1000, streaming_url=None):
+        """
+        :param str doc: Path to the API documentation
+        :param int total_items: Number of items of every paginated command
+        :param str streaming_url: URL of the streaming server, to which
+         the `streaming_url` fields of the files point
+        """
+        self.total_items = total_items
+        self.streaming_url = streaming_url
+        self.shapes = {}
+        self.paginated = set()
+
+        sections = get_lbry_api_function_docs(doc=doc)
+        for section in sections:
+            for command in sections[section]["commands"]:
+                shape = parse_returns(command)
+                if shape is not None:
+                    self.shapes[command["name"]] = shape
+                if is_paginated(command):
+                    self.paginated.add(command["name"])
+
+    def item_shape(self, method):
+        shape = self.shapes.get(method)
+        if isinstance(shape, dict) and isinstance(shape.get("items"), list) and shape["items"]:
+            return shape["items"][0]
+        # Items of the paginated commands that are not documented as JSON
+        return self.shapes["txo_list"]["items"][0]
+
+    def page(self, method, page=1, page_size=20):
+        """Return a page of results of a paginated command."""
+        page, page_size = max(int(page), 1), max(int(page_size), 1)
+        shape = self.item_shape(method)
+        start = (page - 1) * page_size
+        stop = min(start + page_size, self.total_items)
+        indexes = range(start, stop)
+        if method in NEWEST_FIRST:
+            # The item with the highest index, and height, is listed first
+            indexes = (self.total_items - 1 - index for index in indexes)
+
+        return {"page": page,
+                "page_size": page_size,
+                "total_pages": -(-self.total_items // page_size),
+                "total_items": self.total_items,
+                "items": [build(shape, index) for index in indexes]}
+
+    def with_streaming_url(self, file):
+        """Point the `streaming_url` of a file to the streaming server, if there is one."""
+        if self.streaming_url and isinstance(file, dict) and "streaming_url" in file:
+            file["streaming_url"] = f"{self.streaming_url}/stream/{file.get('sd_hash')}"
+        return file
+
+    def result(self, method, params):
+        """Return the result of a call to `method` with `params`."""
+        params = params if isinstance(params, dict) else {}
+
+        if method in self.paginated:
+            page = self.page(method, params.get("page", 1), params.get("page_size", 20))
+            for item in page["items"]:
+                self.with_streaming_url(item)
+            return page
+
+        if method == "resolve":
+            urls = params.get("urls") or []
+            urls = [urls] if isinstance(urls, str) else urls
+            claim = self.item_shape("claim_search")
+            return {url: build(claim, index) for index, url in enumerate(urls)}
+
+        if method in self.shapes and isinstance(self.shapes[method], dict):
+            return self.with_streaming_url(build(self.shapes[method], 1))
+
+        return {"method": method, "params": params}
+
+
+def matches_constraint(value, constraint):
+    """Return whether a value meets a constraint of `claim_search`, like ">=1000" or "1000"."""
+    constraint = str(constraint)
+    for operator, compare in ((">=", value.__ge__), ("<=", value.__le__),
+                              (">", value.__gt__), ("<", value.__lt__)):
+        if constraint.startswith(operator):
+            return compare(int(constraint[len(operator):]))
+    return value == int(constraint)
+
+
+class ClaimFixtures(Fixtures):
+    """Claims of several channels and tags, which `claim_search` filters like the hub.
+
+    The claim `index` is created at the height `index // claims_per_block`,
+    in the channel `index % channels`, with the tag `index % tags`.
+    `claim_search` filters them by `channel_ids`, `any_tags` and `creation_height`,
+    and orders them by `creation_height`; the other commands are answered like by `Fixtures`.
+    """
+
+    def __init__(self, total_items=1000, channels=100, tags=20, claims_per_block=5):
+        super().__init__(total_items=total_items)
+        self.channels = channels
+        self.tags = tags
+        self.claims_per_block = claims_per_block
+
+    @staticmethod
+    def channel_id(channel):
+        return f"{channel:040x}"[::-1]
+
+    def claim(self, index):
+        claim = build(self.item_shape("claim_search"), index)
+        claim["meta"] = {"creation_height": index // self.claims_per_block}
+        claim["signing_channel"] = {"claim_id": self.channel_id(index % self.channels)}
+        claim["value"] = dict(claim["value"], tags=[f"tag-{index % self.tags}"])
+        return claim
+
+    def search(self, params):
+        """Return the indexes of the claims matching the parameters of `claim_search`, in order."""
+        channels = {int(channel[::-1], 16) for channel in params.get("channel_ids") or ()}
+        tags = {int(tag[len("tag-"):]) for tag in params.get("any_tags") or ()}
+        height = params.get("creation_height")
+
+        indexes = []
+        for index in range(self.total_items):
+            if channels and index % self.channels not in channels:
+                continue
+            if tags and index % self.tags not in tags:
+                continue
+            if height is not None and not matches_constraint(index // self.claims_per_block, height):
+                continue
+            indexes.append(index)
+
+        order_by = params.get("order_by") or ["creation_height"]
+        if not str(order_by[0]).startswith("^"):
+            indexes.reverse()
+        return indexes
+
+    def result(self, method, params):
+        if method != "claim_search":
+            return super().result(method, params)
+
+        params = params if isinstance(params, dict) else {}
+        page, page_size = max(int(params.get("page", 1)), 1), max(int(params.get("page_size", 20)), 1)
+        indexes = self.search(params)
+        start = (page - 1) * page_size
+
+        return {"page": page,
+                "page_size": page_size,
+                "items": [self.claim(index) for index in indexes[start:start + page_size]]}
+
+
+class ChainFixtures:
+    """Blocks and transactions of a fake `lbrycrd` chain, derived from their height."""
+
+    def __init__(self, height=100000, txs_per_block=10):
+        self.height = height
+        self.txs_per_block = txs_per_block
+
+    @staticmethod
+    def block_hash(height):
+        return f"{height:064x}"
+
+    @staticmethod
+    def txid(height, index):
+        return f"{height:032x}{index:032x}"
+
+    def transaction(self, txid):
+        height = int(txid[:32], 16)
+        return {"txid": txid, "vin": [], "vout": [{"value": 1.0, "n": 0}],
+                "blockhash": self.block_hash(height), "confirmations": self.height - height + 1}
+
+    def result(self, method, params):
+        params = params if isinstance(params, list) else []
+
+        if method == "getblockcount":
+            return self.height
+        if method == "getblockhash":
+            return self.block_hash(params[0])
+        if method == "getblock":
+            height = int(params[0], 16)
+            verbosity = params[1] if len(params) > 1 else 1
+            previous = self.block_hash(height - 1) if height else None
+            if verbosity == 0:
+                # A header with the hash of the previous block, followed by the transactions
+                return "00000020" + bytes.fromhex(previous or 64 * "0")[::-1].hex() + 88 * "00" + \
+                    self.txs_per_block * 250 * "00"
+
+            txids = [self.txid(height, index) for index in range(self.txs_per_block)]
+            return {"hash": params[0],
+                    "height": height,
+                    "confirmations": self.height - height + 1,
+                    "previousblockhash": previous,
+                    "tx": [self.transaction(txid) for txid in txids] if verbosity == 2 else txids,
+                    "time": 1600000000 + height * 150}
+        if method == "getrawtransaction":
+            return self.transaction(params[0])
+
+        return None
+
+
+def make_response(result, request_id=1):
+    """Return the body of the JSON-RPC response for a result."""
+    return json.dumps({"jsonrpc": "2.0", "id": request_id, "result": result},
+                      separators=(",", ":")).encode("utf-8")
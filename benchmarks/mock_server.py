@@ -0,0 +1,284 @@
+"""Stand-in `lbrynet` and `lbrycrd` daemons answering JSON-RPC calls with canned results.
+
+The server runs in a background thread of the benchmark process,
+or in a child process so that it does not share the interpreter
+with the client being measured. It answers single calls and batches,
+over keep-alive connections, like the real daemons do.
+>>> with MockDaemon(total_items=5000) as daemon:
+...     print(daemon.url)
+
+The `lbrynet` stand-in also serves the content of every stream at its
+`streaming_url`, with range requests, like the streaming server of the daemon.
+It compresses its responses for the clients that accept gzip, accepts
+compressed requests, and can listen on a Unix domain socket instead of a port.
+
+It can also be started on its own, to benchmark from another machine:
+    python benchmarks/mock_server.py --port 5279
+"""
+import argparse
+import gzip
+import json
+import multiprocessing
+import os
+import re
+import socketserver
+import sys
+import threading
+import time
+import zlib
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fixtures import ChainFixtures, Fixtures  # noqa: E402
+
+
+class RpcHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # The headers and the body are written separately; without this,
+    # delayed acknowledgements add tens of milliseconds to every call
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        encoding = self.headers.get("Content-Encoding")
+        if encoding:
+            if not self.server.compress:
+                return self.reply(415, b"")
+            body = zlib.decompress(body, 16 + zlib.MAX_WBITS if encoding == "gzip" else zlib.MAX_WBITS)
+
+        try:
+            request = json.loads(body)
+        except ValueError:
+            return self.reply(400, b'{"error": {"code": -32700, "message": "Parse error"}}')
+
+        if isinstance(request, list):
+            body = b"[" + b",".join(self.server.answer(call) for call in request) + b"]"
+        else:
+            body = self.server.answer(request)
+
+        self.reply(200, body)
+
+    def do_GET(self):
+        content = self.server.content
+        if content is None or not self.path.startswith("/stream/"):
+            return self.reply(404, b"")
+
+        size = len(content)
+        start, end = 0, size
+        requested = re.match(r"bytes=(\d+)-(\d*)$", self.headers.get("Range", ""))
+        if requested:
+            start = int(requested.group(1))
+            end = min(int(requested.group(2)) + 1, size) if requested.group(2) else size
+            if start >= size:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end - 1}/{size}")
+        else:
+            self.send_response(200)
+
+        self.send_header("Content-Type", "video/mp4")
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(end - start))
+        self.end_headers()
+
+        view = memoryview(content)
+        try:
+            for offset in range(start, end, 1024 * 1024):
+                self.wfile.write(view[offset:min(offset + 1024 * 1024, end)])
+        except (BrokenPipeError, ConnectionResetError):
+            # The client stopped reading, to seek elsewhere
+            self.close_connection = True
+
+    def reply(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if self.server.compress and len(body) > 1024 and "gzip" in self.headers.get("Accept-Encoding", ""):
+            # The fastest level, so that the client is still what is measured
+            body = gzip.compress(body, compresslevel=1)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class UnixRpcHandler(RpcHandler):
+    # There is no Nagle algorithm on Unix domain sockets
+    disable_nagle_algorithm = False
+
+
+class RpcServer:
+    """Answers the calls with the results of its fixtures; mixed into a threading socket server."""
+
+    daemon_threads = True
+    handler = RpcHandler
+
+    def __init__(self, address, fixtures, cache_size=4096, stream_size=0, latency=0, compress=True):
+        super().__init__(address, self.handler)
+        self.fixtures = fixtures
+        # Seconds waited before answering a request, like the round trip to a remote daemon
+        self.latency = latency
+        # Whether the responses are compressed for the clients that accept it
+        self.compress = compress
+        # Content of every stream
+        self.content = bytes(range(256)) * (stream_size // 256) if stream_size else None
+        if stream_size and not isinstance(fixtures, ChainFixtures):
+            fixtures.streaming_url = f"http://127.0.0.1:{self.server_port}"
+        # The encoded results are reused, so that serving them is cheap
+        # compared to the client, whose work is what is measured
+        self.encode = lru_cache(maxsize=cache_size)(self._encode)
+
+    def _encode(self, method, params):
+        result = self.fixtures.result(method, json.loads(params))
+        return json.dumps(result, separators=(",", ":")).encode("utf-8")
+
+    def answer(self, call):
+        """Return the encoded response to a single call."""
+        request_id = json.dumps(call.get("id")).encode("utf-8")
+        method = call.get("method")
+
+        if method == "fail":
+            return b'{"jsonrpc":"2.0","id":' + request_id + \
+                b',"error":{"code":-32500,"message":"failure requested"}}'
+
+        params = json.dumps(call.get("params"), sort_keys=True)
+        return b'{"jsonrpc":"2.0","id":' + request_id + b',"result":' + \
+            self.encode(method, params) + b"}"
+
+
+class MockServer(RpcServer, ThreadingHTTPServer):
+    """Stand-in daemon listening on a TCP port."""
+
+
+class UnixMockServer(RpcServer, socketserver.ThreadingUnixStreamServer):
+    """Stand-in daemon listening on a Unix domain socket, like a proxy in front of the daemon."""
+
+    handler = UnixRpcHandler
+
+    def __init__(self, path, fixtures, **options):
+        if os.path.exists(path):
+            os.unlink(path)
+        super().__init__(path, fixtures, **options)
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+
+def make_fixtures(chain, total_items):
+    return ChainFixtures() if chain else Fixtures(total_items=total_items)
+
+
+def make_server(port, chain, total_items, stream_size=0, latency=0, unix_socket=None):
+    fixtures = make_fixtures(chain, total_items)
+    if unix_socket:
+        return UnixMockServer(unix_socket, fixtures, latency=latency)
+    return MockServer(("127.0.0.1", port), fixtures, stream_size=stream_size, latency=latency)
+
+
+def serve(port, chain, total_items, stream_size=0, ready=None, latency=0, unix_socket=None):
+    server = make_server(port, chain, total_items, stream_size, latency, unix_socket)
+    if ready is not None:
+        ready.put(getattr(server, "server_port", None))
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+class MockDaemon:
+    """A stand-in daemon listening on a free local port.
+
+    :param bool chain: Whether it answers like `lbrycrd` instead of `lbrynet`
+    :param int total_items: Number of items of every paginated command
+    :param bool subprocess: Whether it runs in a child process instead of a thread
+    :param int stream_size: Size in bytes of the content of the streams;
+     a multiple of 256, nothing is streamed if 0
+    :param float latency: Seconds waited before answering each request
+    :param str unix_socket: Path of a Unix domain socket to listen on, instead of a port;
+     the content of the streams is not served then
+    """
+
+    def __init__(self, chain=False, total_items=1000, subprocess=False, stream_size=0, latency=0,
+                 unix_socket=None):
+        self.chain = chain
+        self.total_items = total_items
+        self.subprocess = subprocess
+        self.stream_size = stream_size
+        self.latency = latency
+        self.unix_socket = unix_socket
+        self.url = None
+        self._server = None
+        self._process = None
+
+    def start(self):
+        if self.subprocess:
+            ready = multiprocessing.Queue()
+            self._process = multiprocessing.Process(
+                target=serve, args=(0, self.chain, self.total_items, self.stream_size, ready, self.latency,
+                                    self.unix_socket),
+                daemon=True)
+            self._process.start()
+            port = ready.get(timeout=60)
+        else:
+            self._server = make_server(0, self.chain, self.total_items, self.stream_size, self.latency,
+                                       self.unix_socket)
+            threading.Thread(target=self._server.serve_forever, daemon=True).start()
+            port = getattr(self._server, "server_port", None)
+
+        # The host of the URL is only sent in the requests over a Unix domain socket
+        self.url = "http://localhost" if self.unix_socket else f"http://127.0.0.1:{port}"
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+            self._process = None
+            if self.unix_socket and os.path.exists(self.unix_socket):
+                os.unlink(self.unix_socket)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=5279)
+    parser.add_argument("--chain", action="store_true", help="answer like lbrycrd")
+    parser.add_argument("--total-items", type=int, default=1000,
+                        help="items of every paginated command")
+    parser.add_argument("--stream-size", type=int, default=16 * 1024 * 1024,
+                        help="bytes of the content of every stream")
+    parser.add_argument("--latency", type=float, default=0,
+                        help="milliseconds waited before answering each request")
+    parser.add_argument("--unix-socket", help="path of a Unix domain socket to listen on, instead of the port")
+    args = parser.parse_args(argv)
+
+    print(f"Listening on {args.unix_socket or f'http://127.0.0.1:{args.port}'}")
+    serve(args.port, args.chain, args.total_items, args.stream_size, latency=args.latency / 1000,
+          unix_socket=args.unix_socket)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,291 @@
+"""Benchmark suite of the API wrappers against stand-in daemons.
+
+Each scenario is run against a local `lbrynet` or `lbrycrd` stand-in
+(see `mock_server.py`), so no real daemon is needed and the results
+can be compared between versions. For each scenario it reports the
+throughput, the p50 and p99 latency of a run, the peak memory
+allocated by the client during a run, and the resident memory of the process.
+The `stream_copy` scenario copies the content of a stream, in MiB per second.
+
+Build the package with `make` first, then run it from the project root:
+    python benchmarks/run.py
+    python benchmarks/run.py --scenario batch --scenario fan_out --runs 50
+    python benchmarks/run.py --json results.json
+    python benchmarks/run.py --compare results.json --tolerance 0.2
+
+The last form exits with an error if the throughput of a scenario dropped
+by more than the tolerance, to gate releases. Point it at real daemons with
+`--lbryd http://localhost:5279` and `--lbrycrd http://localhost:9245`.
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+try:
+    import pybry
+except ImportError:
+    sys.exit("Build the package with `make` before running the benchmarks")
+
+import pybry.async_lbryd_api  # noqa: E402
+import pybry.lbrycrd_api  # noqa: E402
+import pybry.lbryd_api  # noqa: E402
+from pybry.async_base_api import aiohttp  # noqa: E402
+from mock_server import MockDaemon  # noqa: E402
+
+
+def resident_mib():
+    """Current resident memory of the process, or its peak where it cannot be read."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Bytes on macOS, kibibytes elsewhere
+        return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+class Scenario:
+    """A workload whose runs are timed one by one.
+
+    :param str name: Name of the scenario
+    :param str unit: What an operation is, for the throughput
+    :param callable setup: Function of the options returning `(run, operations, close)`,
+     the function making one run, the number of operations it makes
+     and the function releasing its connections
+    """
+
+    def __init__(self, name, unit, setup, needs_async=False):
+        self.name = name
+        self.unit = unit
+        self.setup = setup
+        self.needs_async = needs_async
+
+    def measure(self, options):
+        run, operations, close = self.setup(options)
+        try:
+            for _ in range(options.warmup):
+                run()
+
+            timings = []
+            start = time.perf_counter()
+            for _ in range(options.runs):
+                begin = time.perf_counter()
+                run()
+                timings.append(time.perf_counter() - begin)
+            total = time.perf_counter() - start
+
+            # Measured separately, because tracing slows the calls down
+            peaks = []
+            tracemalloc.start()
+            for _ in range(min(options.runs, 10)):
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+                run()
+                peaks.append(tracemalloc.get_traced_memory()[1] - before)
+            tracemalloc.stop()
+        finally:
+            close()
+
+        return {"scenario": self.name,
+                "unit": self.unit,
+                "operations": operations * options.runs,
+                "throughput": operations * options.runs / total,
+                "p50_ms": percentile(timings, 0.5) * 1000,
+                "p99_ms": percentile(timings, 0.99) * 1000,
+                "alloc_kib": statistics.mean(peaks) / 1024,
+                "rss_mib": resident_mib()}
+
+
+def single(options):
+    lbry = pybry.LbrydApi(**options.api)
+    return lambda: lbry.version(), 1, lbry.close
+
+
+def claim_search(options):
+    lbry = pybry.LbrydApi(**options.api)
+    return lambda: lbry.claim_search(page_size=options.page_size), 1, lbry.close
+
+
+def paginated_scan(options):
+    lbry = pybry.LbrydApi(**options.api)
+
+    def run():
+        for _ in lbry.iter_txo_list(page_size=options.page_size):
+            pass
+
+    return run, options.total_items, lbry.close
+
+
+def batch(options):
+    lbry = pybry.LbrydApi(**options.api)
+    calls = [("resolve", {"urls": [f"lbry://claim-{index}"]}) for index in range(options.calls)]
+    return lambda: lbry.call_many(calls), options.calls, lbry.close
+
+
+def fan_out(options):
+    lbry = pybry.LbrydApi(pool_maxsize=options.workers, **options.api)
+    params = [{"urls": [f"lbry://claim-{index}"]} for index in range(options.calls)]
+
+    def run():
+        for _ in lbry.fan_out(lbry.resolve, params, max_workers=options.workers):
+            pass
+
+    return run, options.calls, lbry.close
+
+
+def lbrycrd_batch(options):
+    lbrycrd = pybry.LbrycrdApi(options.user, options.password, **options.api)
+    calls = [("getblockhash", [height]) for height in range(options.calls)]
+    return lambda: lbrycrd.call_many(calls), options.calls, lbrycrd.close
+
+
+def async_fan_out(options):
+    loop = asyncio.new_event_loop()
+    lbry = pybry.AsyncLbrydApi(pool_maxsize=options.workers, **options.async_api)
+    params = [{"urls": [f"lbry://claim-{index}"]} for index in range(options.calls)]
+
+    async def scan():
+        async for _ in lbry.fan_out(lbry.resolve, params, max_workers=options.workers):
+            pass
+
+    def close():
+        loop.run_until_complete(lbry.close())
+        loop.close()
+
+    return lambda: loop.run_until_complete(scan()), options.calls, close
+
+
+def stream_copy(options):
+    lbry = pybry.LbrydApi(**options.api)
+    stream = lbry.stream("lbry://stream")
+    size = stream.get_size()
+
+    def run():
+        with open(os.devnull, "wb") as devnull:
+            stream.copy_to(devnull)
+
+    return run, size / 2 ** 20, lbry.close
+
+
+SCENARIOS = [Scenario("single", "calls", single),
+             Scenario("claim_search", "pages", claim_search),
+             Scenario("paginated_scan", "items", paginated_scan),
+             Scenario("batch", "calls", batch),
+             Scenario("fan_out", "calls", fan_out),
+             Scenario("lbrycrd_batch", "calls", lbrycrd_batch),
+             Scenario("async_fan_out", "calls", async_fan_out, needs_async=True),
+             Scenario("stream_copy", "MiB", stream_copy)]
+
+
+def compare(results, baseline_path, tolerance):
+    """Return the scenarios whose throughput is lower than the baseline by more than `tolerance`."""
+    with open(baseline_path) as baseline_file:
+        baseline = {result["scenario"]: result for result in json.load(baseline_file)}
+
+    regressions = []
+    for result in results:
+        before = baseline.get(result["scenario"])
+        if before and result["throughput"] < before["throughput"] * (1 - tolerance):
+            regressions.append((result["scenario"], before["throughput"], result["throughput"]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", action="append", choices=[s.name for s in SCENARIOS],
+                        help="scenario to run; all of them by default")
+    parser.add_argument("--runs", type=int, default=20, help="timed runs of each scenario")
+    parser.add_argument("--warmup", type=int, default=2, help="untimed runs of each scenario")
+    parser.add_argument("--page-size", type=int, default=50, help="items in a page")
+    parser.add_argument("--total-items", type=int, default=1000,
+                        help="items of the paginated commands of the stand-in daemon")
+    parser.add_argument("--calls", type=int, default=100, help="calls of a batch or a fan-out")
+    parser.add_argument("--workers", type=int, default=8, help="concurrent calls of a fan-out")
+    parser.add_argument("--stream-size", type=int, default=64,
+                        help="MiB of the content streamed from the stand-in daemon")
+    parser.add_argument("--codec", help="JSON codec of the wrappers")
+    parser.add_argument("--transport", choices=["requests", "http"],
+                        help="transport of the synchronous wrappers")
+    parser.add_argument("--in-process", action="store_true",
+                        help="run the stand-in daemons in a thread of this process")
+    parser.add_argument("--lbryd", help="URL of a real lbrynet daemon to use instead")
+    parser.add_argument("--lbrycrd", help="URL of a real lbrycrd daemon to use instead")
+    parser.add_argument("--user", default="lbry", help="lbrycrd username")
+    parser.add_argument("--password", default="lbry", help="lbrycrd password")
+    parser.add_argument("--json", help="file to write the results to")
+    parser.add_argument("--compare", help="results of a previous run to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed drop of throughput when comparing")
+    options = parser.parse_args(argv)
+    options.api = {"codec": options.codec} if options.codec else {}
+    # The asynchronous wrappers always send their requests with aiohttp
+    options.async_api = dict(options.api)
+    if options.transport:
+        options.api["transport"] = options.transport
+
+    daemons = []
+    if options.lbryd is None:
+        daemons.append(MockDaemon(total_items=options.total_items,
+                                  subprocess=not options.in_process,
+                                  stream_size=options.stream_size * 2 ** 20).start())
+        options.lbryd = daemons[-1].url
+    if options.lbrycrd is None:
+        daemons.append(MockDaemon(chain=True, subprocess=not options.in_process).start())
+        options.lbrycrd = daemons[-1].url
+
+    pybry.lbryd_api.SERVER_ADDRESS = options.lbryd
+    pybry.lbrycrd_api.SERVER_ADDRESS = options.lbrycrd
+    pybry.async_lbryd_api.SERVER_ADDRESS = options.lbryd
+
+    names = options.scenario or [s.name for s in SCENARIOS]
+    results = []
+
+    print(f"{'scenario':<16} {'throughput':>18} {'p50 ms':>9} {'p99 ms':>9} "
+          f"{'alloc KiB':>10} {'RSS MiB':>8}")
+    try:
+        for scenario in SCENARIOS:
+            if scenario.name not in names:
+                continue
+            if scenario.needs_async and aiohttp is None:
+                print(f"{scenario.name:<16} skipped, 'aiohttp' is not installed")
+                continue
+
+            result = scenario.measure(options)
+            results.append(result)
+            throughput = f"{result['throughput']:.0f} {result['unit']}/s"
+            print(f"{result['scenario']:<16} {throughput:>18} {result['p50_ms']:9.2f} "
+                  f"{result['p99_ms']:9.2f} {result['alloc_kib']:10.1f} {result['rss_mib']:8.1f}")
+    finally:
+        for daemon in daemons:
+            daemon.stop()
+
+    if options.json:
+        with open(options.json, "w") as json_file:
+            json.dump(results, json_file, indent=2)
+
+    if options.compare:
+        regressions = compare(results, options.compare, options.tolerance)
+        for name, before, after in regressions:
+            print(f"Regression in {name}: {before:.0f}/s before, {after:.0f}/s now")
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
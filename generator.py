@@ -4,8 +4,11 @@ This module can be executed directly or called from a building system
 like `Makefile` or `setuptools`.
 """
 import ast
+import hashlib
 import json
+import keyword
 import os
+import re
 import shutil
 import sys
 import urllib.request
@@ -17,7 +20,88 @@ from template.constants import (LBRY_API_RAW_JSON_URL,
                                 LBRYD_FPATH,
                                 LBRYCRD_BASE_FPATH,
                                 LBRYCRD_FPATH,
-                                DTYPE_MAPPING)
+                                ASYNC_LBRYD_BASE_FPATH,
+                                ASYNC_LBRYD_FPATH,
+                                ASYNC_LBRYCRD_BASE_FPATH,
+                                ASYNC_LBRYCRD_FPATH,
+                                LBRYD_SPEC_FPATH,
+                                LBRYD_COMMANDS_FPATH,
+                                MODELS_FPATH,
+                                RESULT_MODELS,
+                                NESTED_MODELS,
+                                READ_ONLY_SUFFIXES,
+                                READ_ONLY_COMMANDS,
+                                NOT_READ_ONLY_COMMANDS,
+                                DTYPE_MAPPING,
+                                FIELDS_DESCRIPTION,
+                                GENERATOR_CACHE_DIR)
+
+# Parsed API documents, by hash of their contents
+_PARSED_DOCS = {}
+
+# Contents of the API documents downloaded during this build, by URL
+_DOWNLOADED_DOCS = {}
+
+# Record of the last build, used to skip the next one if nothing changed
+BUILD_RECORD_FPATH = os.path.join(GENERATOR_CACHE_DIR, "build.json")
+
+# Class in which the methods of a section are formatted
+SECTION_CLASS = "class _Section:\n"
+
+
+def download_api_doc(url=LBRY_API_RAW_JSON_URL, cache_dir=GENERATOR_CACHE_DIR):
+    """Downloads the API documentation, or reuses the copy downloaded before if it didn't change.
+
+    The server is asked to send the document only if it changed since the last download,
+    with the `ETag` and `Last-Modified` headers of that download.
+    The copy is also used when the server cannot be reached.
+
+    :param str url: URL to the documentation we need to obtain
+    :param str cache_dir: Directory where the downloaded documents are kept
+    :return: The contents of the document
+    :rtype: bytes
+    """
+    if url in _DOWNLOADED_DOCS:
+        return _DOWNLOADED_DOCS[url]
+
+    path = os.path.join(cache_dir, "api-" + hashlib.sha256(url.encode()).hexdigest()[:16] + ".json")
+    headers_path = path + ".headers"
+
+    cached, request_headers = None, {}
+    try:
+        with open(path, "rb") as cache_file, open(headers_path, "r") as headers_file:
+            cached, headers = cache_file.read(), json.load(headers_file)
+        if headers.get("etag"):
+            request_headers["If-None-Match"] = headers["etag"]
+        if headers.get("last_modified"):
+            request_headers["If-Modified-Since"] = headers["last_modified"]
+    except (FileNotFoundError, ValueError):
+        pass
+
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, headers=request_headers)) as response:
+            contents = response.read()
+            headers = {"url": url,
+                       "etag": response.headers.get("ETag"),
+                       "last_modified": response.headers.get("Last-Modified")}
+    except urllib.error.HTTPError as err:
+        if err.code != 304 or cached is None:
+            raise
+        print("Not modified since the last download:", url)
+        contents = cached
+    except urllib.error.URLError as err:
+        if cached is None:
+            raise
+        print(f"Cannot open URL for reading; {err} '{url}'; using the copy downloaded before")
+        contents = cached
+    else:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(path, "wb") as cache_file, open(headers_path, "w") as headers_file:
+            cache_file.write(contents)
+            json.dump(headers, headers_file)
+
+    _DOWNLOADED_DOCS[url] = contents
+    return contents
 
 
 def get_lbry_api_function_docs(url=LBRY_API_RAW_JSON_URL, doc=None):
@@ -30,17 +114,17 @@ def get_lbry_api_function_docs(url=LBRY_API_RAW_JSON_URL, doc=None):
     """
     try:
         if doc:
-            with open(doc, "r") as api_file:
+            with open(doc, "rb") as api_file:
                 contents = api_file.read()
         else:
-            # Grab the page content
-            docs_page = urllib.request.urlopen(url)
-
-            # Read the contents of the actual url we grabbed and decode them into UTF-8
-            contents = docs_page.read().decode("utf-8")
+            # Grab the page content, or the copy downloaded before if it didn't change
+            contents = download_api_doc(url)
 
-        # Return the contents loaded as JSON
-        return json.loads(contents)
+        # Return the contents loaded as JSON; the same document is only parsed once
+        key = hashlib.sha256(contents).hexdigest()
+        if key not in _PARSED_DOCS:
+            _PARSED_DOCS[key] = json.loads(contents.decode("utf-8"))
+        return _PARSED_DOCS[key]
 
         # If we get an exception, simply exit
     except urllib.error.URLError as err:
@@ -53,142 +137,106 @@ def get_lbry_api_function_docs(url=LBRY_API_RAW_JSON_URL, doc=None):
     return []
 
 
-def generate_method_definition(func):
-    """Generates the body for the given function.
+def is_paginated(func):
+    """Whether the given function returns its results in pages.
 
     :param dict func: dict of a JSON-Formatted function as defined by the API docs
-    :return: A String containing the definition for the function as it should be written in code
-    :rtype: str
+    :rtype: bool
     """
-    indent = 4
+    names = {param["name"] for param in func["arguments"]}
+    return "page" in names and "page_size" in names
 
-    # initial definition
-    method_definition = (" " * indent) + "def " + func["name"]
 
-    # Here we just create a queue and put all the parameters
-    # into the queue in the order that they were given,
-    params_required = [
-        param for param in func["arguments"] if param["is_required"]
-    ]
-    params_optional = [
-        param for param in func["arguments"]
-        if not param["is_required"]
-    ]
+def is_read_only(func):
+    """Whether the given function only reads information from the daemon.
 
-    # Open the parameter definitions
-    method_definition += "(self, "
+    :param dict func: dict of a JSON-Formatted function as defined by the API docs
+    :rtype: bool
+    """
+    name = func["name"]
+    if name in NOT_READ_ONLY_COMMANDS:
+        return False
+    return name in READ_ONLY_COMMANDS or name.endswith(READ_ONLY_SUFFIXES)
 
-    for param in params_required:
-        # Put the parameter into the queue
 
-        method_definition += param["name"]
-        method_definition += ", "
+def generate_method_definition(func, is_async=False, method_name=None, request="make_request"):
+    """Generates the body for the given function.
 
-    for param in params_optional:
-        method_definition += param["name"]
+    :param dict func: dict of a JSON-Formatted function as defined by the API docs
+    :param bool is_async: Whether to generate a coroutine (`async def`) that awaits the request
+    :param str method_name: Name of the generated method; the name of the function by default
+    :param str request: The method of the base class that makes the request
+    :return: A String containing the definition for the function as it should be written in code
+    :rtype: str
+    """
+    indent = " " * 8
+    # The items of the paginated commands can be projected on some of their fields
+    fields = is_paginated(func)
 
-        # Default methods not required
-        method_definition += "=None, "
+    # The required parameters go first, in the order that they were given
+    params = ([param for param in func["arguments"] if param["is_required"]]
+              + [param for param in func["arguments"] if not param["is_required"]])
 
-    # Peel off the final ", " and close off the parameter definition
-    method_definition = method_definition.rstrip(", ") + "):\n"
+    # The pieces of the definition are joined at the end
+    signature = ["self"] + [param["name"] if param["is_required"] else param["name"] + "=None"
+                            for param in params] + (["fields=None"] if fields else [])
+    definition = [" " * 4, "async def " if is_async else "def ", method_name or func["name"],
+                  "(", ", ".join(signature), "):\n",
+                  indent, '"""', func["description"], "\n\n", indent]
 
-    indent += 4
+    # Go through each parameter and insert description & type hint
+    for param in params:
+        definition += [":param ", DTYPE_MAPPING[param["type"].lower()], " ", param["name"], ": ",
+                       param["description"], "\n" if param["is_required"] else " (Optional)\n", indent]
+    if fields:
+        definition += [":param list fields: ", FIELDS_DESCRIPTION, " (Optional)\n", indent]
 
-    # re-indent
-    method_definition += " " * indent
+    # Do not parse the returns because it doesn't work correctly at the moment
 
-    # Begin with description.
+    # Close it off; the parameters that are set are collected by the plan of the command
+    definition += ['"""\n', indent]
 
-    method_definition += '"""' + func["description"]
+    definition += ["return await " if is_async else "return ",
+                   "self.", request, "(SERVER_ADDRESS, '", func["name"], "', PLANS.", func["name"], "(",
+                   ", ".join(param["name"] for param in params), "), timeout=self.timeout",
+                   ", fields=fields)\n\n" if fields else ")\n\n"]
 
-    # re-indent
-    method_definition += "\n\n" + " " * indent
+    return "".join(definition)
 
-    # Go through each parameter and insert description & type hint
-    for param in params_required + params_optional:
-        # Add the type
-        method_definition += ":param " + DTYPE_MAPPING[param["type"].lower()]
 
-        # Add the name
-        method_definition += " " + param["name"] + ": "
+def generate_iterator_definition(func):
+    """Generates an `iter_` method that yields the items of all the pages of a paginated function.
 
-        # Add the description
-        method_definition += param["description"]
+    The generated method returns a generator in the blocking wrapper,
+    and an asynchronous generator in the asynchronous wrapper.
 
-        # Add optionality & reindent
-        method_definition += "\n" if param[
-            "is_required"] else " (Optional)\n"
+    :param dict func: dict of a JSON-Formatted function as defined by the API docs
+    :return: A String containing the definition for the method as it should be written in code
+    :rtype: str
+    """
+    description = ("Iterate over the items of all the pages of `" + func["name"] + "`, "
+                   "starting from `page`.\n\n" + " " * 8 + func["description"])
 
-        method_definition += " " * indent
-    # Do not parse the returns because it doesn't work correctly at the moment
-#    open_index = func["returns"].find('(')
-#    close_index = func["returns"].find(
-#        ')', (open_index if open_index > -1 else 0))
-#
-#    func["returns"] = func["returns"].replace("\t", " " * 4)
-#    return_string = func["returns"].replace("\n", "")
-#
-#    if open_index < close_index and func["returns"][
-#                                    open_index + 1:close_index] in DTYPE_MAPPING:
-#        method_definition += ":rtype: " + DTYPE_MAPPING[
-#            func["returns"][open_index + 1:close_index]]
-#
-#        func["returns"] = func["returns"].replace(
-#            func["returns"][open_index:close_index + 1], "")
-#
-#        method_definition += "\n" + " " * indent
-#
-#    method_definition += ":return: " + return_string
-#
-#    for i in range(0, len(return_string) + 1, 80 - (indent + 2)):
-#        method_definition += return_string[i:i + (
-#                80 - (indent + 2))] + "\n" + " " * indent
-
-    # Close it off & reindent
-    method_definition += '"""' + "\n" + " " * indent
-
-    # Create the params map
-    params_map = "__params_map = {"
-
-    # Save the indent
-    params_indent, num_params = len(
-        params_map), len(params_required) + len(params_optional)
-
-    # Append the map to the method_definition
-    method_definition += params_map
-
-    # Go through the required parameters first
-    for i, param in enumerate(params_required + params_optional):
-
-        # append the methods to the map
-        method_definition += "'" + param["name"] + "': " + param["name"]
-
-        if not param["is_required"]:
-            method_definition + " if " + param[
-                "name"] + "is not None else None"
-
-        # add commas or ending bracket if needed & reindent correctly
-        method_definition += ",\n" + " " * indent + ' ' * params_indent if i + 1 < num_params else ""
-
-    method_definition += '}\n\n' + ' ' * indent
-
-    method_definition += "return self.make_request(SERVER_ADDRESS, '" + func["name"] + "', " \
-                         + params_map.rstrip(" = {") + ", timeout=self.timeout)\n\n"
-
-    return method_definition
+    return generate_method_definition(dict(func, description=description),
+                                      method_name="iter_" + func["name"],
+                                      request="iter_pages")
 
 
 def generate_lbryd_wrapper(url=LBRY_API_RAW_JSON_URL,
                            doc=None,
                            read_file=LBRYD_BASE_FPATH,
-                           write_file=LBRYD_FPATH):
+                           write_file=LBRYD_FPATH,
+                           is_async=False,
+                           lazy=False):
     """Generates the wrapper for the lbrynet daemon.
 
     :param str url: URL to the documentation we need to obtain,
      pybry.constants.LBRY_API_RAW_JSON_URL by default
     :param str read_file: This is the path to the file from which we will be reading
     :param str write_file: Path from project root to the file we'll be writing to.
+    :param bool is_async: Whether to generate coroutine methods for the asynchronous wrapper
+    :param bool lazy: Whether the methods are created on first access from the
+     specification in `pybry.lbryd_commands`, instead of being written in the wrapper
     """
     print(80 * "-")
 
@@ -205,43 +253,38 @@ def generate_lbryd_wrapper(url=LBRY_API_RAW_JSON_URL,
 
     print("Input JSON:", inpt)
 
-    # Open the actual file for appending
-    with open(write_file, 'w') as lbry_file:
-        docstring = ['"""',
-                     'LBRY daemon wrapper in Python. Import it and initialize the main class.',
-                     '',
-                     'This file was generated at build time using the `generator` module.',
-                     'You may edit it but do so with caution.',
-                     'If this file contains syntax errors, check the input file',
-                     'for badly formated fields.',
-                     f'Input JSON: {inpt}',
-                     '"""',
-                     '']
-
-        docstring = "\n".join(docstring)
-        lbry_file.write(docstring)
-
-        with open(read_file, 'r') as template:
-            header = template.read()
-
-        lbry_file.write(header)
-
-        # Iterate through all the functions we retrieved
-        # and write them to the file
-        for section in sections:
-            commands = sections[section]["commands"]
-
-            for command in commands:
-                method_definition = generate_method_definition(command)
-                lbry_file.write(method_definition)
-
-    print("Generated 'lbrynet' API wrapper:", write_file)
-    with open(write_file) as lbry_file:
-        source = lbry_file.read()
+    docstring = ['"""',
+                 ('Asynchronous LBRY daemon wrapper in Python.' if is_async
+                  else 'LBRY daemon wrapper in Python.')
+                 + ' Import it and initialize the main class.',
+                 '',
+                 'This file was generated at build time using the `generator` module.',
+                 'You may edit it but do so with caution.',
+                 'If this file contains syntax errors, check the input file',
+                 'for badly formated fields.',
+                 f'Input JSON: {inpt}',
+                 '"""',
+                 '']
+
+    with open(read_file, 'r') as template:
+        header = template.read()
+
+    header = add_call_plans(header, {} if lazy else sections)
+
+    if lazy:
+        header = make_lazy_header(header, is_async)
+        sections = {}
+
+    # The template and the methods of each section are formatted separately,
+    # so the formatted code of the sections whose commands didn't change
+    # is reused from the previous builds; the methods are formatted inside a class
+    names = ["template"] + [section for section in sections if sections[section]["commands"]]
+    chunks = [header] + [SECTION_CLASS + generate_section(sections[section]["commands"], is_async=is_async)
+                         for section in names[1:]]
 
     parsed = True
     try:
-        result = ast.parse(source, filename=write_file)
+        formatted = [format_code(chunk, name=f"{write_file} ({name})") for name, chunk in zip(names, chunks)]
     except SyntaxError as err:
         print("The resulting file has syntax errors. Look at the error line for clues.")
         print("Error:", err)
@@ -249,19 +292,402 @@ def generate_lbryd_wrapper(url=LBRY_API_RAW_JSON_URL,
         print("The problem is usually in the input JSON file; it may contain badly formatted fields.")
         print("Input:", inpt)
         print()
-        parsed = False
+        formatted, parsed = [None], False
 
-    if parsed:
-        try:
-            from yapf.yapflib.yapf_api import FormatFile
-            FormatFile(write_file, in_place=True)
-        except ImportError:
-            print()
-            print("[Warning]: 'yapf' could not be imported, so the generated code will not be formatted")
+    if None not in formatted:
+        chunks = formatted
+    source = chunks[0] + "".join(chunk[len(SECTION_CLASS):] for chunk in chunks[1:])
+
+    with open(write_file, 'w') as lbry_file:
+        lbry_file.write("\n".join(docstring))
+        lbry_file.write(source)
+
+    if is_async:
+        print("Generated asynchronous 'lbrynet' API wrapper:", write_file)
+    else:
+        print("Generated 'lbrynet' API wrapper:", write_file)
+
+    if not parsed:
+        return True
+
+    if None in formatted:
+        print()
+        print("[Warning]: 'yapf' could not be imported, so the generated code will not be formatted")
+
+    return None
+
+
+def generate_section(commands, is_async=False):
+    """Generates the methods of the commands of a section of the API.
+
+    :param list commands: dicts of the JSON-Formatted functions of the section
+    :param bool is_async: Whether to generate coroutine methods for the asynchronous wrapper
+    :return: A String containing the definitions of the methods
+    :rtype: str
+    """
+    definitions = []
+    for command in commands:
+        definitions.append(generate_method_definition(command, is_async=is_async))
+
+        if is_paginated(command):
+            definitions.append(generate_iterator_definition(command))
+
+    return "".join(definitions)
+
+
+def format_code(code, name="<generated>", style_dir=PKG_DIR, cache_dir=GENERATOR_CACHE_DIR):
+    """Checks the syntax of generated code, and formats it with yapf.
+
+    The formatted code is kept in the cache, and reused by the next builds
+    when they format the same code.
+
+    :param str code: The generated code
+    :param str name: Name of the code, in the syntax errors
+    :param str style_dir: The yapf style is looked up from this directory, like for the files in it
+    :param str cache_dir: Directory where the formatted code is kept
+    :return: The formatted code, or None if 'yapf' could not be imported
+    :rtype: str
+    :raises SyntaxError: If the code is not valid
+    """
+    try:
+        from yapf import __version__ as yapf_version
+        from yapf.yapflib.file_resources import GetDefaultStyleForDir
+        from yapf.yapflib.yapf_api import FormatCode
+    except ImportError:
+        ast.parse(code, filename=name)
+        return None
+
+    style = GetDefaultStyleForDir(os.path.abspath(style_dir))
+    key = hashlib.sha256("\0".join([yapf_version, str(style), code]).encode()).hexdigest()
+    path = os.path.join(cache_dir, "formatted", key + ".py")
+    try:
+        with open(path, "r") as cache_file:
+            return cache_file.read()
+    except FileNotFoundError:
+        pass
+
+    ast.parse(code, filename=name)
+    formatted, _ = FormatCode(code, style_config=style)
+
+    # Written under another name first, so that a concurrent build never reads part of it
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + f".{os.getpid()}", "w") as cache_file:
+        cache_file.write(formatted)
+    os.replace(path + f".{os.getpid()}", path)
+
+    return formatted
+
+
+def add_call_plans(header, sections):
+    """Defines the `PLANS` of the commands in the template of a wrapper, before its class.
+
+    :param str header: The template of the wrapper
+    :param dict sections: The sections of the commands; without any,
+     the plans are added by the lazy wrappers when their methods are created
+    :return: The template with the plans
+    :rtype: str
+    """
+    plans = []
+    for section in sections.values():
+        for command in section["commands"]:
+            # In the order of the arguments of the methods, the required ones first
+            names = ([param["name"] for param in command["arguments"] if param["is_required"]]
+                     + [param["name"] for param in command["arguments"] if not param["is_required"]])
+            plans.append(f"    '{command['name']}': {tuple(names)!r},\n")
+
+    definition = ("# The parameters of each command, in the order of the arguments of its method\n"
+                  "PLANS = CallPlans(" + ("{\n" + "".join(plans) + "}" if plans else "") + ")\n\n\n")
+
+    header, found = re.subn(r"^class \w+\(", lambda match: definition + match.group(0),
+                            header, count=1, flags=re.MULTILINE)
+    if not found:
+        raise ValueError("The template does not define the class of the wrapper")
+    return header
+
+
+def make_lazy_header(header, is_async=False):
+    """Turns the template of a wrapper into a wrapper whose methods are created on first access.
+
+    The class of the template is given the `LazyApiMeta` metaclass,
+    and the name of the module with the specification of the commands,
+    which is only imported when a method is first accessed.
+
+    :param str header: The template of the wrapper, which ends inside its class
+    :param bool is_async: Whether the methods are coroutines
+    :return: The source of the lazy wrapper
+    :rtype: str
+    """
+    header, found = re.subn(r"^class (\w+)\((\w+)\):$", r"class \1(\2, metaclass=LazyApiMeta):",
+                            header, count=1, flags=re.MULTILINE)
+    if not found:
+        raise ValueError("The template does not define the class of the wrapper")
+
+    imports = ["from pybry.lazy import LazyApiMeta",
+               ""]
+    attributes = ["    # The methods of the commands are created when they are first accessed",
+                  "    _commands = 'pybry.lbryd_commands'",
+                  f"    _is_async = {is_async}",
+                  ""]
+
+    return "\n".join(imports) + header + "\n".join(attributes)
+
+
+def generate_lbryd_commands(url=LBRY_API_RAW_JSON_URL,
+                            doc=None,
+                            write_file=LBRYD_COMMANDS_FPATH):
+    """Generates the compact specification of the commands, used by the lazy wrappers.
+
+    It contains the description of each command, the name, whether it is required,
+    the type and the description of each of its arguments, and whether it is paginated.
+
+    :param str url: URL to the documentation we need to obtain,
+     pybry.constants.LBRY_API_RAW_JSON_URL by default
+    :param str write_file: Path from project root to the file we'll be writing to.
+    """
+    print(80 * "-")
+
+    if doc:
+        sections = get_lbry_api_function_docs(doc=doc)
+        inpt = doc
+    else:
+        sections = get_lbry_api_function_docs(url=url)
+        inpt = url
+
+    if not sections:
+        print("Empty information; commands module not written.")
+        return True
+
+    print("Input JSON:", inpt)
+
+    lines = ['"""',
+             'Compact specification of the commands of the LBRY daemon API.',
+             '',
+             'This file was generated at build time using the `generator` module.',
+             f'Input JSON: {inpt}',
+             '"""',
+             '',
+             '# Description, arguments, and whether it is paginated, of each command',
+             'COMMANDS = {']
+
+    for section in sections:
+        for command in sections[section]["commands"]:
+            params = ([param for param in command["arguments"] if param["is_required"]]
+                      + [param for param in command["arguments"] if not param["is_required"]])
+            arguments = tuple((param["name"], param["is_required"], DTYPE_MAPPING[param["type"].lower()],
+                               param["description"]) for param in params)
+            lines.append(f'    {command["name"]!r}: {(command["description"], arguments, is_paginated(command))!r},')
+
+    lines += ['}', '']
+
+    with open(write_file, "w") as commands_file:
+        commands_file.write("\n".join(lines))
 
+    print("Generated 'lbrynet' API commands:", write_file)
+
+
+def generate_lbryd_spec(url=LBRY_API_RAW_JSON_URL,
+                        doc=None,
+                        write_file=LBRYD_SPEC_FPATH):
+    """Generates the module that describes the commands of the lbrynet daemon.
+
+    It contains the section of each command, and the sets of
+    read-only and paginated commands, which are used by the wrappers
+    for caching, retrying and iterating.
+
+    :param str url: URL to the documentation we need to obtain,
+     pybry.constants.LBRY_API_RAW_JSON_URL by default
+    :param str write_file: Path from project root to the file we'll be writing to.
+    """
+    print(80 * "-")
+
+    if doc:
+        sections = get_lbry_api_function_docs(doc=doc)
+        inpt = doc
+    else:
+        sections = get_lbry_api_function_docs(url=url)
+        inpt = url
+
+    if not sections:
+        print("Empty information; specification module not written.")
+        return True
+
+    print("Input JSON:", inpt)
+
+    commands = [command for section in sections for command in sections[section]["commands"]]
+    section_of = ["    '" + command["name"] + "': '" + section + "',"
+                  for section in sections for command in sections[section]["commands"]]
+
+    lines = ['"""',
+             'Specification of the commands of the LBRY daemon API.',
+             '',
+             'This file was generated at build time using the `generator` module.',
+             f'Input JSON: {inpt}',
+             '"""',
+             '',
+             '# Section of the API documentation in which each command is described',
+             'SECTIONS = {']
+    lines += section_of
+    lines += ['}',
+              '',
+              '# Commands that only read information, and do not change the state of the daemon',
+              'READ_ONLY = frozenset([']
+    lines += ["    '" + command["name"] + "'," for command in commands if is_read_only(command)]
+    lines += ['])',
+              '',
+              '# Commands that return their results in pages',
+              'PAGINATED = frozenset([']
+    lines += ["    '" + command["name"] + "'," for command in commands if is_paginated(command)]
+    lines += ['])', '']
+
+    with open(write_file, "w") as spec_file:
+        spec_file.write("\n".join(lines))
+
+    print("Generated 'lbrynet' API specification:", write_file)
+
+
+def parse_returns(func):
+    """Return the shape of the result of the given function, if it is documented as JSON.
+
+    :param dict func: dict of a JSON-Formatted function as defined by the API docs
+    :return: The example result, whose values are the descriptions of the fields, or None
+    """
+    try:
+        return json.loads(func["returns"])
+    except ValueError:
+        return None
+
+
+def find_model(shape):
+    """Return the name of the model of a documented result, or None.
+
+    :param shape: The example result from the API documentation
+    :rtype: str
+    """
+    if isinstance(shape, dict):
+        for name, (field, _) in RESULT_MODELS.items():
+            if field in shape:
+                return name
     return None
 
 
+def collect_model(shape, fields, nested):
+    """Add the fields of a documented result, and of the results nested in it, to its model.
+
+    :param dict shape: The example result from the API documentation
+    :param dict fields: Fields of each model, with their descriptions
+    :param dict nested: Nested models of the fields of each model
+    :return: The name of the model of the result
+    :rtype: str
+    """
+    name = find_model(shape)
+    if name is None:
+        return None
+
+    model_fields = fields.setdefault(name, {})
+    for key, value in shape.items():
+        if not key.isidentifier() or keyword.iskeyword(key) or key == "extra":
+            continue
+
+        if isinstance(value, list) and value and isinstance(value[0], dict):
+            item_model = collect_model(value[0], fields, nested)
+            if item_model:
+                nested.setdefault(name, {})[key] = item_model
+                value = f"list of `{item_model}`"
+
+        model_fields.setdefault(key, value if isinstance(value, str) else "")
+
+    return name
+
+
+def generate_models(url=LBRY_API_RAW_JSON_URL,
+                    doc=None,
+                    write_file=MODELS_FPATH):
+    """Generates the module with the compact models of the results of the lbrynet daemon.
+
+    The models are created from the results that are documented as JSON,
+    and they are described in `pybry.constants.RESULT_MODELS`.
+
+    :param str url: URL to the documentation we need to obtain,
+     pybry.constants.LBRY_API_RAW_JSON_URL by default
+    :param str write_file: Path from project root to the file we'll be writing to.
+    """
+    print(80 * "-")
+
+    if doc:
+        sections = get_lbry_api_function_docs(doc=doc)
+        inpt = doc
+    else:
+        sections = get_lbry_api_function_docs(url=url)
+        inpt = url
+
+    if not sections:
+        print("Empty information; models module not written.")
+        return True
+
+    print("Input JSON:", inpt)
+
+    fields, nested, results = {}, {}, {}
+    for section in sections:
+        for command in sections[section]["commands"]:
+            shape = parse_returns(command)
+
+            if isinstance(shape, dict) and isinstance(shape.get("items"), list) and shape["items"]:
+                name, paginated = collect_model(shape["items"][0], fields, nested), True
+            else:
+                name, paginated = collect_model(shape, fields, nested), False
+
+            if name:
+                results[command["name"]] = (name, paginated)
+
+    for name, models in NESTED_MODELS.items():
+        if name in fields:
+            nested.setdefault(name, {}).update(models)
+
+    lines = ['"""',
+             'Compact models of the results of the LBRY daemon API.',
+             '',
+             'This file was generated at build time using the `generator` module.',
+             f'Input JSON: {inpt}',
+             '"""',
+             'from pybry.model import Model',
+             '']
+
+    for name in RESULT_MODELS:
+        if name not in fields:
+            continue
+
+        lines += ['',
+                  f'class {name}(Model):',
+                  f'    """{RESULT_MODELS[name][1]}',
+                  '']
+        for key, description in fields[name].items():
+            lines.append(f'    :ivar {key}: {description}'.rstrip())
+        lines += ['    """',
+                  '',
+                  '    __slots__ = (']
+        lines += [f'        {key!r},' for key in fields[name]]
+        lines += ['    )',
+                  '']
+
+    lines += ['']
+    for name, models in nested.items():
+        lines.append(f'{name}._nested = {{')
+        lines += [f'    {key!r}: {model},' for key, model in models.items()]
+        lines.append('}')
+
+    lines += ['',
+              '# Model of the result of each command, and whether it is',
+              '# the model of the items of the pages of results',
+              'RESULT_MODELS = {']
+    lines += [f'    {command!r}: ({name}, {paginated}),' for command, (name, paginated) in results.items()]
+    lines += ['}', '']
+
+    with open(write_file, "w") as models_file:
+        models_file.write("\n".join(lines))
+
+    print("Generated 'lbrynet' result models:", write_file)
+
+
 def generate_lbrycrd_wrapper(read_file=LBRYCRD_BASE_FPATH,
                              write_file=LBRYCRD_FPATH):
     """Generate wrapper for the lbrycrd daemon.
@@ -303,6 +729,27 @@ def generate_basic_modules(template_dir=TEMPLATE_DIR, out_dir=PKG_DIR):
     basic_modules = ["_init.py",
                      "constants.py",
                      "base_api.py",
+                     "async_base_api.py",
+                     "batch.py",
+                     "cache.py",
+                     "callplan.py",
+                     "chainscan.py",
+                     "cluster.py",
+                     "codec.py",
+                     "model.py",
+                     "fanout.py",
+                     "feed.py",
+                     "instrumentation.py",
+                     "lazy.py",
+                     "pagination.py",
+                     "projection.py",
+                     "ratelimit.py",
+                     "resilience.py",
+                     "singleflight.py",
+                     "store.py",
+                     "streaming.py",
+                     "transport.py",
+                     "txoindex.py",
                      "exception.py"]
 
     if not os.path.exists(out_dir):
@@ -326,16 +773,114 @@ def generate_basic_modules(template_dir=TEMPLATE_DIR, out_dir=PKG_DIR):
     print("\n".join(installed))
 
 
+def hash_file(path):
+    """Return the SHA-256 hash of a file, or None if it doesn't exist."""
+    try:
+        with open(path, "rb") as hashed_file:
+            return hashlib.sha256(hashed_file.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def build_fingerprint(contents, options, template_dir=TEMPLATE_DIR):
+    """Return the hash of everything the generated package depends on.
+
+    :param bytes contents: The contents of the API documentation
+    :param dict options: The options of the build
+    :param str template_dir: Directory of the templates
+    :rtype: str
+    """
+    try:
+        from yapf import __version__ as yapf_version
+    except ImportError:
+        yapf_version = None
+
+    inputs = [os.path.abspath(__file__)] + sorted(os.path.join(template_dir, name)
+                                                  for name in os.listdir(template_dir)
+                                                  if name.endswith(".py"))
+    digest = hashlib.sha256(json.dumps([options, yapf_version, [os.path.basename(path) for path in inputs]],
+                                       sort_keys=True).encode())
+    digest.update(contents)
+    for path in inputs:
+        digest.update(hash_file(path).encode())
+
+    return digest.hexdigest()
+
+
+def is_up_to_date(fingerprint, record_file=BUILD_RECORD_FPATH):
+    """Whether the last build had the same inputs, and its files were not changed since.
+
+    :param str fingerprint: The hash of the inputs of this build
+    :param str record_file: Path of the record of the last build
+    :rtype: bool
+    """
+    try:
+        with open(record_file, "r") as record:
+            last_build = json.load(record)
+    except (FileNotFoundError, ValueError):
+        return False
+
+    return (last_build.get("fingerprint") == fingerprint
+            and all(hash_file(path) == digest for path, digest in last_build["files"].items()))
+
+
+def record_build(fingerprint, out_dir=PKG_DIR, record_file=BUILD_RECORD_FPATH):
+    """Write the record of a build: the hash of its inputs, and of the files it generated."""
+    files = {os.path.join(out_dir, name): hash_file(os.path.join(out_dir, name))
+             for name in sorted(os.listdir(out_dir)) if name.endswith(".py")}
+
+    os.makedirs(os.path.dirname(record_file), exist_ok=True)
+    with open(record_file, "w") as record:
+        json.dump({"fingerprint": fingerprint, "files": files}, record, indent=1)
+
+
 def main(argv=None):
+    # With `--lazy`, the methods of the lbrynet wrappers are created on first access,
+    # and with `--force`, the package is generated even if its inputs didn't change
+    lazy = force = False
     if argv and isinstance(argv, (list, tuple)):
+        lazy, force = "--lazy" in argv, "--force" in argv
+        argv = [arg for arg in argv if arg not in ("--lazy", "--force")]
         doc = argv[1] if len(argv) > 1 else None
     else:
         doc = None
+
+    try:
+        if doc:
+            with open(doc, "rb") as api_file:
+                contents = api_file.read()
+        else:
+            contents = download_api_doc()
+        fingerprint = build_fingerprint(contents, {"doc": doc, "lazy": lazy})
+    except (urllib.error.URLError, OSError):
+        # The error is reported when the documentation is read again below
+        fingerprint = None
+
+    if fingerprint and not force and is_up_to_date(fingerprint):
+        print("The package is up to date; its inputs didn't change since the last build:", PKG_DIR)
+        return None
+
     generate_basic_modules()
     generate_lbrycrd_wrapper()
-    generate_lbryd_wrapper(doc=doc)
+    generate_lbrycrd_wrapper(read_file=ASYNC_LBRYCRD_BASE_FPATH,
+                             write_file=ASYNC_LBRYCRD_FPATH)
+    failed = [generate_lbryd_wrapper(doc=doc, lazy=lazy),
+              generate_lbryd_wrapper(doc=doc,
+                                     read_file=ASYNC_LBRYD_BASE_FPATH,
+                                     write_file=ASYNC_LBRYD_FPATH,
+                                     is_async=True,
+                                     lazy=lazy)]
+    if lazy:
+        failed.append(generate_lbryd_commands(doc=doc))
+    elif os.path.exists(LBRYD_COMMANDS_FPATH):
+        # Left over from a lazy build
+        os.remove(LBRYD_COMMANDS_FPATH)
+    failed.append(generate_lbryd_spec(doc=doc))
+    failed.append(generate_models(doc=doc))
+
+    if fingerprint and not any(failed):
+        record_build(fingerprint)
 
 
 if __name__ == "__main__":
     sys.exit(main(sys.argv))
-
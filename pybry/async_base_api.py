@@ -0,0 +1,565 @@
+"""Asynchronous counterpart of `BaseApi`, built on `aiohttp`.
+
+The requests are sent from the running event loop instead of blocking it,
+so a single thread can keep hundreds of calls to the daemons in flight,
+for example with `asyncio.gather`.
+All the calls of an instance share one `aiohttp.ClientSession`
+and therefore one connection pool.
+
+`aiohttp` is an optional dependency; it is only needed
+when the asynchronous wrappers are used.
+"""
+import asyncio
+import functools
+import time
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+import pybry.exception as lbryex
+from pybry.base_api import BaseApi, ResponseMeta, RESULT_MODES, headers_size
+from pybry.batch import AsyncBatch, match_batch_results
+from pybry.cache import request_key
+from pybry.callplan import HEADERS, encode_call
+from pybry.codec import get_codec
+from pybry.fanout import afan_out, chunked
+from pybry.instrumentation import CallInfo
+from pybry.pagination import aiter_pages
+from pybry.projection import AsyncProjectedPage, aiter_projected_pages, as_projection
+from pybry.resilience import Attempts, CircuitBreaker, RetryPolicy, TRANSIENT_STATUSES
+from pybry.singleflight import AsyncSingleFlight
+
+
+def _status(response):
+    """HTTP status code of an `aiohttp.ClientResponse`, or of its `ResponseMeta`."""
+    return response.status_code if isinstance(response, ResponseMeta) else response.status
+
+
+# Approximate memory kept by an `aiohttp.ClientResponse` besides the contents
+# of its body and headers: the objects of the response and of its request info
+_RESPONSE_OVERHEAD = 4 * 1024
+
+
+def _size(response):
+    """Memory kept by a cached `aiohttp.ClientResponse`, with its headers,
+    or the size of the body of its `ResponseMeta`."""
+    if isinstance(response, ResponseMeta):
+        return response.size
+    return (_RESPONSE_OVERHEAD + (response.content_length or 0) + headers_size(response.headers)
+            + len(str(response.url)))
+
+
+class AsyncBaseApi:
+
+    # What the calls return besides their result, one of `RESULT_MODES`.
+    # Set it on the class to change the default of every instance.
+    result_mode = "response"
+
+    # Method called by the health checks of a cluster given to the wrapper
+    health_method = "status"
+
+    def __init__(self, timeout=600, pool_maxsize=100, keep_alive=True, session=None, cache=None,
+                 coalesce=False, codec=None, raw=False, result_mode=None,
+                 models=False, hooks=None, retry=None, circuit_breaker=None,
+                 deadline=None, cluster=None, rate_limiter=None, store=None, decode_pool=None):
+        """Initialize the connection pool shared by all the calls of this instance.
+
+        :param float timeout: Amount of seconds to wait for the server's response before we timeout.
+        :param int pool_maxsize: Maximum number of simultaneous connections; 0 means no limit.
+        :param bool keep_alive: Whether to keep connections open between calls.
+        :param aiohttp.ClientSession session: Existing session to use instead of creating one.
+         It will not be closed by `close()`.
+        :param pybry.cache.ResponseCache cache: Cache for the results of read-only commands;
+         it may be shared by several instances. Nothing is cached by default.
+         In the "response" result mode, the hits return the cached `aiohttp.ClientResponse`,
+         whose headers are counted in the size of the cache.
+        :param bool | pybry.singleflight.AsyncSingleFlight coalesce: Whether identical calls
+         made at the same time share a single request; an `AsyncSingleFlight` object
+         may be given to choose the methods, or to share it between instances.
+        :param str codec: JSON codec used to encode the requests and decode the responses,
+         `orjson`, `ujson` or `json`, or an object with `dumps` and `loads` methods;
+         the fastest one installed by default.
+        :param bool raw: Whether calls return the undecoded body of the response,
+         as `bytes`, instead of its result.
+        :param str result_mode: What the calls return: "response" for the result
+         and the `aiohttp.ClientResponse`, "meta" for the result and a `ResponseMeta`,
+         or "result" for the result alone; `AsyncBaseApi.result_mode` by default.
+        :param bool models: Whether the results of the commands described in `pybry.models`
+         are returned as compact models, or their pages as lists of models.
+        :param list hooks: Objects with the methods of `pybry.instrumentation.Hook`,
+         called around every request, such as a `MetricsCollector`.
+        :param bool | pybry.resilience.RetryPolicy retry: Whether the read-only commands
+         are retried after connection errors, timeouts and gateway errors;
+         a `RetryPolicy` may be given to choose how.
+        :param bool | pybry.resilience.CircuitBreaker circuit_breaker: Whether calls fail
+         immediately while the daemon keeps failing; a `CircuitBreaker` may be given
+         to configure it, or to share it between instances.
+        :param float deadline: Maximum number of seconds of a call, retries included.
+         With any of these three options, a call that cannot reach the daemon
+         raises `DaemonUnavailableError` instead of returning None.
+        :param pybry.cluster.Cluster cluster: Daemons to send the calls to,
+         instead of the URL given to each call.
+        :param pybry.ratelimit.RateLimiter rate_limiter: Rate limits and concurrency caps
+         of the methods; it may be shared by several instances, also synchronous ones.
+        :param pybry.store.PersistentStore store: On-disk store of the results that never change,
+         like transactions by their ID, which may be shared by several processes.
+         It is only used in the "meta" and "result" modes. Nothing is stored by default.
+        :param concurrent.futures.Executor decode_pool: Pool decoding the items of the pages
+         projected on some `fields`, such as a `ProcessPoolExecutor` for pages of several megabytes;
+         they are decoded in the event loop by default.
+        """
+        if aiohttp is None:
+            raise ImportError("'aiohttp' is required to use the asynchronous API wrappers")
+
+        self.timeout = timeout
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.cache = cache
+        self.single_flight = AsyncSingleFlight() if coalesce is True else (coalesce or None)
+        self.codec = get_codec(codec)
+        self.raw = raw
+        self.models = models
+        self.hooks = tuple(hooks or ())
+        self.retry = RetryPolicy() if retry is True else (retry or None)
+        self.circuit_breaker = (CircuitBreaker() if circuit_breaker is True
+                                else circuit_breaker or None)
+        self.deadline = deadline
+        self.cluster = cluster
+        if cluster is not None:
+            cluster.attach(self.health_method, getattr(self, "basic_auth", None))
+        self.rate_limiter = rate_limiter
+        self.store = store
+        self.decode_pool = decode_pool
+
+        if result_mode is not None:
+            if result_mode not in RESULT_MODES:
+                raise ValueError(f"The result mode must be one of {RESULT_MODES}")
+            self.result_mode = result_mode
+
+        self._session = session
+        self._owns_session = session is None
+        self._session_lock = asyncio.Lock()
+
+    async def get_session(self):
+        """Return the `aiohttp.ClientSession` of this instance, creating it on first use."""
+        if self._session is None:
+            async with self._session_lock:
+                if self._session is None:
+                    connector = aiohttp.TCPConnector(limit=self.pool_maxsize,
+                                                     force_close=not self.keep_alive)
+                    self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self):
+        """Close the pooled connections. A new pool is created if the instance is used again."""
+        session, self._session = self._session, None
+        if session is not None and self._owns_session:
+            await session.close()
+        self._owns_session = True
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _post(self, url, data, basic_auth, timeout, raw=False, info=None, stream=False):
+        """Send `data` encoded as JSON and return the response with its decoded, or raw, body.
+
+        With `stream`, the response is returned as it is before its body is read, with the permit
+        of the rate limiter, or None, to give to `RateLimiter.release` once the body is read.
+
+        The response is returned as it is, or as a `ResponseMeta`, depending on the result mode.
+        If the request is instrumented, `info` is the `CallInfo` describing it.
+        With a rate limiter, the request waits until the limits of its methods allow it.
+        With a cluster, each attempt is sent to the daemon chosen by the cluster.
+        With a retry policy, a circuit breaker or a deadline, the failed attempts
+        are retried as they allow, and `DaemonUnavailableError` is raised
+        when the request cannot succeed.
+        """
+        # Send the request as JSON, and with the specified user-agent
+        headers = HEADERS
+
+        auth = aiohttp.BasicAuth(*basic_auth) if basic_auth else None
+        session = await self.get_session()
+
+        payload = encode_call(data, self.codec)
+        if info is not None:
+            info.sending(len(payload))
+
+        cluster = self.cluster
+        methods = [call["method"] for call in data] if isinstance(data, list) else [data["method"]]
+
+        # Wait until the rate limits of the methods allow the request
+        permit = None
+        if self.rate_limiter is not None:
+            permit = await self.rate_limiter.acquire_async(data)
+
+        attempts = None
+        if self.retry is not None or self.circuit_breaker is not None or self.deadline is not None:
+            attempts = Attempts(methods, timeout, self.retry, self.circuit_breaker, self.deadline)
+
+        start = time.perf_counter()
+        try:
+            while True:
+                total = attempts.next_timeout() if attempts is not None else timeout
+
+                node = None
+                if cluster is not None:
+                    node = cluster.acquire(methods)
+                    url = node.url
+
+                attempt_start = time.perf_counter()
+                try:
+                    response = await session.post(url, data=payload, headers=headers, auth=auth,
+                                                  timeout=aiohttp.ClientTimeout(total=total))
+                    if not stream:
+                        async with response:
+                            body = await response.read()
+
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as err:
+                    if node is not None:
+                        cluster.release(node, failed=True)
+                    if attempts is None:
+                        raise
+                    await asyncio.sleep(attempts.failed(err))
+                    continue
+
+                except BaseException:
+                    # Such as the cancellation of the task
+                    if node is not None:
+                        cluster.release(node)
+                    raise
+
+                transient = (attempts.is_transient(response.status) if attempts is not None
+                             else response.status in TRANSIENT_STATUSES)
+                if node is not None:
+                    cluster.release(node, time.perf_counter() - attempt_start, failed=transient)
+
+                if attempts is not None:
+                    if transient:
+                        response.release()
+                        await asyncio.sleep(attempts.failed_status(response.status))
+                        continue
+                    attempts.succeeded()
+                break
+        except BaseException:
+            if permit is not None:
+                self.rate_limiter.release(permit)
+            raise
+
+        if stream:
+            return response, permit
+        if permit is not None:
+            self.rate_limiter.release(permit)
+
+        if info is not None:
+            info.received(response.status, len(body))
+
+        if self.result_mode != "response":
+            request_id = [call["id"] for call in data] if isinstance(data, list) else data["id"]
+            response = ResponseMeta(response.status, time.perf_counter() - start,
+                                    request_id, len(body))
+
+        return response, body if raw else self.codec.loads(body)
+
+    async def make_request(self, url, method, params=None, basic_auth=None, timeout=600, raw=None,
+                           fields=None):
+        """Makes a POST request to the given URL without blocking the event loop.
+
+        The request and the returned values are the same as in `BaseApi.make_request`.
+
+        :param str url: URL to connect to.
+        :param str method: The API method to call.
+        :param dict params: Dictionary object of the parameters associated with the `method` given. None by default.
+        :param list | tuple basic_auth: List containing your username and password as ['username', 'password'].
+         This is empty by default, however it is required by all of the `lbrycrd` methods
+        :param float timeout: Amount of seconds to wait for the server's response before we timeout.
+        :param bool raw: Whether to return the undecoded body of the response;
+         the `raw` mode of the instance by default.
+        :param list fields: Paths of the fields of the items to return, such as "value.title";
+         the `AsyncProjectedPage` of `project` is then returned.
+        :raises LBRYException: If the request returns an error when calling the API
+        :return: A `dict` of the JSON result member of the request, or the `bytes` of the body in raw mode
+        :rtype: dict, aiohttp.ClientResponse
+        """
+        if fields is not None:
+            return await self.project(url, method, params, fields, basic_auth, timeout)
+
+        value = await self._make_request(url, method, params, basic_auth, timeout, raw)
+
+        if value is None:
+            return value
+
+        if self.models and not (raw or (raw is None and self.raw)):
+            value = self._with_models(method, value[0]), value[1]
+
+        if self.result_mode == "result":
+            return value[0]
+
+        return value
+
+    _with_models = staticmethod(BaseApi._with_models)
+
+    async def _make_request(self, url, method, params, basic_auth, timeout, raw=None):
+        """Make a call, and return its result together with the response or its `ResponseMeta`."""
+        params = BaseApi._clean_params(params)
+
+        if raw or (raw is None and self.raw):
+            return await self._send_request(url, method, params, basic_auth, timeout, raw=True)
+
+        cache, flight, store = self.cache, self.single_flight, self.store
+        if self.result_mode == "response":
+            # The stored results have no response to return with them
+            store = None
+        if cache is None and flight is None and store is None:
+            return await self._send_request(url, method, params, basic_auth, timeout)
+
+        stored = store is not None and store.is_stored(method, params)
+        if cache is not None and not cache.is_cacheable(method):
+            if not stored:
+                try:
+                    return await self._send_request(url, method, params, basic_auth, timeout)
+                finally:
+                    cache.invalidate(method)
+            cache = None
+
+        key = request_key(url, method, params)
+        if cache is not None:
+            value = cache.get(key)
+            if value is not None:
+                return value
+
+        if stored:
+            value = store.get(method, params)
+            if value is not None:
+                value = value[0], ResponseMeta(200, 0.0, None, value[1])
+                if cache is not None:
+                    cache.put(key, value, value[1].size)
+                return value
+
+        async def send():
+            value = await self._send_request(url, method, params, basic_auth, timeout)
+
+            response = value[1]
+            if cache is not None and response is not None:
+                cache.put(key, value, _size(response))
+            if stored and response is not None:
+                store.put(method, params, value[0])
+
+            return value
+
+        if flight is not None and flight.is_coalesced(method):
+            return await flight.do(key, send)
+
+        return await send()
+
+    async def _send_request(self, url, method, params, basic_auth, timeout, raw=False):
+        """Send a single call and return its result, or the raw body, and the response."""
+        # This is the data to be sent
+        data = {"method": method,
+                "params": params,
+                "jsonrpc": "2.0",
+                "id": BaseApi._next_request_id()}
+
+        info = None
+        if self.hooks:
+            info = CallInfo(self.hooks, url, method, data["id"])
+
+        try:
+            response, response_json = await self._post(url, data, basic_auth, timeout, raw, info)
+
+            if raw:
+                if info is not None:
+                    info.succeeded()
+                return response_json, response
+
+            # Returns the Result sub-JSON formatted as a dict
+            if 'result' in response_json:
+                if info is not None:
+                    info.succeeded()
+                return response_json['result'], response
+
+            elif 'error' in response_json:
+                error = lbryex.LBRYError("POST Request made to LBRY received an error",
+                                         response_json,
+                                         _status(response),
+                                         getattr(response, "request_info", None))
+                if info is not None:
+                    info.failed(error)
+                raise error
+
+        except lbryex.DaemonUnavailableError as err:
+            if info is not None:
+                info.failed(err)
+            raise
+
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as err:
+            if info is not None:
+                info.failed(err)
+            print(err)
+            print("Request:", url, data)
+
+            return None, None
+
+    async def project(self, url, method, params, fields, basic_auth=None, timeout=600):
+        """Make a call, and return the items of its result projected on `fields`, as they are received.
+
+        The arguments are the same as in `BaseApi.project`.
+        >>> page = await lbry.project(url, "txo_list", {"page_size": 5000}, ["txid", "nout", "amount"])
+        >>> async for txo in page:
+        ...     print(txo["amount"])
+
+        :raises LBRYException: If the call cannot be made, or, while reading the items,
+         if the response is interrupted or the daemon returned an error
+        :rtype: pybry.projection.AsyncProjectedPage
+        """
+        projection = as_projection(fields)
+        data = {"method": method,
+                "params": BaseApi._clean_params(params),
+                "jsonrpc": "2.0",
+                "id": BaseApi._next_request_id()}
+
+        info = None
+        if self.hooks:
+            info = CallInfo(self.hooks, url, method, data["id"])
+
+        try:
+            response, permit = await self._post(url, data, basic_auth, timeout, info=info, stream=True)
+        except lbryex.DaemonUnavailableError as err:
+            if info is not None:
+                info.failed(err)
+            raise
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            if info is not None:
+                info.failed(err)
+            raise lbryex.LBRYError(f"'{method}' could not be requested", None, None, None) from err
+
+        # The permit of the rate limiter is held until the items are read
+        on_close = functools.partial(self.rate_limiter.release, permit) if permit is not None else None
+        return AsyncProjectedPage(response, projection, self.codec, method, response.request_info,
+                                  self.decode_pool, info, on_close)
+
+    def iter_pages(self, url, method, params=None, basic_auth=None, timeout=600, prefetch=True,
+                   fields=None):
+        """Asynchronously yield the items of every page of a paginated method.
+
+        The arguments are the same as in `BaseApi.iter_pages`.
+        >>> async for item in lbry.iter_pages(url, "txo_list", {"page_size": 50}):
+        ...     print(item["txid"])
+
+        :raises LBRYException: If a page returns an error, or cannot be requested
+        :return: Asynchronous generator of the items of all the pages
+        """
+        params = BaseApi._clean_params(params)
+        first_page = params.pop("page", 1)
+
+        if fields is not None:
+            projection = as_projection(fields)
+            return aiter_projected_pages(lambda page: self.project(url, method, dict(params, page=page),
+                                                                   projection, basic_auth, timeout),
+                                         first_page)
+
+        async def fetch_page(page):
+            result, response = await self._make_request(url, method, dict(params, page=page),
+                                                        basic_auth, timeout, raw=False)
+            if response is None:
+                raise lbryex.LBRYError(f"Page {page} of '{method}' could not be requested",
+                                       None, None, None)
+            return self._with_models(method, result) if self.models else result
+
+        return aiter_pages(fetch_page, first_page, prefetch)
+
+    def fan_out(self, func, kwargs_list, max_workers=8, max_pending=None, return_exceptions=False):
+        """Await an API method once for each set of keyword arguments, concurrently.
+
+        The arguments are the same as in `BaseApi.fan_out`; at most `max_workers`
+        calls are in flight at the same time.
+        >>> async for result, response in lbry.fan_out(lbry.claim_search, params, max_workers=100):
+        ...     print(result["total_items"])
+
+        :return: Asynchronous generator of the value returned by each call
+        """
+        return afan_out(lambda kwargs: func(**kwargs), kwargs_list,
+                        max_workers, max_pending, return_exceptions)
+
+    def fan_out_chunks(self, func, argument, values, chunk_size=50, max_workers=8,
+                       max_pending=None, return_exceptions=False, **kwargs):
+        """Split a multi-valued argument into chunks, and make one concurrent call per chunk.
+
+        The arguments are the same as in `BaseApi.fan_out_chunks`.
+
+        :return: Asynchronous generator of the value returned by the call of each chunk
+        """
+        kwargs_list = (dict(kwargs, **{argument: chunk}) for chunk in chunked(values, chunk_size))
+        return self.fan_out(func, kwargs_list, max_workers, max_pending, return_exceptions)
+
+    async def make_batch_request(self, url, calls, basic_auth=None, timeout=600):
+        """Makes a single POST request containing a JSON-RPC 2.0 batch of several calls.
+
+        The request and the returned values are the same as in `BaseApi.make_batch_request`.
+
+        :param str url: URL to connect to.
+        :param list calls: Sequence of `(method, params)` pairs to send.
+        :param list | tuple basic_auth: List containing your username and password as ['username', 'password'].
+        :param float timeout: Amount of seconds to wait for the server's response before we timeout.
+        :raises LBRYException: If the whole batch is rejected by the server
+        :return: The list of results, or `LBRYError` objects, and the response,
+         depending on the result mode of the instance
+        :rtype: list, aiohttp.ClientResponse
+        """
+        value = await self._make_batch_request(url, calls, basic_auth, timeout)
+
+        if self.result_mode == "result":
+            return value[0]
+
+        return value
+
+    async def _make_batch_request(self, url, calls, basic_auth, timeout):
+        """Send a batch, and return its results together with the response or its `ResponseMeta`."""
+        data = [{"method": method,
+                 "params": BaseApi._clean_params(params),
+                 "jsonrpc": "2.0",
+                 "id": BaseApi._next_request_id()} for method, params in calls]
+
+        if not data:
+            return [], None
+
+        info = None
+        if self.hooks:
+            info = CallInfo(self.hooks, url, "batch", [item["id"] for item in data],
+                            [item["method"] for item in data])
+
+        try:
+            response, response_json = await self._post(url, data, basic_auth, timeout, info=info)
+            results = match_batch_results(data, response_json, _status(response),
+                                          getattr(response, "request_info", None))
+
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError, lbryex.LBRYError) as err:
+            if info is not None:
+                info.failed(err)
+            if isinstance(err, lbryex.LBRYError):
+                raise
+
+            print(err)
+            print("Request:", url, data)
+
+            return None, None
+
+        if info is not None:
+            info.succeeded()
+
+        return results, response
+
+    def batch(self):
+        """Return a builder that sends the calls made through it in a single batch request.
+
+        >>> async with lbry.batch() as batch:
+        ...     first = batch.resolve(urls=["@LBRYPlaylists"])
+        >>> first.result()
+
+        The subclass must implement `call_many`.
+        """
+        return AsyncBatch(self)
@@ -0,0 +1,67 @@
+"""
+LBRYCRD daemon wrapper in Python. Import it an initialize the main class.
+
+This file was generated at build time using the `generator` module.
+"""
+from pybry.constants import LBRYCRD_SERVER_ADDRESS as SERVER_ADDRESS
+from pybry.async_base_api import AsyncBaseApi
+from pybry.chainscan import AsyncChainScanner
+
+
+class AsyncLbrycrdApi(AsyncBaseApi):
+
+    health_method = "getblockcount"
+
+    def __init__(self, username, password, timeout=600, **options):
+        """
+
+        :param str username: Username for lbrycrd login
+        :param str password: Password for lbrycrd login
+        :param float timeout: Number of seconds before we give up on waiting for server to respond
+        :param options: Options passed to `AsyncBaseApi`,
+         such as `pool_maxsize`, `session` and `cache`
+        """
+        # Set first, for the health checks of a cluster given in the options
+        self.basic_auth = (username, password)
+        super().__init__(timeout=timeout, **options)
+
+    async def call(self, method, params=None, raw=None):
+        """
+
+        :param str method: Method to call from lbrycrd. To view the full list of methods, run ./lbrycrd-cli help,
+         or ./lbrycrd-cli [command_name] help for information on a specific command
+         https://lbryio.github.io/lbry/cli/
+        :param dict params: Parameters to give the method selected
+        :param bool raw: Whether to return the undecoded body of the response, as `bytes`;
+         the `raw` mode of the instance by default.
+        :raises LBRYException: If the request returns an error when calling the API
+        :return: A Python `dict` object containing the data requested from the API
+        :rtype: dict
+        """
+
+        return await self.make_request(SERVER_ADDRESS, method, params, self.basic_auth, self.timeout, raw)
+
+    async def call_many(self, calls, timeout=None):
+        """Makes several calls to lbrycrd in a single batch request.
+
+        :param list calls: Sequence of `(method, params)` pairs
+        :param float timeout: The number of seconds to wait for a connection until we time out;
+         the timeout of the instance by default.
+        :return: The result of each call, or the `LBRYError` raised by it, in the same order, and the response
+        :rtype: list, aiohttp.ClientResponse
+        """
+        timeout = self.timeout if timeout is None else timeout
+
+        return await self.make_batch_request(SERVER_ADDRESS, calls, self.basic_auth, timeout=timeout)
+
+    def scan_blocks(self, start=0, end=None, checkpoint=None, follow=False, **options):
+        """Iterate over the blocks of a range of heights, with `async for`.
+
+        The arguments are the same as in `LbrycrdApi.scan_blocks`.
+        >>> async for block in lbrycrd.scan_blocks(0, 1000, max_workers=8):
+        ...     print(block["height"])
+
+        :rtype: async_generator
+        """
+        scanner = AsyncChainScanner(self, **options)
+        return scanner.follow(start, checkpoint) if follow else scanner.scan(start, end, checkpoint)
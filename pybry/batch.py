@@ -0,0 +1,188 @@
+"""JSON-RPC 2.0 batches: several calls sent in a single HTTP request.
+
+A `Batch` collects calls and sends them all at once when it is sent,
+or when its `with` block ends. Each call returns a `BatchCall`
+whose result becomes available after the batch has been sent.
+>>> with lbry.batch() as batch:
+...     calls = [batch.resolve(urls=[url]) for url in urls]
+>>> results = [call.result() for call in calls]
+"""
+import pybry.exception as lbryex
+
+
+def match_batch_results(calls, response_json, status_code, request):
+    """Return the results of a batch response in the same order as the calls.
+
+    :param list calls: The JSON-RPC objects that were sent.
+    :param list | dict response_json: The decoded response of the server.
+    :param int status_code: HTTP Status code received from HTTP request
+    :param request: The request object that was sent
+    :raises LBRYError: If the server rejected the batch as a whole
+    :return: The result of each call, or the `LBRYError` describing why it failed
+    :rtype: list
+    """
+    if not isinstance(response_json, list):
+        raise lbryex.LBRYError("Batch request made to LBRY received an error",
+                               response_json,
+                               status_code,
+                               request)
+
+    by_id = {item.get("id"): item for item in response_json if isinstance(item, dict)}
+
+    results = []
+    for call in calls:
+        item = by_id.get(call["id"])
+
+        if item is None:
+            results.append(lbryex.LBRYError("Batch response from LBRY is missing a call",
+                                            call, status_code, request))
+        elif item.get("error") is not None:
+            results.append(lbryex.LBRYError("Call in a batch made to LBRY received an error",
+                                            item, status_code, request))
+        else:
+            results.append(item.get("result"))
+
+    return results
+
+
+class BatchCall:
+    """A call in a batch, whose result is available once the batch is sent."""
+
+    __slots__ = ("method", "params", "_result", "_done")
+
+    def __init__(self, method, params=None):
+        self.method = method
+        self.params = params
+        self._result = None
+        self._done = False
+
+    @property
+    def done(self):
+        """Whether the batch containing this call has been sent."""
+        return self._done
+
+    @property
+    def error(self):
+        """The `LBRYError` of the call if it failed, None otherwise."""
+        return self._result if isinstance(self._result, lbryex.LBRYError) else None
+
+    def set_result(self, result):
+        self._result = result
+        self._done = True
+
+    def result(self):
+        """Return the result of the call.
+
+        :raises LBRYError: If the call failed
+        :raises RuntimeError: If the batch has not been sent yet
+        """
+        if not self._done:
+            raise RuntimeError(f"The batch containing '{self.method}' has not been sent yet")
+
+        if isinstance(self._result, lbryex.LBRYError):
+            raise self._result
+
+        return self._result
+
+    def __repr__(self):
+        return f"<BatchCall {self.method} done={self._done}>"
+
+
+class Batch:
+    """Collects calls to an API and sends them in a single request.
+
+    Any API method can be queued by name with keyword arguments,
+    `batch.claim_search(name="LBRYPlaylists")`, or with `call`.
+    """
+
+    def __init__(self, api):
+        """
+        :param BaseApi api: The API whose `call_many` method sends the batch
+        """
+        self._api = api
+        self._calls = []
+
+    def call(self, method, params=None):
+        """Queue a call to `method` and return its `BatchCall`.
+
+        :param str method: The API method to call.
+        :param dict | list params: Parameters to give the method selected
+        :rtype: BatchCall
+        """
+        call = BatchCall(method, params)
+        self._calls.append(call)
+        return call
+
+    def __getattr__(self, method):
+        if method.startswith("_"):
+            raise AttributeError(method)
+
+        def queue(**params):
+            return self.call(method, params)
+
+        queue.__name__ = method
+        return queue
+
+    def __len__(self):
+        return len(self._calls)
+
+    def _take_calls(self):
+        calls, self._calls = self._calls, []
+        return calls, [(call.method, call.params) for call in calls]
+
+    @staticmethod
+    def _set_results(calls, value):
+        # The results come with the response, unless the result mode of the API is "result"
+        results = value[0] if isinstance(value, tuple) else value
+
+        if results is None:
+            error = lbryex.LBRYError("Batch request made to LBRY could not be sent", None, None, None)
+            results = [error] * len(calls)
+
+        for call, result in zip(calls, results):
+            call.set_result(result)
+
+    def send(self):
+        """Send every queued call in one request and store their results.
+
+        :return: The results, or `LBRYError` objects, in the order the calls were queued
+        :rtype: list
+        """
+        calls, pairs = self._take_calls()
+        if not calls:
+            return []
+
+        self._set_results(calls, self._api.call_many(pairs))
+
+        return [call._result for call in calls]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.send()
+
+
+class AsyncBatch(Batch):
+    """A `Batch` for the asynchronous APIs; it is sent with `await batch.send()`
+    or at the end of an `async with` block."""
+
+    async def send(self):
+        calls, pairs = self._take_calls()
+        if not calls:
+            return []
+
+        self._set_results(calls, await self._api.call_many(pairs))
+
+        return [call._result for call in calls]
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' with an asynchronous batch")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            await self.send()
@@ -0,0 +1,192 @@
+"""In-memory cache for the responses of read-only commands.
+
+The cache is opt-in; an instance is given to the API wrapper,
+and then every call to a cacheable command is answered from the cache
+while its entry is fresh.
+>>> cache = ResponseCache(ttl=30, ttls={"version": 3600})
+>>> lbry = LbrydApi(cache=cache)
+
+The entries are keyed on the server URL, the method and the parameters,
+they expire after the time-to-live of their method, and the least
+recently used ones are evicted when the cache holds too many entries
+or too many bytes. A call to a command that changes the state of the daemon,
+like `stream_create` or `wallet_send`, invalidates the entries
+of the commands that may be affected by it.
+
+The cached results are shared between callers, and should not be modified.
+"""
+import collections
+import json
+import threading
+import time
+
+from pybry import lbryd_spec
+
+# Sections whose commands depend on the state of the wallet and its claims.
+# A change in any of them invalidates the cached reads of all of them.
+WALLET_SECTIONS = frozenset(["main", "account", "address", "channel", "claim",
+                             "collection", "purchase", "stream", "support",
+                             "transaction", "txo", "utxo", "wallet"])
+
+# Default time-to-live, in seconds, of commands whose results rarely change
+DEFAULT_TTLS = {"version": 3600,
+                "ffmpeg_find": 3600}
+
+
+def request_key(url, method, params):
+    """Return a hashable key identifying a call with its parameters.
+
+    The parameters are normalized, so the key doesn't depend on
+    the order of the keyword arguments, or on those that are None.
+
+    :param str url: URL of the server
+    :param str method: The API method
+    :param dict | list params: Parameters of the method
+    :rtype: tuple
+    """
+    if isinstance(params, dict):
+        params = {k: v for (k, v) in params.items() if v is not None}
+
+    return url, method, json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class _Entry:
+
+    __slots__ = ("value", "expires", "size", "method")
+
+    def __init__(self, value, expires, size, method):
+        self.value = value
+        self.expires = expires
+        self.size = size
+        self.method = method
+
+
+class ResponseCache:
+    """Thread-safe LRU cache, with time-to-live, of the values returned by API calls."""
+
+    def __init__(self, ttl=30, ttls=None, methods=None, max_entries=1024,
+                 max_bytes=64 * 1024 * 1024, sections=None):
+        """
+        :param float ttl: Default number of seconds an entry is fresh.
+        :param dict ttls: Number of seconds an entry is fresh for specific methods.
+        :param iterable methods: Methods whose results are cached;
+         the read-only commands of the `lbrynet` API by default.
+        :param int max_entries: Maximum number of entries in the cache.
+        :param int max_bytes: Maximum total size of the cached responses, in bytes.
+        :param dict sections: Section of each method, used to decide which entries
+         are invalidated by a call that changes the state of the daemon;
+         the sections of the `lbrynet` API by default.
+        """
+        self.ttl = ttl
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.methods = frozenset(lbryd_spec.READ_ONLY if methods is None else methods)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sections = lbryd_spec.SECTIONS if sections is None else sections
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+        self._entries = collections.OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def is_cacheable(self, method):
+        """Whether the results of `method` are stored in the cache."""
+        return method in self.methods
+
+    def get(self, key):
+        """Return the cached value for `key`, or None if it's missing or expired.
+
+        :param tuple key: Key returned by `request_key`
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires <= now:
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def put(self, key, value, size=0):
+        """Store the value returned by a call, evicting the least recently used entries if needed.
+
+        :param tuple key: Key returned by `request_key`
+        :param value: The value returned by the call
+        :param int size: Size of the response in bytes, counted against `max_bytes`
+        """
+        method = key[1]
+        ttl = self.ttls.get(method, self.ttl)
+        if ttl <= 0 or size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = _Entry(value, time.monotonic() + ttl, size, method)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def invalidate(self, method=None):
+        """Remove the entries that may be affected by a call to `method` that changes the daemon.
+
+        The entries of the same section as `method` are removed; if the section
+        depends on the wallet, the entries of all those sections are removed.
+        Methods without a known section don't invalidate anything.
+        Without a method, the whole cache is cleared.
+
+        :param str method: The method that was called
+        """
+        with self._lock:
+            if method is None:
+                self._entries.clear()
+                self._bytes = 0
+                return
+
+            section = self.sections.get(method)
+            if section is None:
+                return
+
+            affected = WALLET_SECTIONS if section in WALLET_SECTIONS else {section}
+
+            for key in [key for key, entry in self._entries.items()
+                        if self.sections.get(entry.method) in affected]:
+                self._remove(key)
+                self.invalidations += 1
+
+    def clear(self):
+        """Remove every entry."""
+        self.invalidate()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """Return the counters of the cache.
+
+        :rtype: dict
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {"hits": self.hits,
+                    "misses": self.misses,
+                    "hit_ratio": self.hits / lookups if lookups else 0.0,
+                    "evictions": self.evictions,
+                    "invalidations": self.invalidations,
+                    "entries": len(self._entries),
+                    "bytes": self._bytes}
@@ -0,0 +1,304 @@
+"""Scan the blocks of the LBRY chain from a `lbrycrd` node, over a range of heights.
+
+Indexing the chain with `getblockhash` and `getblock` calls made one after
+the other waits for a round trip per call. A `ChainScanner` splits the heights
+into chunks instead, and requests each chunk with two batch requests,
+its block hashes and then its blocks, while the next chunks are requested
+by other workers. The blocks are still yielded in height order:
+>>> scanner = ChainScanner(LbrycrdApi("user", "password"), max_workers=8)
+>>> for block in scanner.scan(0, 1000):
+...     print(block["height"], len(block["tx"]))
+
+With `verbosity=2`, the blocks contain their decoded transactions,
+so they don't need a `getrawtransaction` call each.
+
+Every block is checked to follow the previous one. When it doesn't, the chain
+was reorganized: the scanner finds the last block both chains have in common,
+calls `on_reorg`, and scans again from there. `follow` scans up to the tip,
+then waits for the new blocks, and a scan can resume from the checkpoint
+of the last block it yielded.
+"""
+import asyncio
+import collections
+import time
+
+from pybry.exception import LBRYError
+from pybry.fanout import afan_out, chunked, fan_out
+
+
+class ChainReorganized(Exception):
+    """Raised internally when a block doesn't follow the previous one."""
+
+
+class ChainScanner:
+    """Requests the blocks of a range of heights in concurrent batches, and yields them in order."""
+
+    def __init__(self, api, batch_size=100, max_workers=4, verbosity=1,
+                 reorg_depth=100, poll_interval=10, on_reorg=None):
+        """
+        :param LbrycrdApi api: The wrapper the blocks are requested with;
+         its `pool_maxsize` should be at least `max_workers`
+        :param int batch_size: Number of blocks requested in a batch
+        :param int max_workers: Number of batches requested at the same time
+        :param int verbosity: Verbosity of `getblock`: 0 for the serialized block,
+         1 for the IDs of its transactions, 2 for its decoded transactions
+        :param int reorg_depth: Number of recent blocks kept to find where a reorganization started
+        :param float poll_interval: Seconds between the checks for new blocks, when following the tip
+        :param callable on_reorg: Called with the height of the last block both chains have in common,
+         and the `(height, hash)` of the blocks that were yielded above it, newest first,
+         before the blocks of the new chain are yielded
+        """
+        self.api = api
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.verbosity = verbosity
+        self.reorg_depth = max(reorg_depth, 1)
+        self.poll_interval = poll_interval
+        self.on_reorg = on_reorg
+        # Height and hash of the last blocks yielded
+        self._recent = collections.deque(maxlen=self.reorg_depth)
+
+    @property
+    def checkpoint(self):
+        """The height and hash of the last block yielded, to resume from, or None.
+
+        :rtype: tuple
+        """
+        return self._recent[-1] if self._recent else None
+
+    # Requests
+
+    def _results(self, value, calls, above_tip=False):
+        """Return the results of a batch, raising the error of any call.
+
+        With `above_tip`, the first call is `getblockcount`, and the `getblockhash` calls
+        of the heights above the tip return None, for the blocks orphaned by a shorter chain.
+        """
+        results = value[0] if isinstance(value, tuple) else value
+        if results is None:
+            raise LBRYError(f"The batch of '{calls[0][0]}' could not be requested", None, None, None)
+        tip = results[0] if above_tip else None
+        for (method, params), result in zip(calls, results):
+            if isinstance(result, LBRYError):
+                if isinstance(tip, int) and method == "getblockhash" and params[0] > tip:
+                    continue
+                raise result
+        return [None if isinstance(result, LBRYError) else result for result in results]
+
+    def _call_many(self, calls, above_tip=False):
+        return self._results(self.api.call_many(calls), calls, above_tip)
+
+    def _block_calls(self, hashes):
+        return [("getblock", [block_hash, self.verbosity]) for block_hash in hashes]
+
+    def _fetch(self, heights):
+        """Return the blocks of a chunk of heights, with two batch requests."""
+        hashes = self._hashes(self._call_many(self._hash_calls(heights), above_tip=True))
+        blocks = self._call_many(self._block_calls(hashes))
+        return self._blocks(heights, hashes, blocks)
+
+    def _hash_calls(self, heights):
+        """Return the calls of the height of the tip, and of the hashes of a chunk of heights."""
+        return [("getblockcount", [])] + [("getblockhash", [height]) for height in heights]
+
+    def _hashes(self, results):
+        """Return the hashes of a chunk; the chain ending below it was reorganized to a shorter one."""
+        if None in results:
+            raise ChainReorganized()
+        return results[1:]
+
+    def _blocks(self, heights, hashes, blocks):
+        if self.verbosity:
+            return blocks
+        # The serialized blocks only contain the hash of the previous one, in their header
+        return [{"height": height, "hash": block_hash, "hex": block,
+                 "previousblockhash": bytes.fromhex(block[8:72])[::-1].hex()}
+                for height, block_hash, block in zip(heights, hashes, blocks)]
+
+    def _tip_calls(self):
+        """Return the calls of the height of the tip, and of the hash of the last block at its height;
+        they are made with `above_tip`, since the chain may now end below it."""
+        calls = [("getblockcount", [])]
+        if self._recent:
+            calls.append(("getblockhash", [self._recent[-1][0]]))
+        return calls
+
+    def _fork_calls(self):
+        """Return the calls of the height of the tip, and of the hashes of the recent blocks at their heights;
+        they are made with `above_tip`, the blocks above the tip being orphaned."""
+        return [("getblockcount", [])] + [("getblockhash", [height]) for height, _ in self._recent]
+
+    # Reorganizations
+
+    def _check(self, block):
+        """Check that a block follows the last block yielded, and remember it."""
+        if self._recent:
+            height, block_hash = self._recent[-1]
+            if block["height"] != height + 1 or block.get("previousblockhash") != block_hash:
+                raise ChainReorganized()
+        self._recent.append((block["height"], block["hash"]))
+
+    def _rewind(self, hashes):
+        """Forget the recent blocks that are not on the chain anymore, and return the height to scan from.
+
+        :param list hashes: The hashes of the heights of the recent blocks on the chain,
+         None for the heights above the tip
+        """
+        orphaned = []
+        while self._recent and self._recent[-1][1] != hashes[len(self._recent) - 1]:
+            orphaned.append(self._recent.pop())
+
+        if self._recent and not orphaned:
+            # Only blocks that were not yielded yet were orphaned
+            return self._recent[-1][0] + 1
+        if not self._recent:
+            raise LBRYError(f"The chain was reorganized below the last {len(orphaned)} blocks scanned",
+                            None, None, None)
+
+        return self._reorganized(self._recent[-1][0], orphaned)
+
+    def _reorganized(self, fork, orphaned):
+        if self.on_reorg is not None:
+            self.on_reorg(fork, orphaned)
+        return fork + 1
+
+    def _resume(self, checkpoint, tip_hash):
+        """Return the height to scan from after a checkpoint.
+
+        When its block is not on the chain anymore, only its hash is known, so the scan
+        starts again `reorg_depth` blocks below it.
+        """
+        self._recent.clear()
+        if tip_hash == checkpoint[1]:
+            self._recent.append(tuple(checkpoint))
+            return checkpoint[0] + 1
+        return self._reorganized(max(checkpoint[0] - self.reorg_depth, -1), [tuple(checkpoint)])
+
+    # Scanning
+
+    def _chunks(self, start, end):
+        return chunked(range(start, end + 1), self.batch_size)
+
+    def _scan(self, start, end):
+        """Yield the blocks from `start` to `end`, and scan again from the fork after a reorganization."""
+        while start <= end:
+            chunks = fan_out(self._fetch, self._chunks(start, end), self.max_workers)
+            try:
+                for blocks in chunks:
+                    for block in blocks:
+                        self._check(block)
+                        yield block
+                return
+            except ChainReorganized:
+                # The chain can be shorter after the reorganization
+                results = self._call_many(self._fork_calls(), above_tip=True)
+                start, end = self._rewind(results[1:]), min(end, results[0])
+            finally:
+                chunks.close()
+
+    def scan(self, start=0, end=None, checkpoint=None):
+        """Yield the blocks from `start` to `end`, in height order.
+
+        :param int start: Height of the first block
+        :param int end: Height of the last block; the tip when the scan starts by default
+        :param tuple checkpoint: The `checkpoint` of a previous scan, to resume after its last block
+         instead of at `start`
+        :raises LBRYError: If a block cannot be requested, or if the chain was reorganized
+         deeper than `reorg_depth`
+        :return: Generator of the blocks returned by `getblock`
+        """
+        self._recent.clear()
+        if checkpoint is not None:
+            self._recent.append(tuple(checkpoint))
+        if checkpoint is not None or end is None:
+            results = self._call_many(self._tip_calls(), above_tip=True)
+            if checkpoint is not None:
+                start = self._resume(checkpoint, results[1])
+            end = results[0] if end is None else end
+
+        yield from self._scan(start, end)
+
+    def follow(self, start=0, checkpoint=None):
+        """Yield the blocks from `start` up to the tip, then the new blocks as they are mined.
+
+        The tip is checked every `poll_interval` seconds; it never returns.
+        The arguments are the same as in `scan`.
+        """
+        yield from self.scan(start, checkpoint=checkpoint)
+
+        while True:
+            results = self._call_many(self._tip_calls(), above_tip=True)
+            if self._recent:
+                start = self._recent[-1][0] + 1
+                if len(results) > 1 and results[1] != self._recent[-1][1]:
+                    results = self._call_many(self._fork_calls(), above_tip=True)
+                    start = self._rewind(results[1:])
+            if results[0] >= start:
+                yield from self._scan(start, results[0])
+            else:
+                time.sleep(self.poll_interval)
+
+
+class AsyncChainScanner(ChainScanner):
+    """`ChainScanner` for an `AsyncLbrycrdApi`; its scans are iterated with `async for`."""
+
+    async def _call_many(self, calls, above_tip=False):
+        return self._results(await self.api.call_many(calls), calls, above_tip)
+
+    async def _fetch(self, heights):
+        hashes = self._hashes(await self._call_many(self._hash_calls(heights), above_tip=True))
+        blocks = await self._call_many(self._block_calls(hashes))
+        return self._blocks(heights, hashes, blocks)
+
+    async def _scan(self, start, end):
+        while start <= end:
+            chunks = afan_out(self._fetch, self._chunks(start, end), self.max_workers)
+            try:
+                async for blocks in chunks:
+                    for block in blocks:
+                        self._check(block)
+                        yield block
+                return
+            except ChainReorganized:
+                results = await self._call_many(self._fork_calls(), above_tip=True)
+                start, end = self._rewind(results[1:]), min(end, results[0])
+            finally:
+                await chunks.aclose()
+
+    async def scan(self, start=0, end=None, checkpoint=None):
+        """Yield the blocks from `start` to `end`, in height order.
+
+        The arguments are the same as in `ChainScanner.scan`.
+        """
+        self._recent.clear()
+        if checkpoint is not None:
+            self._recent.append(tuple(checkpoint))
+        if checkpoint is not None or end is None:
+            results = await self._call_many(self._tip_calls(), above_tip=True)
+            if checkpoint is not None:
+                start = self._resume(checkpoint, results[1])
+            end = results[0] if end is None else end
+
+        async for block in self._scan(start, end):
+            yield block
+
+    async def follow(self, start=0, checkpoint=None):
+        """Yield the blocks from `start` up to the tip, then the new blocks as they are mined.
+
+        The arguments are the same as in `ChainScanner.follow`.
+        """
+        async for block in self.scan(start, checkpoint=checkpoint):
+            yield block
+
+        while True:
+            results = await self._call_many(self._tip_calls(), above_tip=True)
+            if self._recent:
+                start = self._recent[-1][0] + 1
+                if len(results) > 1 and results[1] != self._recent[-1][1]:
+                    results = await self._call_many(self._fork_calls(), above_tip=True)
+                    start = self._rewind(results[1:])
+            if results[0] >= start:
+                async for block in self._scan(start, results[0]):
+                    yield block
+            else:
+                await asyncio.sleep(self.poll_interval)
@@ -0,0 +1,97 @@
+"""JSON encoders and decoders for the requests and responses.
+
+Decoding large responses, like pages of `claim_search` or `txo_list`,
+takes most of the time spent in the client, so a faster JSON library
+is used when it is installed: `orjson` first, then `ujson`,
+and the standard `json` module otherwise.
+A specific codec can be chosen by name, or a custom object
+with `dumps` and `loads` methods can be given to the wrapper.
+>>> lbry = LbrydApi(codec="json")
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class JsonCodec:
+    """Codec that uses the standard `json` module."""
+
+    name = "json"
+
+    @staticmethod
+    def dumps(obj):
+        """Encode `obj` as JSON.
+
+        :rtype: bytes
+        """
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    @staticmethod
+    def loads(data):
+        """Decode a JSON document given as `bytes` or `str`."""
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """Codec that uses the `orjson` library."""
+
+    name = "orjson"
+
+    @staticmethod
+    def dumps(obj):
+        return orjson.dumps(obj)
+
+    @staticmethod
+    def loads(data):
+        return orjson.loads(data)
+
+
+class UjsonCodec(JsonCodec):
+    """Codec that uses the `ujson` library."""
+
+    name = "ujson"
+
+    @staticmethod
+    def dumps(obj):
+        return ujson.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    @staticmethod
+    def loads(data):
+        return ujson.loads(data)
+
+
+CODECS = {"json": JsonCodec}
+if ujson is not None:
+    CODECS["ujson"] = UjsonCodec
+if orjson is not None:
+    CODECS["orjson"] = OrjsonCodec
+
+
+def get_codec(codec=None):
+    """Return the codec with the given name, or the fastest one available.
+
+    :param str codec: Name of the codec, `orjson`, `ujson` or `json`,
+     or an object with `dumps` and `loads` methods, which is returned as it is
+    :raises ValueError: If the codec is not available
+    """
+    if codec is None:
+        for name in ("orjson", "ujson", "json"):
+            if name in CODECS:
+                return CODECS[name]
+
+    if not isinstance(codec, str):
+        return codec
+
+    try:
+        return CODECS[codec]
+    except KeyError:
+        raise ValueError(f"JSON codec '{codec}' is not available; "
+                         f"the available codecs are {', '.join(CODECS)}") from None
@@ -0,0 +1,104 @@
+"""Static constants that the code generator will use.
+
+These constants will be used when generating the API wrappers,
+and they will also be used inside the wrappers.
+"""
+import os
+
+__version__ = "2.2.0"
+
+# This is the URL for the online `lbrynet` API documentation
+LBRY_API_RAW_JSON_URL = "https://raw.githubusercontent.com/lbryio/lbry/master/docs/api.json"
+
+# At the moment there is no online `lbrycrd` API documentation
+# LBRYCRD_API_RAW_JSON_URL = ""
+
+# Input and output directories
+TEMPLATE_DIR = "template"
+PKG_DIR = NAME = "pybry"
+
+# Template file and generated module.
+# The template file will be read and should not be overwritten.
+# The generated module will be created or overwritten.
+LBRYD_BASE_FPATH = os.path.join(TEMPLATE_DIR, "_lbryd_api.py")
+LBRYD_FPATH = os.path.join(PKG_DIR, "lbryd_api.py")
+
+LBRYCRD_BASE_FPATH = os.path.join(TEMPLATE_DIR, "_lbrycrd_api.py")
+LBRYCRD_FPATH = os.path.join(PKG_DIR, "lbrycrd_api.py")
+
+# Asynchronous versions of the wrappers, which use `aiohttp`
+ASYNC_LBRYD_BASE_FPATH = os.path.join(TEMPLATE_DIR, "_async_lbryd_api.py")
+ASYNC_LBRYD_FPATH = os.path.join(PKG_DIR, "async_lbryd_api.py")
+
+ASYNC_LBRYCRD_BASE_FPATH = os.path.join(TEMPLATE_DIR, "_async_lbrycrd_api.py")
+ASYNC_LBRYCRD_FPATH = os.path.join(PKG_DIR, "async_lbrycrd_api.py")
+
+# Generated specification of the `lbrynet` commands, used by the wrappers
+LBRYD_SPEC_FPATH = os.path.join(PKG_DIR, "lbryd_spec.py")
+
+# Generated compact specification of the `lbrynet` commands,
+# used by the wrappers of the lazy build
+LBRYD_COMMANDS_FPATH = os.path.join(PKG_DIR, "lbryd_commands.py")
+
+# Generated compact models of the results of `lbrynet`
+MODELS_FPATH = os.path.join(PKG_DIR, "models.py")
+
+# Cache of the generator: the downloaded API documentation,
+# the formatted code of the wrappers, and the record of the last build
+GENERATOR_CACHE_DIR = os.path.join("build", "generator")
+
+# Models generated from the results described in the API documentation.
+# Each result is identified by a field that only it has,
+# and results identified by the same field share the model.
+RESULT_MODELS = {"Output": ("claim_op", "A transaction output: a claim, support, purchase or payment."),
+                 "Transaction": ("total_fee", "A transaction with its inputs and outputs."),
+                 "File": ("streaming_url", "A file managed by the daemon."),
+                 "Account": ("address_generator", "An account of a wallet.")}
+
+# Fields containing a single result of another model,
+# which the API documentation doesn't describe
+NESTED_MODELS = {"Output": {"claim": "Output",
+                            "reposted_claim": "Output",
+                            "signing_channel": "Output"}}
+
+# Variables used to decide which `lbrynet` commands only read information.
+# The API documentation doesn't say it, so it is deduced from the names.
+READ_ONLY_SUFFIXES = ("_list", "_search", "_show", "_get", "_sum", "_plot",
+                      "_is_mine", "_status", "_find", "_estimate", "_balance",
+                      "_resolve", "_hash")
+READ_ONLY_COMMANDS = ("resolve", "status", "version")
+# These match the suffixes but change the state of the daemon
+NOT_READ_ONLY_COMMANDS = ("get", "blob_get", "address_unused", "file_set_status")
+
+# Description of the `fields` argument of the methods of the paginated commands
+FIELDS_DESCRIPTION = ("Paths of the fields kept in the items, such as 'claim_id' or 'value.title'; "
+                      "the items are then parsed and projected as the response is received, "
+                      "see `pybry.projection`")
+
+# Commands of lbrycrd that only read the state of the chain,
+# which can be retried safely
+LBRYCRD_READ_ONLY_COMMANDS = ("getbestblockhash", "getblock", "getblockchaininfo",
+                              "getblockcount", "getblockhash", "getblockheader",
+                              "getchaintips", "getclaimbyid", "getclaimsforname",
+                              "getclaimsintrie", "getdifficulty", "getmempoolinfo",
+                              "getnetworkinfo", "getrawmempool", "getrawtransaction",
+                              "gettxout", "getvalueforname")
+
+# Variable used to map the data types in the API documentation
+# for the generated docstrings in the written API wrapper.
+DTYPE_MAPPING = {'list': "list",
+                 'decimal': "float",
+                 'float': "float",
+                 'bool': "bool",
+                 'int': "int",
+                 'dict': "dict",
+                 'str': "str",
+                 'string': "str",
+                 'str, list': "list",
+                 'str or list': "list",
+                 'date': "str"}
+
+# Default address for the running `lbrynet` and `lbrycrd` daemons
+LBRYD_SERVER_ADDRESS = "http://localhost:5279"
+LBRYCRD_SERVER_ADDRESS = "http://localhost:9245"
+
@@ -0,0 +1,156 @@
+"""Wrappers whose methods are created when they are first used.
+
+In the lazy build of the package (`make build_lazy`), the `lbrynet` wrappers
+don't contain a method for every command. They are given the compact
+specification of the commands in `pybry.lbryd_commands` instead,
+and each method is compiled the first time it is accessed, on the class
+or on an instance. The created methods are the same as in the regular build,
+with their signature and docstring, so `help()` and `inspect` work as usual:
+>>> lbry = LbrydApi()
+>>> help(lbry.claim_search)
+
+This keeps the import of the package fast and its memory small,
+for short-lived processes that only call a few commands.
+"""
+import importlib
+import sys
+
+from pybry.constants import FIELDS_DESCRIPTION
+
+# Default number of spaces in the docstrings of the created methods,
+# as in the regular build
+INDENT = " " * 8
+
+
+def method_source(name, arguments, method_name, request, is_async, fields=False):
+    """Return the source code of the method calling a command.
+
+    :param str name: Name of the command
+    :param tuple arguments: Name, whether it is required, type and description of each argument
+    :param str method_name: Name of the method
+    :param str request: Method of the base class making the request
+    :param bool is_async: Whether the method is a coroutine awaiting the request
+    :param bool fields: Whether the method takes the `fields` its items are projected on
+    :rtype: str
+    """
+    names = parameter_names(arguments)
+    optional = set(argument[0] for argument in arguments if not argument[1])
+
+    signature = ", ".join(["self"] + [arg + "=None" if arg in optional else arg for arg in names]
+                          + (["fields=None"] if fields else []))
+
+    return (f"{'async def' if is_async else 'def'} {method_name}({signature}):\n"
+            f"    return {'await ' if is_async else ''}self.{request}(SERVER_ADDRESS, '{name}', "
+            f"PLANS.{name}({', '.join(names)}), timeout=self.timeout{', fields=fields' if fields else ''})\n")
+
+
+def parameter_names(arguments):
+    """Return the names of the arguments of a method, the required ones first."""
+    return ([argument[0] for argument in arguments if argument[1]]
+            + [argument[0] for argument in arguments if not argument[1]])
+
+
+def method_docstring(description, arguments, fields=False):
+    """Return the docstring of a method, as written in the regular build."""
+    lines = [description, ""]
+    for arg, is_required, dtype, arg_description in arguments:
+        lines.append(f":param {dtype} {arg}: {arg_description}"
+                     + ("" if is_required else " (Optional)"))
+    if fields:
+        lines.append(f":param list fields: {FIELDS_DESCRIPTION} (Optional)")
+    docstring = ("\n" + INDENT).join(lines)
+    # Without trailing whitespace, as formatted by yapf in the regular build
+    return "\n".join(line.rstrip() for line in docstring.split("\n")) + "\n" + INDENT
+
+
+class LazyApiMeta(type):
+    """Metaclass of the wrappers whose methods are created on first access.
+
+    The class has the specification of the commands in its `_commands` attribute,
+    a `dict` of the description, the arguments and whether it is paginated of each command,
+    or the name of the module defining it as `COMMANDS`, which is imported when a method
+    is first accessed. The `_is_async` attribute tells whether its methods are coroutines.
+    The module of the class must define `SERVER_ADDRESS`, and the `PLANS` of the commands,
+    to which the plan of a command is added when its method is created.
+    """
+
+    def __new__(mcs, name, bases, namespace):
+        namespace.setdefault("__getattr__", _instance_getattr)
+        namespace.setdefault("__dir__", _instance_dir)
+        return super().__new__(mcs, name, bases, namespace)
+
+    def __getattr__(cls, name):
+        # Only called for the attributes that don't exist yet
+        if name.startswith("_"):
+            raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+        return cls._materialize(name)
+
+    def __dir__(cls):
+        return sorted(set(super().__dir__()) | set(cls._command_names()))
+
+    def _specification(cls):
+        commands = cls._commands
+        if isinstance(commands, str):
+            commands = cls._commands = importlib.import_module(commands).COMMANDS
+        return commands
+
+    def _command_names(cls):
+        for name, (_, _, paginated) in cls._specification().items():
+            yield name
+            if paginated:
+                yield "iter_" + name
+
+    def _materialize(cls, name):
+        """Compile the method called `name`, add it to the class, and return it."""
+        commands = cls._specification()
+        command, request = name, "make_request"
+
+        spec = commands.get(name)
+        if spec is None and name.startswith("iter_"):
+            command, request = name[len("iter_"):], "iter_pages"
+            spec = commands.get(command)
+            if spec is not None and not spec[2]:
+                spec = None
+
+        if spec is None:
+            raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+
+        description, arguments, paginated = spec
+        if request == "iter_pages":
+            description = (f"Iterate over the items of all the pages of `{command}`, "
+                           f"starting from `page`.\n\n{INDENT}{description}")
+
+        # The iterators are regular methods returning an asynchronous generator
+        is_async = cls._is_async and request == "make_request"
+        source = method_source(command, arguments, name, request, is_async, paginated)
+
+        # Compiled in the namespace of the module, so `SERVER_ADDRESS` and `PLANS` are looked up there
+        module = vars(sys.modules[cls.__module__])
+        if not hasattr(module["PLANS"], command):
+            module["PLANS"].add(command, parameter_names(arguments))
+
+        namespace = {}
+        exec(compile(source, f"<{cls.__module__}.{name}>", "exec"), module, namespace)
+
+        method = namespace[name]
+        method.__doc__ = method_docstring(description, arguments, paginated)
+        method.__module__ = cls.__module__
+        method.__qualname__ = f"{cls.__qualname__}.{name}"
+
+        setattr(cls, name, method)
+        return method
+
+
+def _instance_getattr(self, name):
+    # Only called for the attributes that don't exist yet
+    if name.startswith("_"):
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+    try:
+        method = type(self)._materialize(name)
+    except AttributeError:
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'") from None
+    return method.__get__(self, type(self))
+
+
+def _instance_dir(self):
+    return sorted(set(object.__dir__(self)) | set(type(self)._command_names()))
@@ -0,0 +1,160 @@
+"""
+Specification of the commands of the LBRY daemon API.
+
+This file was generated at build time using the `generator` module.
+Input JSON: docs/api.json
+"""
+
+# Section of the API documentation in which each command is described
+SECTIONS = {
+    'ffmpeg_find': 'main',
+    'get': 'main',
+    'publish': 'main',
+    'resolve': 'main',
+    'routing_table_get': 'main',
+    'status': 'main',
+    'stop': 'main',
+    'version': 'main',
+    'account_add': 'account',
+    'account_balance': 'account',
+    'account_create': 'account',
+    'account_fund': 'account',
+    'account_list': 'account',
+    'account_max_address_gap': 'account',
+    'account_remove': 'account',
+    'account_send': 'account',
+    'account_set': 'account',
+    'address_is_mine': 'address',
+    'address_list': 'address',
+    'address_unused': 'address',
+    'blob_announce': 'blob',
+    'blob_clean': 'blob',
+    'blob_delete': 'blob',
+    'blob_get': 'blob',
+    'blob_list': 'blob',
+    'blob_reflect': 'blob',
+    'blob_reflect_all': 'blob',
+    'channel_abandon': 'channel',
+    'channel_create': 'channel',
+    'channel_export': 'channel',
+    'channel_import': 'channel',
+    'channel_list': 'channel',
+    'channel_sign': 'channel',
+    'channel_update': 'channel',
+    'claim_list': 'claim',
+    'claim_search': 'claim',
+    'collection_abandon': 'collection',
+    'collection_create': 'collection',
+    'collection_list': 'collection',
+    'collection_resolve': 'collection',
+    'collection_update': 'collection',
+    'file_delete': 'file',
+    'file_list': 'file',
+    'file_reflect': 'file',
+    'file_save': 'file',
+    'file_set_status': 'file',
+    'peer_list': 'peer',
+    'peer_ping': 'peer',
+    'preference_get': 'preference',
+    'preference_set': 'preference',
+    'purchase_create': 'purchase',
+    'purchase_list': 'purchase',
+    'settings_clear': 'settings',
+    'settings_get': 'settings',
+    'settings_set': 'settings',
+    'stream_abandon': 'stream',
+    'stream_cost_estimate': 'stream',
+    'stream_create': 'stream',
+    'stream_list': 'stream',
+    'stream_repost': 'stream',
+    'stream_update': 'stream',
+    'support_abandon': 'support',
+    'support_create': 'support',
+    'support_list': 'support',
+    'support_sum': 'support',
+    'sync_apply': 'sync',
+    'sync_hash': 'sync',
+    'tracemalloc_disable': 'tracemalloc',
+    'tracemalloc_enable': 'tracemalloc',
+    'tracemalloc_top': 'tracemalloc',
+    'transaction_list': 'transaction',
+    'transaction_show': 'transaction',
+    'txo_list': 'txo',
+    'txo_plot': 'txo',
+    'txo_spend': 'txo',
+    'txo_sum': 'txo',
+    'utxo_list': 'utxo',
+    'utxo_release': 'utxo',
+    'wallet_add': 'wallet',
+    'wallet_balance': 'wallet',
+    'wallet_create': 'wallet',
+    'wallet_decrypt': 'wallet',
+    'wallet_encrypt': 'wallet',
+    'wallet_list': 'wallet',
+    'wallet_lock': 'wallet',
+    'wallet_reconnect': 'wallet',
+    'wallet_remove': 'wallet',
+    'wallet_send': 'wallet',
+    'wallet_status': 'wallet',
+    'wallet_unlock': 'wallet',
+}
+
+# Commands that only read information, and do not change the state of the daemon
+READ_ONLY = frozenset([
+    'ffmpeg_find',
+    'resolve',
+    'routing_table_get',
+    'status',
+    'version',
+    'account_balance',
+    'account_list',
+    'address_is_mine',
+    'address_list',
+    'blob_list',
+    'channel_list',
+    'claim_list',
+    'claim_search',
+    'collection_list',
+    'collection_resolve',
+    'file_list',
+    'peer_list',
+    'preference_get',
+    'purchase_list',
+    'settings_get',
+    'stream_cost_estimate',
+    'stream_list',
+    'support_list',
+    'support_sum',
+    'sync_hash',
+    'transaction_list',
+    'transaction_show',
+    'txo_list',
+    'txo_plot',
+    'txo_sum',
+    'utxo_list',
+    'wallet_balance',
+    'wallet_list',
+    'wallet_status',
+])
+
+# Commands that return their results in pages
+PAGINATED = frozenset([
+    'account_list',
+    'address_list',
+    'blob_list',
+    'channel_list',
+    'claim_list',
+    'claim_search',
+    'collection_list',
+    'collection_resolve',
+    'file_list',
+    'peer_list',
+    'purchase_list',
+    'stream_list',
+    'support_list',
+    'support_sum',
+    'transaction_list',
+    'txo_list',
+    'utxo_list',
+    'wallet_list',
+])
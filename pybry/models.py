@@ -0,0 +1,237 @@
+"""
+Compact models of the results of the LBRY daemon API.
+
+This file was generated at build time using the `generator` module.
+Input JSON: docs/api.json
+"""
+from pybry.model import Model
+
+
+class Output(Model):
+    """A transaction output: a claim, support, purchase or payment.
+
+    :ivar txid: hash of transaction in hex
+    :ivar nout: position in the transaction
+    :ivar height: block where transaction was recorded
+    :ivar amount: value of the txo as a decimal
+    :ivar address: address of who can spend the txo
+    :ivar confirmations: number of confirmed blocks
+    :ivar is_change: payment to change address, only available when it can be determined
+    :ivar is_received: true if txo was sent from external account to this account
+    :ivar is_spent: true if txo is spent
+    :ivar is_mine: payment to one of your accounts, only available when it can be determined
+    :ivar type: one of 'claim', 'support' or 'purchase'
+    :ivar name: when type is 'claim' or 'support', this is the claim name
+    :ivar claim_id: when type is 'claim', 'support' or 'purchase', this is the claim id
+    :ivar claim_op: when type is 'claim', this determines if it is 'create' or 'update'
+    :ivar value: when type is 'claim' or 'support' with payload, this is the decoded protobuf payload
+    :ivar value_type: determines the type of the 'value' field: 'channel', 'stream', etc
+    :ivar protobuf: hex encoded raw protobuf version of 'value' field
+    :ivar permanent_url: when type is 'claim' or 'support', this is the long permanent claim URL
+    :ivar claim: for purchase outputs only, metadata of purchased claim
+    :ivar reposted_claim: for repost claims only, metadata of claim being reposted
+    :ivar signing_channel: for signed claims only, metadata of signing channel
+    :ivar is_channel_signature_valid: for signed claims only, whether signature is valid
+    :ivar purchase_receipt: metadata for the purchase transaction associated with this claim
+    """
+
+    __slots__ = (
+        'txid',
+        'nout',
+        'height',
+        'amount',
+        'address',
+        'confirmations',
+        'is_change',
+        'is_received',
+        'is_spent',
+        'is_mine',
+        'type',
+        'name',
+        'claim_id',
+        'claim_op',
+        'value',
+        'value_type',
+        'protobuf',
+        'permanent_url',
+        'claim',
+        'reposted_claim',
+        'signing_channel',
+        'is_channel_signature_valid',
+        'purchase_receipt',
+    )
+
+
+class Transaction(Model):
+    """A transaction with its inputs and outputs.
+
+    :ivar txid: hash of transaction in hex
+    :ivar height: block where transaction was recorded
+    :ivar inputs: list of `Output`
+    :ivar outputs: list of `Output`
+    :ivar total_input: sum of inputs as a decimal
+    :ivar total_output: sum of outputs, sans fee, as a decimal
+    :ivar total_fee: fee amount
+    :ivar hex: entire transaction encoded in hex
+    """
+
+    __slots__ = (
+        'txid',
+        'height',
+        'inputs',
+        'outputs',
+        'total_input',
+        'total_output',
+        'total_fee',
+        'hex',
+    )
+
+
+class File(Model):
+    """A file managed by the daemon.
+
+    :ivar streaming_url: (str) url to stream the file using range requests
+    :ivar completed: (bool) true if download is completed
+    :ivar file_name: (str) name of file
+    :ivar download_directory: (str) download directory
+    :ivar points_paid: (float) credit paid to download file
+    :ivar stopped: (bool) true if download is stopped
+    :ivar stream_hash: (str) stream hash of file
+    :ivar stream_name: (str) stream name
+    :ivar suggested_file_name: (str) suggested file name
+    :ivar sd_hash: (str) sd hash of file
+    :ivar download_path: (str) download path of file
+    :ivar mime_type: (str) mime type of file
+    :ivar key: (str) key attached to file
+    :ivar total_bytes_lower_bound: (int) lower bound file size in bytes
+    :ivar total_bytes: (int) file upper bound size in bytes
+    :ivar written_bytes: (int) written size in bytes
+    :ivar blobs_completed: (int) number of fully downloaded blobs
+    :ivar blobs_in_stream: (int) total blobs on stream
+    :ivar blobs_remaining: (int) total blobs remaining to download
+    :ivar status: (str) downloader status
+    :ivar claim_id: (str) None if claim is not found else the claim id
+    :ivar txid: (str) None if claim is not found else the transaction id
+    :ivar nout: (int) None if claim is not found else the transaction output index
+    :ivar outpoint: (str) None if claim is not found else the tx and output
+    :ivar metadata: (dict) None if claim is not found else the claim metadata
+    :ivar channel_claim_id: (str) None if claim is not found or not signed
+    :ivar channel_name: (str) None if claim is not found or not signed
+    :ivar claim_name: (str) None if claim is not found else the claim name
+    :ivar reflector_progress: (int) reflector upload progress, 0 to 100
+    :ivar uploading_to_reflector: (bool) set to True when currently uploading to reflector
+    """
+
+    __slots__ = (
+        'streaming_url',
+        'completed',
+        'file_name',
+        'download_directory',
+        'points_paid',
+        'stopped',
+        'stream_hash',
+        'stream_name',
+        'suggested_file_name',
+        'sd_hash',
+        'download_path',
+        'mime_type',
+        'key',
+        'total_bytes_lower_bound',
+        'total_bytes',
+        'written_bytes',
+        'blobs_completed',
+        'blobs_in_stream',
+        'blobs_remaining',
+        'status',
+        'claim_id',
+        'txid',
+        'nout',
+        'outpoint',
+        'metadata',
+        'channel_claim_id',
+        'channel_name',
+        'claim_name',
+        'reflector_progress',
+        'uploading_to_reflector',
+    )
+
+
+class Account(Model):
+    """An account of a wallet.
+
+    :ivar id: account_id
+    :ivar is_default: this account is used by default
+    :ivar ledger: name of crypto currency and network
+    :ivar name: optional account name
+    :ivar seed: human friendly words from which account can be recreated
+    :ivar encrypted: if account is encrypted
+    :ivar private_key: extended private key
+    :ivar public_key: extended public key
+    :ivar address_generator: settings for generating addresses
+    :ivar modified_on: date of last modification to account settings
+    """
+
+    __slots__ = (
+        'id',
+        'is_default',
+        'ledger',
+        'name',
+        'seed',
+        'encrypted',
+        'private_key',
+        'public_key',
+        'address_generator',
+        'modified_on',
+    )
+
+
+Transaction._nested = {
+    'inputs': Output,
+    'outputs': Output,
+}
+Output._nested = {
+    'claim': Output,
+    'reposted_claim': Output,
+    'signing_channel': Output,
+}
+
+# Model of the result of each command, and whether it is
+# the model of the items of the pages of results
+RESULT_MODELS = {
+    'get': (File, False),
+    'publish': (Transaction, False),
+    'account_add': (Account, False),
+    'account_create': (Account, False),
+    'account_fund': (Transaction, False),
+    'account_list': (Account, True),
+    'account_remove': (Account, False),
+    'account_send': (Transaction, False),
+    'account_set': (Account, False),
+    'channel_abandon': (Transaction, False),
+    'channel_create': (Transaction, False),
+    'channel_list': (Output, True),
+    'channel_update': (Transaction, False),
+    'claim_list': (Output, True),
+    'claim_search': (Output, True),
+    'collection_abandon': (Transaction, False),
+    'collection_create': (Transaction, False),
+    'collection_list': (Output, True),
+    'collection_resolve': (Output, True),
+    'collection_update': (Transaction, False),
+    'file_list': (File, True),
+    'file_save': (File, False),
+    'purchase_create': (Transaction, False),
+    'purchase_list': (Output, True),
+    'stream_abandon': (Transaction, False),
+    'stream_create': (Transaction, False),
+    'stream_list': (Output, True),
+    'stream_repost': (Transaction, False),
+    'stream_update': (Transaction, False),
+    'support_abandon': (Transaction, False),
+    'support_create': (Transaction, False),
+    'support_list': (Output, True),
+    'transaction_show': (Transaction, False),
+    'txo_list': (Output, True),
+    'utxo_list': (Output, True),
+    'wallet_send': (Transaction, False),
+}
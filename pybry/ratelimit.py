@@ -0,0 +1,219 @@
+"""Client-side rate limits and concurrency caps for the calls to the daemons.
+
+A `RateLimiter` holds a `Limit` for some methods, or for the sections
+of the API documentation they are described in, like "claim", "txo" or "wallet".
+Before a request is sent, it waits until the limit of its method allows it:
+>>> limiter = RateLimiter({"claim_search": Limit(rate=5, max_in_flight=2),
+...                        "txo": Limit(max_in_flight=1)})
+>>> lbry = LbrydApi(rate_limiter=limiter)
+
+The rate is enforced with a token bucket, which allows bursts of up to
+`burst` calls, and the concurrency cap bounds the number of requests in flight.
+The methods without a limit are never delayed, so heavy background work
+limited this way doesn't starve the other calls.
+A limiter can be shared by several wrappers, both synchronous and asynchronous,
+across threads and event loops.
+"""
+import asyncio
+import collections
+import threading
+import time
+
+from pybry import lbryd_spec
+
+
+class TokenBucket:
+    """Thread-safe token bucket, refilled at `rate` tokens per second up to `burst` tokens."""
+
+    def __init__(self, rate, burst=None):
+        """
+        :param float rate: Tokens added per second.
+        :param float burst: Maximum number of tokens; the rate, and at least 1, by default.
+        """
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1)
+        self.tokens = self.burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens=1):
+        """Take `tokens` from the bucket, and return the number of seconds to wait before using them.
+
+        The tokens are taken even if the bucket doesn't have them yet,
+        so that the callers are served in order.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self._last) * self.rate)
+            self._last = now
+            self.tokens -= tokens
+            return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+
+class ConcurrencyLimit:
+    """Counting semaphore that can be acquired from threads and from coroutines of any event loop.
+
+    The waiters are served in order; a released slot is handed to the next waiter directly.
+    """
+
+    def __init__(self, limit):
+        """
+        :param int limit: Maximum number of holders at the same time.
+        """
+        self.limit = limit
+        self.active = 0
+        self._waiters = collections.deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take a slot, blocking the thread until one is free."""
+        with self._lock:
+            if self.active < self.limit and not self._waiters:
+                self.active += 1
+                return
+            event = threading.Event()
+            self._waiters.append(event)
+
+        event.wait()
+
+    async def acquire_async(self):
+        """Take a slot, without blocking the event loop."""
+        with self._lock:
+            if self.active < self.limit and not self._waiters:
+                self.active += 1
+                return
+            future = asyncio.get_running_loop().create_future()
+            self._waiters.append(future)
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                waiting = future in self._waiters
+                if waiting:
+                    self._waiters.remove(future)
+            # The slot was handed over just before the cancellation
+            if not waiting and future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self):
+        """Free a slot, or hand it to the next waiter."""
+        with self._lock:
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                if isinstance(waiter, threading.Event):
+                    waiter.set()
+                    return
+                if not waiter.done():
+                    waiter.get_loop().call_soon_threadsafe(self._hand_over, waiter)
+                    return
+            self.active -= 1
+
+    def _hand_over(self, future):
+        if future.done():
+            # Cancelled while the slot was handed over
+            self.release()
+        else:
+            future.set_result(None)
+
+
+class Limit:
+    """The rate and the concurrency allowed for some methods."""
+
+    def __init__(self, rate=None, burst=None, max_in_flight=None):
+        """
+        :param float rate: Maximum number of calls per second; not limited by default.
+        :param float burst: Number of calls that may be made at once above the rate.
+        :param int max_in_flight: Maximum number of requests in flight; not limited by default.
+        """
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.in_flight = ConcurrencyLimit(max_in_flight) if max_in_flight else None
+
+
+class RateLimiter:
+    """Limits of the methods, and of the sections of the API, shared by several wrappers."""
+
+    def __init__(self, limits=None, default=None, sections=None, cost=None):
+        """
+        :param dict limits: `Limit` of the methods, or of the sections, by name;
+         the limit of a method is used rather than the one of its section.
+        :param Limit default: Limit of the methods that have no other limit;
+         they are not limited by default.
+        :param dict sections: Section of each method; the sections
+         of the `lbrynet` API by default.
+        :param callable cost: Function of the method and the parameters of a call
+         returning the number of tokens it takes, for example to count a page
+         of `page_size` items as several calls; 1 by default.
+        """
+        self.limits = dict(limits or {})
+        self.default = default
+        self.sections = lbryd_spec.SECTIONS if sections is None else sections
+        self.cost = cost
+
+    def limit_for(self, method):
+        """Return the `Limit` of a method, or None if it is not limited."""
+        limit = self.limits.get(method)
+        if limit is None:
+            limit = self.limits.get(self.sections.get(method), self.default)
+        return limit
+
+    def _reserve(self, data):
+        """Take the tokens of a request, and return its limits and the seconds to wait."""
+        calls = data if isinstance(data, list) else [data]
+        limits = {}
+        for call in calls:
+            limit = self.limit_for(call["method"])
+            if limit is not None:
+                tokens = self.cost(call["method"], call["params"]) if self.cost else 1
+                limits[id(limit)] = (limit, limits.get(id(limit), (None, 0))[1] + tokens)
+
+        delay = 0.0
+        for limit, tokens in limits.values():
+            if limit.bucket is not None:
+                delay = max(delay, limit.bucket.reserve(tokens))
+
+        # Always taken in the same order, so batches can't deadlock each other
+        caps = [limit.in_flight for _, (limit, _) in sorted(limits.items())
+                if limit.in_flight is not None]
+        return caps, delay
+
+    def acquire(self, data):
+        """Wait until a request may be sent, blocking the thread.
+
+        :param dict | list data: The JSON-RPC call, or the calls of a batch
+        :return: The permit to give to `release` once the response is received
+        """
+        caps, delay = self._reserve(data)
+        if delay:
+            time.sleep(delay)
+
+        for cap in caps:
+            cap.acquire()
+        return caps
+
+    async def acquire_async(self, data):
+        """Wait until a request may be sent, without blocking the event loop.
+
+        :param dict | list data: The JSON-RPC call, or the calls of a batch
+        :return: The permit to give to `release` once the response is received
+        """
+        caps, delay = self._reserve(data)
+        if delay:
+            await asyncio.sleep(delay)
+
+        acquired = []
+        try:
+            for cap in caps:
+                await cap.acquire_async()
+                acquired.append(cap)
+        except asyncio.CancelledError:
+            self.release(acquired)
+            raise
+        return caps
+
+    @staticmethod
+    def release(permit):
+        """Free the slots taken for a request."""
+        for cap in permit:
+            cap.release()
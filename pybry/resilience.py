@@ -0,0 +1,209 @@
+"""Retries, deadlines and circuit breaking for the calls to the daemons.
+
+Without them, a call that cannot reach the daemon prints the error and
+returns `(None, None)` immediately. A wrapper given a retry policy,
+a circuit breaker or a deadline handles these failures instead:
+>>> lbry = LbrydApi(retry=RetryPolicy(retries=5), circuit_breaker=CircuitBreaker(), deadline=30)
+
+- The read-only commands are retried after connection errors, timeouts
+  and gateway errors, waiting an exponentially growing, randomized delay
+  between the attempts. Commands that change the state of the daemon
+  are never retried, because the failed attempt may have reached it.
+- The deadline bounds the whole call, retries included; each attempt
+  times out when the deadline is reached.
+- The circuit breaker opens after consecutive failures, and then the calls
+  fail immediately with `CircuitOpenError` instead of waiting for the daemon;
+  after a while a single call is let through to check whether it is back.
+
+When a call cannot succeed, a `DaemonUnavailableError` is raised.
+"""
+import random
+import threading
+import time
+
+import pybry.exception as lbryex
+from pybry import lbryd_spec
+from pybry.constants import LBRYCRD_READ_ONLY_COMMANDS
+
+# HTTP status codes of a daemon, or a proxy in front of it, that is temporarily unavailable
+TRANSIENT_STATUSES = frozenset([502, 503, 504])
+
+
+class RetryPolicy:
+    """When, and after how long, a failed call is made again."""
+
+    def __init__(self, retries=3, backoff=0.1, max_backoff=10.0, jitter=True,
+                 statuses=TRANSIENT_STATUSES, methods=None):
+        """
+        :param int retries: Maximum number of attempts after the first one.
+        :param float backoff: Seconds to wait before the first retry;
+         the delay doubles after each attempt.
+        :param float max_backoff: Maximum number of seconds to wait between two attempts.
+        :param bool jitter: Whether to wait a random delay up to the backoff instead of
+         the backoff itself, so that many clients don't retry at the same time.
+        :param iterable statuses: HTTP status codes of the responses that are retried.
+        :param iterable methods: Methods that are retried; the read-only commands
+         of the `lbrynet` API, and of `lbrycrd`, by default.
+        """
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+
+        if methods is None:
+            methods = lbryd_spec.READ_ONLY | frozenset(LBRYCRD_READ_ONLY_COMMANDS)
+        self.methods = frozenset(methods)
+
+    def is_retryable(self, methods):
+        """Whether a request made of calls to these methods can be sent again.
+
+        :param list methods: The method of a call, or the methods of a batch
+        """
+        return all(method in self.methods for method in methods)
+
+    def delay(self, attempt):
+        """Return the number of seconds to wait after the failure of an attempt.
+
+        :param int attempt: Number of attempts that failed so far
+        """
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+class CircuitBreaker:
+    """Stop calling a daemon that keeps failing, and check from time to time if it is back.
+
+    It can be shared by several wrappers calling the same daemon,
+    and used from several threads.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        """
+        :param int failure_threshold: Number of consecutive failures that open the circuit.
+        :param float reset_timeout: Seconds after which an open circuit lets a call through,
+         to check whether the daemon is back.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """Check that a call may be made.
+
+        :raises CircuitOpenError: If the circuit is open, or if the call
+         checking whether the daemon is back is still in flight
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+
+            remaining = self._opened_at + self.reset_timeout - time.monotonic()
+            if remaining <= 0:
+                # This call checks whether the daemon is back; if it never
+                # completes, another one is let through after the timeout
+                self.state = self.HALF_OPEN
+                self._opened_at = time.monotonic()
+                return
+
+        raise lbryex.CircuitOpenError(f"The daemon is unavailable; retry in {remaining:.1f}s",
+                                      None, None, None)
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+class Attempts:
+    """The attempts of a single request, under the retry policy, circuit breaker and deadline."""
+
+    __slots__ = ("retry", "breaker", "end", "timeout", "retryable", "request", "count")
+
+    def __init__(self, methods, timeout, retry=None, breaker=None, deadline=None, request=None):
+        """
+        :param list methods: The method of the call, or the methods of a batch
+        :param float timeout: Seconds to wait for the response to an attempt
+        :param RetryPolicy retry: The retry policy, if any
+        :param CircuitBreaker breaker: The circuit breaker, if any
+        :param float deadline: Seconds after which the call fails, retries included
+        :param request: The request, given to the exceptions
+        """
+        self.retry = retry
+        self.breaker = breaker
+        self.end = time.monotonic() + deadline if deadline is not None else None
+        self.timeout = timeout
+        self.retryable = retry is not None and retry.is_retryable(methods)
+        self.request = request
+        self.count = 0
+
+    def next_timeout(self):
+        """Return the timeout of the next attempt.
+
+        :raises CircuitOpenError: If the circuit breaker is open
+        :raises DeadlineExceededError: If the deadline has passed
+        """
+        timeout = self.timeout
+        if self.end is not None:
+            remaining = self.end - time.monotonic()
+            if remaining <= 0:
+                raise lbryex.DeadlineExceededError("The deadline of the call has passed",
+                                                   None, None, self.request)
+            timeout = min(timeout, remaining)
+
+        if self.breaker is not None:
+            self.breaker.before_call()
+
+        return timeout
+
+    def is_transient(self, status_code):
+        """Whether a response with this status is a failure of the daemon."""
+        statuses = self.retry.statuses if self.retry is not None else TRANSIENT_STATUSES
+        return status_code in statuses
+
+    def succeeded(self):
+        if self.breaker is not None:
+            self.breaker.record_success()
+
+    def failed_status(self, status_code):
+        """Record an attempt answered with a transient status; see `failed`."""
+        error = lbryex.LBRYError(f"HTTP status {status_code}", None, status_code, self.request)
+        return self.failed(error, status_code)
+
+    def failed(self, error, status_code=None):
+        """Record a failed attempt, and return the number of seconds to wait before the next one.
+
+        :param Exception error: The connection error or timeout, or the description
+         of the transient response
+        :param int status_code: HTTP status code of the transient response
+        :raises DaemonUnavailableError: If the call must not be made again
+        """
+        self.count += 1
+        if self.breaker is not None:
+            self.breaker.record_failure()
+
+        if self.end is not None and time.monotonic() >= self.end:
+            raise lbryex.DeadlineExceededError("The deadline of the call passed before it succeeded",
+                                               None, status_code, self.request) from error
+
+        if not self.retryable or self.count > self.retry.retries:
+            raise lbryex.DaemonUnavailableError(f"The daemon could not be reached: {error}",
+                                                None, status_code, self.request) from error
+
+        delay = self.retry.delay(self.count)
+        if self.end is not None and time.monotonic() + delay >= self.end:
+            raise lbryex.DeadlineExceededError("The deadline of the call passed before it succeeded",
+                                               None, status_code, self.request) from error
+        return delay
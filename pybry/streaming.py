@@ -0,0 +1,452 @@
+"""Stream the content of claims from the streaming server of the daemon.
+
+`get` and `file_list` describe a stream with its `streaming_url`, where
+the daemon serves its content over HTTP with range requests. A `ContentStream`
+reads it from there in chunks, over the pooled connections of the wrapper,
+so large files are never held in memory:
+>>> stream = lbry.stream("lbry://@channel#1/video#2")
+>>> with open("video.mp4", "wb") as video:
+...     stream.copy_to(video)
+
+The chunks can also be iterated, from any offset, for example to answer
+the range requests of a video player, or read through a seekable file object:
+>>> for chunk in stream.iter_content(start=1024 * 1024):
+...     send(chunk)
+>>> video = stream.open()
+>>> video.seek(-128, io.SEEK_END)
+
+When the connection is lost in the middle of a stream, the reading resumes
+where it stopped with another range request, up to `resume` times in a row.
+`AsyncContentStream` does the same for the asynchronous wrappers.
+"""
+import asyncio
+import inspect
+import io
+
+import requests
+import urllib3
+
+import pybry.exception as lbryex
+
+# Size of the chunks yielded when iterating over a stream
+CHUNK_SIZE = 64 * 1024
+
+# Size of the buffer through which `copy_to` writes a stream
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Errors after which the reading of a stream is resumed
+RESUMABLE_ERRORS = (requests.RequestException, urllib3.exceptions.HTTPError, OSError)
+
+
+def streaming_url(value):
+    """Return the URL from which the content of a file can be streamed.
+
+    :param value: The result of `get`, an item of `file_list`, or the value
+     returned by these calls in any result mode, with or without models
+    :raises LBRYError: If the daemon did not return a URL, for example
+     because the claim could not be resolved
+    :rtype: str
+    """
+    if isinstance(value, tuple):
+        value = value[0]
+
+    url = value.get("streaming_url") if value is not None else None
+    if not url:
+        error = value.get("error") if value is not None else "no result"
+        raise lbryex.LBRYError(f"The content cannot be streamed: {error}", value, None, None)
+    return url
+
+
+def parse_content_range(header):
+    """Return the first and last byte, and the total size, of a `Content-Range` header.
+
+    The total size is None if it is unknown; None is returned for an invalid header.
+
+    :param str header: A header like "bytes 0-1023/4096"
+    :rtype: tuple
+    """
+    try:
+        unit, _, value = header.partition(" ")
+        interval, _, total = value.partition("/")
+        first, _, last = interval.partition("-")
+        if unit != "bytes":
+            return None
+        return int(first), int(last), None if total == "*" else int(total)
+    except (AttributeError, ValueError):
+        return None
+
+
+def finish_response(response, eof=False):
+    """Return the connection of a streamed `requests.Response` to the pool if its body was read whole,
+    or close it otherwise, since the rest of the body would be read by the next request.
+
+    :param bool eof: Whether the end of the body was read
+    """
+    if eof or getattr(response.raw, "length_remaining", None) == 0:
+        response.raw.release_conn()
+    else:
+        response.close()
+
+
+def range_header(start, end):
+    """Return the `Range` header of the bytes from `start` up to `end`, excluded, or None."""
+    if not start and end is None:
+        return None
+    return f"bytes={start}-" + ("" if end is None else str(end - 1))
+
+
+class ContentStream:
+    """The content of a file, read from the streaming server of the daemon with range requests."""
+
+    def __init__(self, session, url, size=None, mime_type=None, timeout=600, resume=3):
+        """
+        :param requests.Session session: Pooled session used for the requests
+        :param str url: The `streaming_url` of the file
+        :param int size: Size of the content in bytes, if it is known;
+         it is updated from the responses of the server
+        :param str mime_type: MIME type of the content
+        :param float timeout: Seconds to wait for the server to send more data
+        :param int resume: Number of times in a row the reading is resumed after an error
+        """
+        self.session = session
+        self.url = url
+        self.size = size
+        self.mime_type = mime_type
+        self.timeout = timeout
+        self.resume = resume
+
+    def _request(self, start, end):
+        """Request the content from `start` up to `end`, excluded.
+
+        :return: The streamed response, positioned at `start`, or None if `start` is past the end
+        """
+        headers = {"Accept-Encoding": "identity"}
+        requested = range_header(start, end)
+        if requested is not None:
+            headers["Range"] = requested
+
+        response = self.session.get(self.url, headers=headers, stream=True, timeout=self.timeout)
+
+        if response.status_code == 416:
+            response.close()
+            return None
+
+        if response.status_code not in (200, 206):
+            response.close()
+            raise lbryex.LBRYError(f"Cannot stream {self.url}: HTTP status {response.status_code}",
+                                   None, response.status_code, response.request)
+
+        self.mime_type = response.headers.get("Content-Type", self.mime_type)
+        content_range = parse_content_range(response.headers.get("Content-Range"))
+
+        if response.status_code == 206 and content_range is not None:
+            if content_range[2] is not None:
+                self.size = content_range[2]
+        else:
+            length = response.headers.get("Content-Length")
+            if length is not None and length.isdigit():
+                self.size = int(length)
+            # The server sent the whole content; skip what comes before `start`
+            skip = bytearray(min(start, COPY_BUFFER_SIZE))
+            while start > 0:
+                read = response.raw.readinto(memoryview(skip)[:start])
+                if not read:
+                    break
+                start -= read
+
+        return response
+
+    def _read(self, buffer, start, end):
+        """Read the content from `start` up to `end`, excluded, into `buffer`, chunk by chunk.
+
+        :return: Generator of the number of bytes read into `buffer` for each chunk
+        """
+        position, failures = start, 0
+
+        while end is None or position < end:
+            response, eof = None, False
+            try:
+                response = self._request(position, end)
+                if response is None:
+                    return
+
+                readinto = response.raw.readinto
+                while end is None or position < end:
+                    view = memoryview(buffer)
+                    if end is not None and end - position < len(view):
+                        view = view[:end - position]
+
+                    read = readinto(view)
+                    if not read:
+                        eof = True
+                        break
+                    position += read
+                    failures = 0
+                    yield read
+
+                # Finished, unless the server closed the connection before the end
+                if self.size is None or position >= min(self.size, end if end is not None else self.size):
+                    return
+                raise requests.ConnectionError(f"The connection closed at byte {position} of {self.size}")
+
+            except RESUMABLE_ERRORS as error:
+                failures += 1
+                if failures > self.resume:
+                    raise lbryex.DaemonUnavailableError(f"Cannot stream {self.url}: {error}",
+                                                        None, None, None) from error
+            finally:
+                if response is not None:
+                    finish_response(response, eof)
+
+    def get_size(self):
+        """Return the size of the content, requesting its first byte if it is not known yet.
+
+        :rtype: int
+        """
+        if self.size is None:
+            response = self._request(0, 1)
+            if response is not None:
+                response.close()
+        return self.size
+
+    def iter_content(self, chunk_size=CHUNK_SIZE, start=0, end=None, reuse_buffer=False):
+        """Yield the content from `start` up to `end`, excluded, in chunks.
+
+        :param int chunk_size: Maximum size of a chunk in bytes
+        :param int start: Offset of the first byte
+        :param int end: Offset after the last byte; the end of the content by default
+        :param bool reuse_buffer: Whether the chunks are `memoryview` objects of a single buffer,
+         overwritten by the next chunk, instead of new `bytes` objects
+        :raises DaemonUnavailableError: If the reading cannot be resumed after an error
+        :return: Generator of the chunks
+        """
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        for read in self._read(buffer, start, end):
+            yield view[:read] if reuse_buffer else bytes(view[:read])
+
+    def copy_to(self, fileobj, start=0, end=None, buffer_size=COPY_BUFFER_SIZE):
+        """Write the content from `start` up to `end`, excluded, to a file object.
+
+        The content is read into a single buffer, which is written as it is,
+        so no other copy of it is made.
+
+        :param fileobj: Object with a `write` method accepting a `memoryview`
+        :param int start: Offset of the first byte
+        :param int end: Offset after the last byte; the end of the content by default
+        :param int buffer_size: Size of the buffer in bytes
+        :raises DaemonUnavailableError: If the reading cannot be resumed after an error
+        :return: Number of bytes written
+        :rtype: int
+        """
+        buffer = bytearray(buffer_size)
+        view = memoryview(buffer)
+        written = 0
+        for read in self._read(buffer, start, end):
+            fileobj.write(view[:read])
+            written += read
+        return written
+
+    def open(self, buffer_size=CHUNK_SIZE):
+        """Return a seekable, read-only binary file object of the content.
+
+        :param int buffer_size: Size of the read buffer; without buffering if 0
+        :rtype: io.BufferedReader
+        """
+        raw = StreamReader(self)
+        return io.BufferedReader(raw, buffer_size) if buffer_size else raw
+
+
+class StreamReader(io.RawIOBase):
+    """Seekable raw file object of a `ContentStream`; a seek starts another range request."""
+
+    def __init__(self, stream):
+        super().__init__()
+        self.stream = stream
+        self.position = 0
+        self._response = None
+        self._readinto = None
+        # Whether the end of the body of the response was read
+        self._eof = False
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += self.stream.get_size()
+        elif whence != io.SEEK_SET:
+            raise ValueError(f"Invalid whence ({whence})")
+
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        if offset != self.position:
+            self._close_response()
+            self.position = offset
+        return self.position
+
+    def readinto(self, buffer):
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+        for _ in range(self.stream.resume + 1):
+            try:
+                if self._response is None:
+                    self._response = self.stream._request(self.position, None)
+                    if self._response is None:
+                        return 0
+                    self._readinto = self._response.raw.readinto
+                read = self._readinto(buffer)
+                if not read:
+                    self._eof = True
+                self.position += read
+                return read
+            except RESUMABLE_ERRORS as error:
+                self._close_response()
+                last_error = error
+
+        raise lbryex.DaemonUnavailableError(f"Cannot stream {self.stream.url}: {last_error}",
+                                            None, None, None) from last_error
+
+    def _close_response(self):
+        if self._response is not None:
+            finish_response(self._response, self._eof)
+            self._response = None
+            self._eof = False
+
+    def close(self):
+        self._close_response()
+        super().close()
+
+
+class AsyncContentStream:
+    """Asynchronous version of `ContentStream`, reading the content with `aiohttp`."""
+
+    def __init__(self, session, url, size=None, mime_type=None, timeout=600, resume=3):
+        """
+        :param aiohttp.ClientSession session: Pooled session used for the requests
+        :param str url: The `streaming_url` of the file
+        :param int size: Size of the content in bytes, if it is known;
+         it is updated from the responses of the server
+        :param str mime_type: MIME type of the content
+        :param float timeout: Seconds to wait for the server to send more data
+        :param int resume: Number of times in a row the reading is resumed after an error
+        """
+        self.session = session
+        self.url = url
+        self.size = size
+        self.mime_type = mime_type
+        self.timeout = timeout
+        self.resume = resume
+
+    async def _request(self, start, end):
+        """Asynchronous version of `ContentStream._request`."""
+        import aiohttp
+
+        headers = {"Accept-Encoding": "identity"}
+        requested = range_header(start, end)
+        if requested is not None:
+            headers["Range"] = requested
+
+        # A stream may take longer than the timeout; only the waits for data are bounded
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=self.timeout, sock_read=self.timeout)
+        response = await self.session.get(self.url, headers=headers, timeout=timeout,
+                                          auto_decompress=False)
+
+        if response.status == 416:
+            response.release()
+            return None
+
+        if response.status not in (200, 206):
+            response.release()
+            raise lbryex.LBRYError(f"Cannot stream {self.url}: HTTP status {response.status}",
+                                   None, response.status, None)
+
+        self.mime_type = response.headers.get("Content-Type", self.mime_type)
+        content_range = parse_content_range(response.headers.get("Content-Range"))
+
+        if response.status == 206 and content_range is not None:
+            if content_range[2] is not None:
+                self.size = content_range[2]
+        else:
+            if response.content_length is not None:
+                self.size = response.content_length
+            # The server sent the whole content; skip what comes before `start`
+            while start > 0:
+                skipped = await response.content.read(min(start, COPY_BUFFER_SIZE))
+                if not skipped:
+                    break
+                start -= len(skipped)
+
+        return response
+
+    async def iter_content(self, chunk_size=CHUNK_SIZE, start=0, end=None):
+        """Yield the content from `start` up to `end`, excluded, in chunks of `bytes`.
+
+        :param int chunk_size: Maximum size of a chunk in bytes
+        :param int start: Offset of the first byte
+        :param int end: Offset after the last byte; the end of the content by default
+        :raises DaemonUnavailableError: If the reading cannot be resumed after an error
+        :return: Asynchronous generator of the chunks
+        """
+        import aiohttp
+
+        position, failures = start, 0
+
+        while end is None or position < end:
+            response = None
+            try:
+                response = await self._request(position, end)
+                if response is None:
+                    return
+
+                while end is None or position < end:
+                    size = chunk_size if end is None else min(chunk_size, end - position)
+                    chunk = await response.content.read(size)
+                    if not chunk:
+                        break
+                    position += len(chunk)
+                    failures = 0
+                    yield chunk
+
+                # Finished, unless the server closed the connection before the end
+                if self.size is None or position >= min(self.size, end if end is not None else self.size):
+                    return
+                raise aiohttp.ClientPayloadError(f"The connection closed at byte {position} of {self.size}")
+
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as error:
+                failures += 1
+                if failures > self.resume:
+                    raise lbryex.DaemonUnavailableError(f"Cannot stream {self.url}: {error}",
+                                                        None, None, None) from error
+            finally:
+                if response is not None:
+                    response.release()
+
+    async def copy_to(self, fileobj, start=0, end=None, buffer_size=COPY_BUFFER_SIZE):
+        """Write the content from `start` up to `end`, excluded, to a file object.
+
+        :param fileobj: Object with a `write` method, which may be a coroutine,
+         like the one of an `aiohttp.web.StreamResponse`
+        :param int start: Offset of the first byte
+        :param int end: Offset after the last byte; the end of the content by default
+        :param int buffer_size: Maximum size of the chunks written
+        :raises DaemonUnavailableError: If the reading cannot be resumed after an error
+        :return: Number of bytes written
+        :rtype: int
+        """
+        written = 0
+        async for chunk in self.iter_content(buffer_size, start, end):
+            result = fileobj.write(chunk)
+            if inspect.isawaitable(result):
+                await result
+            written += len(chunk)
+        return written
@@ -0,0 +1,545 @@
+"""Local index of the transaction outputs and transactions of a wallet.
+
+Listing the whole history of a wallet with `txo_list` and `transaction_list`
+takes longer as the history grows, and keeps the daemon busy. A `TxoIndex`
+keeps them in a SQLite database instead, and syncs it incrementally:
+each sync only requests the pages newer than the height it reached before,
+so the reports are answered by indexed local queries.
+>>> with TxoIndex(LbrydApi(), "wallet.db") as index:
+...     index.sync()
+...     supports = index.txos(type="support", min_height=900000)
+...     balance = index.sum_amount(is_spent=False, is_mine=True)
+
+The daemon lists the newest transactions first, so a sync stops at the first
+item below the height of the last sync, less `reorg_depth` blocks which are
+requested again in case of a reorganization of the chain. The unconfirmed
+items are replaced at every sync. Outputs spent since the last sync are found
+with `txo_list` filtered on the unspent outputs of the wallet, claims and supports
+included, whose size is that of the unspent outputs, not of the history.
+Each page is written to a temporary staging table as it is received, so the
+history is not held in memory and the database is only locked while a page is
+written; the staged items replace those of the index in a single transaction
+once every page of a command is received.
+
+The items are returned as they were received from the daemon at the time
+of the sync, so their `confirmations` are those of that time.
+"""
+import asyncio
+import functools
+import itertools
+import json
+import sqlite3
+import threading
+import time
+from decimal import Decimal
+
+from pybry.fanout import chunked
+from pybry.model import Model
+from pybry import lbryd_api
+
+# Dewies in a LBC, the unit of the amounts in the index
+COIN = 10 ** 8
+
+# Parameters of `txo_list` listing every unspent output of the wallet;
+# `utxo_list` leaves out the claims, the supports and the reposts
+UNSPENT_PARAMS = {"is_not_spent": True, "is_my_output": True, "no_totals": True}
+
+# Version of `SCHEMA`; the index of an older version is rebuilt by the next sync
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS txo (
+    wallet_id TEXT NOT NULL,
+    account_id TEXT NOT NULL,
+    txid TEXT NOT NULL,
+    nout INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    timestamp INTEGER,
+    type TEXT,
+    claim_id TEXT,
+    name TEXT,
+    amount INTEGER NOT NULL,
+    is_spent INTEGER,
+    is_mine INTEGER,
+    item TEXT NOT NULL,
+    PRIMARY KEY (wallet_id, account_id, txid, nout)
+);
+-- The amounts are in the indexes, so they are summed without reading the rows
+CREATE INDEX IF NOT EXISTS txo_height ON txo (height, amount);
+CREATE INDEX IF NOT EXISTS txo_type ON txo (type, height, amount);
+CREATE INDEX IF NOT EXISTS txo_claim ON txo (claim_id, height);
+CREATE INDEX IF NOT EXISTS txo_amount ON txo (amount);
+
+CREATE TABLE IF NOT EXISTS tx (
+    wallet_id TEXT NOT NULL,
+    account_id TEXT NOT NULL,
+    txid TEXT NOT NULL,
+    height INTEGER NOT NULL,
+    timestamp INTEGER,
+    item TEXT NOT NULL,
+    PRIMARY KEY (wallet_id, account_id, txid)
+);
+CREATE INDEX IF NOT EXISTS tx_height ON tx (height);
+CREATE INDEX IF NOT EXISTS tx_timestamp ON tx (timestamp);
+
+CREATE TABLE IF NOT EXISTS sync (
+    command TEXT NOT NULL,
+    wallet_id TEXT NOT NULL,
+    account_id TEXT NOT NULL,
+    height INTEGER,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (command, wallet_id, account_id)
+);
+"""
+
+# Temporary tables of the connection, where the pages of a sync are written as they are received,
+# before they are moved to the index at the end of the sync
+STAGING_SCHEMA = """
+CREATE TEMP TABLE IF NOT EXISTS staged_txo AS SELECT 0 AS sync_id, * FROM main.txo WHERE 0;
+CREATE TEMP TABLE IF NOT EXISTS staged_tx AS SELECT 0 AS sync_id, * FROM main.tx WHERE 0;
+CREATE TEMP TABLE IF NOT EXISTS staged_utxo (
+    sync_id INTEGER NOT NULL,
+    txid TEXT NOT NULL,
+    nout INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS temp.staged_utxo_outpoint ON staged_utxo (sync_id, txid, nout);
+"""
+
+
+def to_dewies(amount):
+    """Return an amount in LBC, as a decimal string or a number, in dewies.
+
+    :param str | int | float | Decimal amount: The amount in LBC
+    :rtype: int
+    """
+    if amount is None or amount == "":
+        return 0
+    return int(Decimal(str(amount)) * COIN)
+
+
+def txo_row(wallet_id, account_id, item):
+    """Return the row of the `txo` table of a TXO returned by `txo_list`."""
+    return (wallet_id, account_id, item["txid"], int(item.get("nout") or 0), int(item.get("height") or 0),
+            item.get("timestamp"), item.get("type"), item.get("claim_id"), item.get("name"),
+            to_dewies(item.get("amount")), _flag(item.get("is_spent")), _flag(item.get("is_mine")),
+            json.dumps(item, separators=(",", ":")))
+
+
+def tx_row(wallet_id, account_id, item):
+    """Return the row of the `tx` table of a transaction returned by `transaction_list`."""
+    return (wallet_id, account_id, item["txid"], int(item.get("height") or 0), item.get("timestamp"),
+            json.dumps(item, separators=(",", ":")))
+
+
+# Table, columns and row function of the items of each command
+TABLES = {
+    "txo_list": ("txo", "wallet_id, account_id, txid, nout, height, timestamp, type, claim_id, name, "
+                        "amount, is_spent, is_mine, item", txo_row),
+    "transaction_list": ("tx", "wallet_id, account_id, txid, height, timestamp, item", tx_row),
+}
+
+
+def _flag(value):
+    return None if value is None else int(bool(value))
+
+
+def _in(column, values, where, args):
+    """Add the condition that `column` is one of `values`, a single value or a list."""
+    if values is None:
+        return
+    if isinstance(values, (list, tuple, set)):
+        values = list(values)
+        where.append(f"{column} IN ({', '.join('?' * len(values))})")
+        args.extend(values)
+    else:
+        where.append(f"{column} = ?")
+        args.append(values)
+
+
+class TxoIndex:
+    """SQLite index of the TXOs and transactions of a wallet, synced incrementally from the daemon."""
+
+    def __init__(self, api, path=":memory:", page_size=500, reorg_depth=6, track_spent=True):
+        """
+        :param LbrydApi api: The wrapper the daemon is called with
+        :param str path: Path of the database file; in memory by default
+        :param int page_size: Number of items requested in each page
+        :param int reorg_depth: Number of blocks below the height of the last sync
+         that are requested again, in case of a reorganization of the chain
+        :param bool track_spent: Whether every sync marks the outputs spent since the last one,
+         with the unspent outputs listed by `txo_list`
+        """
+        self.api = api
+        self.path = path
+        self.page_size = page_size
+        self.reorg_depth = reorg_depth
+        self.track_spent = track_spent
+
+        self._lock = threading.RLock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        # The index can be synced again, so it doesn't wait for every commit to reach the disk
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        if self.connection.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            self.connection.executescript("DROP TABLE IF EXISTS txo; DROP TABLE IF EXISTS tx; "
+                                          "DROP TABLE IF EXISTS sync;")
+        self.connection.executescript(SCHEMA)
+        self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.connection.executescript(STAGING_SCHEMA)
+        # Identifies the staged rows of each sync, so several accounts can be synced at the same time
+        self._sync_ids = itertools.count()
+
+    def close(self):
+        """Close the database."""
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # Sync
+
+    def _url(self):
+        # Looked up at every sync, so the address can be changed after the import
+        return lbryd_api.SERVER_ADDRESS
+
+    def _iter_pages(self, method, params, prefetch):
+        for item in self.api.iter_pages(self._url(), method, params, timeout=self.api.timeout,
+                                        prefetch=prefetch):
+            yield item.to_dict() if isinstance(item, Model) else item
+
+    def _pages(self, method, params, prefetch, floor=None):
+        """Yield the items of every page, newest first, until one is confirmed at or below `floor`,
+        in lists of `page_size` items."""
+        return chunked(self._newer(self._iter_pages(method, params, prefetch), floor), self.page_size)
+
+    def _write(self, write, *args):
+        """Call a method writing to the database, holding the lock of the connection."""
+        with self._lock:
+            return write(*args)
+
+    def sync(self, account_id=None, wallet_id=None):
+        """Request the TXOs and transactions added since the last sync, and store them.
+
+        The first sync of an account requests its whole history. Each page
+        is written to a staging table as it is received, so the database is only
+        locked while a page is written, and the history is not held in memory.
+
+        :param str account_id: Account to sync; the default account by default
+        :param str wallet_id: Wallet of the account; the default wallet by default
+        :raises LBRYError: If a page cannot be requested; the items of that command are not stored then
+        :return: Number of TXOs and transactions received, and of TXOs marked as spent
+        :rtype: dict
+        """
+        params = {"account_id": account_id, "wallet_id": wallet_id, "page_size": self.page_size}
+        # The default wallet and account are stored as ""
+        key = (wallet_id or "", account_id or "")
+        sync_id = next(self._sync_ids)
+
+        counts = {}
+        try:
+            for name, command, command_params in self._commands(params):
+                floor = self._floor(command, key)
+                counts[name] = 0
+                for items in self._pages(command, command_params, floor is None, floor):
+                    counts[name] += self._write(self._stage, sync_id, command, key, items)
+                self._write(self._store, sync_id, command, key, floor)
+
+            if self.track_spent:
+                for items in self._pages("txo_list", dict(params, **UNSPENT_PARAMS), True):
+                    self._write(self._stage_unspent, sync_id, items)
+                counts["spent"] = self._write(self._mark_spent, sync_id, key)
+        finally:
+            self._write(self._unstage, sync_id)
+        return counts
+
+    @staticmethod
+    def _commands(params):
+        """Return the name of the count, the command and the parameters of each list that is synced."""
+        return (("txos", "txo_list", dict(params, no_totals=True)),
+                ("transactions", "transaction_list", params))
+
+    def _floor(self, command, key):
+        """Return the height from which the items are requested again, or None for all of them."""
+        row = self.connection.execute("SELECT height FROM sync WHERE command = ? AND wallet_id = ? "
+                                      "AND account_id = ?", (command,) + key).fetchone()
+        if row is None:
+            return None
+        return (row[0] or 0) - self.reorg_depth
+
+    @staticmethod
+    def _newer(items, floor):
+        """Yield the items newest first, until one is confirmed at or below `floor`."""
+        for item in items:
+            height = item.get("height") or 0
+            if floor is not None and 0 < height <= floor:
+                return
+            yield item
+
+    def _stage(self, sync_id, command, key, items):
+        """Write a page of items of `command` to its staging table, and return their number."""
+        table, columns, make_row = TABLES[command]
+        values = ", ".join("?" * (columns.count(",") + 2))
+        with self.connection:
+            self.connection.executemany(f"INSERT INTO staged_{table} (sync_id, {columns}) VALUES ({values})",
+                                        ((sync_id,) + make_row(*key, item) for item in items))
+        return len(items)
+
+    def _store(self, sync_id, command, key, floor):
+        """Replace the items above `floor`, and the unconfirmed ones, with the staged items."""
+        table, columns, _ = TABLES[command]
+
+        # A single transaction, so a failed sync leaves the index as it was
+        with self.connection:
+            if floor is None:
+                self.connection.execute(f"DELETE FROM {table} WHERE wallet_id = ? AND account_id = ?", key)
+            else:
+                self.connection.execute(f"DELETE FROM {table} WHERE wallet_id = ? AND account_id = ? "
+                                        f"AND (height > ? OR height <= 0)", key + (floor,))
+
+            self.connection.execute(f"INSERT OR REPLACE INTO {table} ({columns}) "
+                                    f"SELECT {columns} FROM staged_{table} WHERE sync_id = ?", (sync_id,))
+            self.connection.execute(f"DELETE FROM staged_{table} WHERE sync_id = ?", (sync_id,))
+
+            height = self.connection.execute(f"SELECT MAX(height) FROM {table} "
+                                             f"WHERE wallet_id = ? AND account_id = ?", key).fetchone()[0]
+            self.connection.execute("INSERT OR REPLACE INTO sync (command, wallet_id, account_id, height, "
+                                    "synced_at) VALUES (?, ?, ?, ?, ?)", (command,) + key + (height, time.time()))
+
+    def _stage_unspent(self, sync_id, items):
+        """Write a page of the unspent outputs of the account to the staging table."""
+        with self.connection:
+            self.connection.executemany("INSERT INTO staged_utxo (sync_id, txid, nout) VALUES (?, ?, ?)",
+                                        ((sync_id, item["txid"], int(item.get("nout") or 0)) for item in items))
+
+    def _mark_spent(self, sync_id, key):
+        """Mark as spent the outputs of the account that are not staged as unspent, and unspent the others.
+
+        :return: Number of outputs newly marked as spent
+        """
+        unspent = ("SELECT 1 FROM staged_utxo WHERE staged_utxo.sync_id = ? "
+                   "AND staged_utxo.txid = txo.txid AND staged_utxo.nout = txo.nout")
+        with self.connection:
+            spent = self.connection.execute(
+                "UPDATE txo SET is_spent = 1 WHERE wallet_id = ? AND account_id = ? AND is_mine = 1 "
+                f"AND is_spent IS NOT 1 AND NOT EXISTS ({unspent})", key + (sync_id,)).rowcount
+            self.connection.execute(
+                "UPDATE txo SET is_spent = 0 WHERE wallet_id = ? AND account_id = ? AND is_spent IS NOT 0 "
+                f"AND EXISTS ({unspent})", key + (sync_id,))
+            self.connection.execute("DELETE FROM staged_utxo WHERE sync_id = ?", (sync_id,))
+        return spent
+
+    def _unstage(self, sync_id):
+        """Delete the rows staged by a sync that failed."""
+        with self.connection:
+            for table in ("staged_txo", "staged_tx", "staged_utxo"):
+                self.connection.execute(f"DELETE FROM {table} WHERE sync_id = ?", (sync_id,))
+
+    def synced_height(self, account_id=None, wallet_id=None):
+        """Return the highest block of the TXOs of an account at its last sync, or None if it was never synced.
+
+        :rtype: int
+        """
+        row = self.connection.execute("SELECT height FROM sync WHERE command = 'txo_list' AND wallet_id = ? "
+                                      "AND account_id = ?", (wallet_id or "", account_id or "")).fetchone()
+        return None if row is None else row[0]
+
+    # Queries
+
+    @staticmethod
+    def _txo_where(account_id=None, type=None, claim_id=None, name=None, txid=None,
+                   min_height=None, max_height=None, min_amount=None, max_amount=None,
+                   is_spent=None, is_mine=None, wallet_id=None):
+        where, args = [], []
+        _in("wallet_id", wallet_id, where, args)
+        _in("account_id", account_id, where, args)
+        _in("type", type, where, args)
+        _in("claim_id", claim_id, where, args)
+        _in("name", name, where, args)
+        _in("txid", txid, where, args)
+        if min_height is not None:
+            where.append("height >= ?")
+            args.append(min_height)
+        if max_height is not None:
+            where.append("height <= ?")
+            args.append(max_height)
+        if min_amount is not None:
+            where.append("amount >= ?")
+            args.append(to_dewies(min_amount))
+        if max_amount is not None:
+            where.append("amount <= ?")
+            args.append(to_dewies(max_amount))
+        if is_spent is not None:
+            where.append("is_spent = ?")
+            args.append(int(bool(is_spent)))
+        if is_mine is not None:
+            where.append("is_mine = ?")
+            args.append(int(bool(is_mine)))
+        return (" WHERE " + " AND ".join(where)) if where else "", args
+
+    def txos(self, account_id=None, type=None, claim_id=None, name=None, txid=None,
+             min_height=None, max_height=None, min_amount=None, max_amount=None,
+             is_spent=None, is_mine=None, order_by="height", limit=None, offset=0, wallet_id=None):
+        """Return the indexed TXOs matching all the given conditions, as returned by `txo_list`.
+
+        The account is the default one with `account_id=""`, and any account if None;
+        the same goes for the wallet and `wallet_id`.
+
+        :param str | list account_id: Account, or accounts, of the outputs
+        :param str | list type: Type, or types, such as "stream", "channel" or "support"
+        :param str | list claim_id: Claim id, or ids
+        :param str | list name: Claim name, or names
+        :param str | list txid: Transaction id, or ids
+        :param int min_height: Lowest block height, included
+        :param int max_height: Highest block height, included
+        :param str | Decimal min_amount: Lowest amount in LBC, included
+        :param str | Decimal max_amount: Highest amount in LBC, included
+        :param bool is_spent: Whether the outputs are spent
+        :param bool is_mine: Whether the outputs belong to the wallet
+        :param str order_by: "height" for the newest first, "amount" for the largest first, or None
+        :param int limit: Maximum number of outputs returned
+        :param int offset: Number of matching outputs skipped
+        :param str | list wallet_id: Wallet, or wallets, of the outputs
+        :rtype: list
+        """
+        where, args = self._txo_where(account_id, type, claim_id, name, txid, min_height, max_height,
+                                      min_amount, max_amount, is_spent, is_mine, wallet_id)
+        query = "SELECT item, is_spent FROM txo" + where + self._order_limit(order_by, limit, offset, args)
+
+        with self._lock:
+            rows = self.connection.execute(query, args).fetchall()
+
+        txos = []
+        for item, spent in rows:
+            item = json.loads(item)
+            # Updated by the syncs after the one that received the item
+            if spent is not None:
+                item["is_spent"] = bool(spent)
+            txos.append(item)
+        return txos
+
+    def sum_amount(self, account_id=None, type=None, claim_id=None, name=None, txid=None,
+                   min_height=None, max_height=None, min_amount=None, max_amount=None,
+                   is_spent=None, is_mine=None, wallet_id=None):
+        """Return the total amount, in LBC, of the indexed TXOs matching the conditions of `txos`.
+
+        :rtype: Decimal
+        """
+        where, args = self._txo_where(account_id, type, claim_id, name, txid, min_height, max_height,
+                                      min_amount, max_amount, is_spent, is_mine, wallet_id)
+        with self._lock:
+            total = self.connection.execute("SELECT SUM(amount) FROM txo" + where, args).fetchone()[0]
+        return Decimal(total or 0) / COIN
+
+    def count(self, **conditions):
+        """Return the number of indexed TXOs matching the conditions of `txos`.
+
+        :rtype: int
+        """
+        where, args = self._txo_where(**conditions)
+        with self._lock:
+            return self.connection.execute("SELECT COUNT(*) FROM txo" + where, args).fetchone()[0]
+
+    def transactions(self, account_id=None, txid=None, min_height=None, max_height=None,
+                     since=None, until=None, limit=None, offset=0, wallet_id=None):
+        """Return the indexed transactions, newest first, as returned by `transaction_list`.
+
+        :param str | list account_id: Account, or accounts, of the transactions; any account if None
+        :param str | list txid: Transaction id, or ids
+        :param int min_height: Lowest block height, included
+        :param int max_height: Highest block height, included
+        :param int since: Earliest timestamp, included
+        :param int until: Latest timestamp, excluded
+        :param int limit: Maximum number of transactions returned
+        :param int offset: Number of matching transactions skipped
+        :param str | list wallet_id: Wallet, or wallets, of the transactions; any wallet if None
+        :rtype: list
+        """
+        where, args = [], []
+        _in("wallet_id", wallet_id, where, args)
+        _in("account_id", account_id, where, args)
+        _in("txid", txid, where, args)
+        for condition, value in (("height >= ?", min_height), ("height <= ?", max_height),
+                                 ("timestamp >= ?", since), ("timestamp < ?", until)):
+            if value is not None:
+                where.append(condition)
+                args.append(value)
+
+        query = "SELECT item FROM tx" + ((" WHERE " + " AND ".join(where)) if where else "")
+        query += self._order_limit("height", limit, offset, args)
+
+        with self._lock:
+            return [json.loads(item) for (item,) in self.connection.execute(query, args)]
+
+    @staticmethod
+    def _order_limit(order_by, limit, offset, args):
+        if order_by == "height":
+            # Unconfirmed first, like the daemon
+            clause = " ORDER BY height <= 0 DESC, height DESC"
+        elif order_by == "amount":
+            clause = " ORDER BY amount DESC"
+        elif order_by is None:
+            clause = ""
+        else:
+            raise ValueError(f"Invalid order_by ({order_by!r}); expected 'height', 'amount' or None")
+
+        if limit is not None or offset:
+            clause += " LIMIT ? OFFSET ?"
+            args.extend([-1 if limit is None else limit, offset])
+        return clause
+
+
+class AsyncTxoIndex(TxoIndex):
+    """`TxoIndex` synced with an `AsyncLbrydApi`; `sync` is a coroutine, and the queries are the same."""
+
+    def _url(self):
+        from pybry import async_lbryd_api
+        return async_lbryd_api.SERVER_ADDRESS
+
+    async def _pages(self, method, params, prefetch, floor=None):
+        items = []
+        async for item in self.api.iter_pages(self._url(), method, params, timeout=self.api.timeout,
+                                              prefetch=prefetch):
+            item = item.to_dict() if isinstance(item, Model) else item
+            height = item.get("height") or 0
+            if floor is not None and 0 < height <= floor:
+                break
+            items.append(item)
+            if len(items) >= self.page_size:
+                yield items
+                items = []
+        if items:
+            yield items
+
+    async def _write(self, write, *args):
+        # The writes block, so they are made in a thread instead of the event loop
+        return await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(TxoIndex._write, self, write, *args))
+
+    async def sync(self, account_id=None, wallet_id=None):
+        """Request the TXOs and transactions added since the last sync, and store them.
+
+        The arguments and the result are the same as in `TxoIndex.sync`.
+        """
+        params = {"account_id": account_id, "wallet_id": wallet_id, "page_size": self.page_size}
+        key = (wallet_id or "", account_id or "")
+        sync_id = next(self._sync_ids)
+
+        counts = {}
+        try:
+            for name, command, command_params in self._commands(params):
+                floor = self._floor(command, key)
+                counts[name] = 0
+                async for items in self._pages(command, command_params, floor is None, floor):
+                    counts[name] += await self._write(self._stage, sync_id, command, key, items)
+                await self._write(self._store, sync_id, command, key, floor)
+
+            if self.track_spent:
+                async for items in self._pages("txo_list", dict(params, **UNSPENT_PARAMS), True):
+                    await self._write(self._stage_unspent, sync_id, items)
+                counts["spent"] = await self._write(self._mark_spent, sync_id, key)
+        finally:
+            await self._write(self._unstage, sync_id)
+        return counts
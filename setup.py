@@ -52,6 +52,9 @@ setup(
     long_description=long_description,
     long_description_content_type='text/markdown',
     requires=['yapf'],
+    extras_require={'async': ['aiohttp'],
+                    'fast': ['orjson'],
+                    'tracing': ['opentelemetry-api']},
     python_requires='>=3',
     cmdclass={'build_py': GenerateAPILocalJSON,
               'build_local': GenerateAPILocalJSON,
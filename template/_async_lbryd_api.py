@@ -0,0 +1,83 @@
+from pybry.async_base_api import AsyncBaseApi
+from pybry.callplan import CallPlans
+from pybry.constants import LBRYD_SERVER_ADDRESS as SERVER_ADDRESS
+from pybry.streaming import AsyncContentStream, streaming_url
+
+
+class AsyncLbrydApi(AsyncBaseApi):
+
+    def __init__(self, timeout=600, **options):
+        """
+        Asynchronous LBRY daemon wrapper.
+
+        Initialize this class inside a coroutine, and await its methods.
+        >>> async with AsyncLbrydApi() as lbry:
+        ...     response = await lbry.claim_search(name='LBRYPlaylists')
+
+        :param float timeout: The number of seconds to wait for a connection until we time out
+        :param options: Options passed to `AsyncBaseApi`,
+         such as `pool_maxsize`, `session` and `cache`
+        """
+        super().__init__(timeout=timeout, **options)
+
+    async def call(self, method, params=None, timeout=600, raw=None, fields=None):
+        """Makes a call to the LBRY API.
+
+        :param str method: Method to call from the LBRY API. See the full list of methods at
+         https://github.com/lbryio/lbry-sdk/blob/master/lbry/extras/daemon/daemon.py
+         The daemon methods start with the string `jsonrpc_`
+        :param dict params: Parameters to give the method selected
+        :param float timeout: The number of seconds to wait for a connection until we time out; 600 By Default.
+        :param bool raw: Whether to return the undecoded body of the response, as `bytes`;
+         the `raw` mode of the instance by default.
+        :param list fields: Paths of the fields of the items of the result to return, such as 'value.title';
+         a `pybry.projection.ProjectedPage` of them is then returned, parsed as the response is received.
+        :raises LBRYException: If the request returns an error when calling the API
+        :return: A Python `dict` object containing the data requested from the API
+        :rtype: dict
+        """
+
+        params = {} if params is None else params
+
+        return await self.make_request(SERVER_ADDRESS, method, params, timeout=timeout, raw=raw, fields=fields)
+
+    async def call_many(self, calls, timeout=None):
+        """Makes several calls to the LBRY API in a single batch request.
+
+        :param list calls: Sequence of `(method, params)` pairs
+        :param float timeout: The number of seconds to wait for a connection until we time out;
+         the timeout of the instance by default.
+        :return: The result of each call, or the `LBRYError` raised by it, in the same order, and the response
+        :rtype: list, aiohttp.ClientResponse
+        """
+        timeout = self.timeout if timeout is None else timeout
+
+        return await self.make_batch_request(SERVER_ADDRESS, calls, timeout=timeout)
+
+    async def stream(self, uri=None, file=None, resume=3, **params):
+        """Open the content of a claim, to stream it from the daemon.
+
+        The claim is resolved, and its download started, with `get` without saving it
+        to a file, unless a file returned by `get` or `file_list` is given instead.
+        >>> stream = await lbry.stream("lbry://@channel#1/video#2")
+        >>> async for chunk in stream.iter_content():
+        ...     await response.write(chunk)
+
+        :param str uri: URI of the claim
+        :param dict file: A file returned by `get` or `file_list`, instead of the URI
+        :param int resume: Number of times in a row the reading is resumed after an error
+        :param params: Other parameters of `get`, such as `timeout` or `wallet_id`
+        :raises LBRYError: If the content cannot be streamed
+        :rtype: pybry.streaming.AsyncContentStream
+        """
+        if file is None:
+            params = dict(params, uri=uri, save_file=False)
+            file = await self.make_request(SERVER_ADDRESS, "get", params, timeout=self.timeout)
+
+        url = streaming_url(file)
+        if isinstance(file, tuple):
+            file = file[0]
+
+        return AsyncContentStream(await self.get_session(), url, mime_type=file.get("mime_type"),
+                                  timeout=self.timeout, resume=resume)
+
@@ -5,9 +5,55 @@ Initialize the class, and use its methods.
 >>> import pybry
 >>> lbry = pybry.LbrydApi()
 >>> response = lbry.claim_search(name='LBRYPlaylists')
+
+The asynchronous wrappers have the same methods as coroutines,
+and require `aiohttp`.
+>>> async with pybry.AsyncLbrydApi() as lbry:
+...     response = await lbry.claim_search(name='LBRYPlaylists')
 """
+import importlib
+
 from .constants import __version__
 from .lbryd_api import LbrydApi
 from .lbrycrd_api import LbrycrdApi
-from .exception import LBRYError
+from .exception import LBRYError, DaemonUnavailableError, CircuitOpenError, DeadlineExceededError
+from .base_api import BaseApi, ResponseMeta
+
+# The optional subsystems, and the asynchronous wrappers, are imported on first access,
+# so that the programs that don't use them don't import them, nor `aiohttp` and `sqlite3`
+_LAZY_ATTRIBUTES = {"AsyncLbrydApi": "async_lbryd_api",
+                    "AsyncLbrycrdApi": "async_lbrycrd_api",
+                    "ResponseCache": "cache",
+                    "ChainScanner": "chainscan",
+                    "AsyncChainScanner": "chainscan",
+                    "Cluster": "cluster",
+                    "ClaimFeed": "feed",
+                    "AsyncClaimFeed": "feed",
+                    "Hook": "instrumentation",
+                    "MetricsCollector": "instrumentation",
+                    "Projection": "projection",
+                    "ProjectedPage": "projection",
+                    "AsyncProjectedPage": "projection",
+                    "Limit": "ratelimit",
+                    "RateLimiter": "ratelimit",
+                    "CircuitBreaker": "resilience",
+                    "RetryPolicy": "resilience",
+                    "PersistentStore": "store",
+                    "HttpTransport": "transport",
+                    "RequestsTransport": "transport",
+                    "UnixTransport": "transport",
+                    "TxoIndex": "txoindex",
+                    "AsyncTxoIndex": "txoindex"}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
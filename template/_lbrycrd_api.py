@@ -4,27 +4,69 @@ from pybry.base_api import BaseApi
 
 class LbrycrdApi(BaseApi):
 
-    def __init__(self, username, password, timeout=600):
+    health_method = "getblockcount"
+
+    def __init__(self, username, password, timeout=600, **options):
         """
 
         :param str username: Username for lbrycrd login
         :param str password: Password for lbrycrd login
         :param float timeout: Number of seconds before we give up on waiting for server to respond
+        :param options: Options passed to `BaseApi`,
+         such as `pool_maxsize`, `keep_alive` and `cache`
         """
-
+        # Set first, for the health checks of a cluster given in the options
         self.basic_auth = (username, password)
-        self.timeout = timeout
+        super().__init__(timeout=timeout, **options)
 
-    def call(self, method, params=None):
+    def call(self, method, params=None, raw=None):
         """
 
         :param str method: Method to call from lbrycrd. To view the full list of methods, run ./lbrycrd-cli help,
          or ./lbrycrd-cli [command_name] help for information on a specific command
          https://lbryio.github.io/lbry/cli/
         :param dict params: Parameters to give the method selected
+        :param bool raw: Whether to return the undecoded body of the response, as `bytes`;
+         the `raw` mode of the instance by default.
         :raises LBRYException: If the request returns an error when calling the API
         :return: A Python `dict` object containing the data requested from the API
         :rtype: dict
         """
 
-        return self.make_request(SERVER_ADDRESS, method, params, self.basic_auth, self.timeout)
+        return self.make_request(SERVER_ADDRESS, method, params, self.basic_auth, self.timeout, raw)
+
+    def call_many(self, calls, timeout=None):
+        """Makes several calls to lbrycrd in a single batch request.
+
+        :param list calls: Sequence of `(method, params)` pairs
+        :param float timeout: The number of seconds to wait for a connection until we time out;
+         the timeout of the instance by default.
+        :return: The result of each call, or the `LBRYError` raised by it, in the same order, and the response
+        :rtype: list, PreparedResponse
+        """
+        timeout = self.timeout if timeout is None else timeout
+
+        return self.make_batch_request(SERVER_ADDRESS, calls, self.basic_auth, timeout=timeout)
+
+    def scan_blocks(self, start=0, end=None, checkpoint=None, follow=False, **options):
+        """Iterate over the blocks of a range of heights, in height order.
+
+        The blocks are requested in batches of `getblockhash` and `getblock` calls,
+        several batches at the same time, ahead of the blocks that have been consumed.
+        >>> for block in lbrycrd.scan_blocks(0, 1000, max_workers=8, verbosity=2):
+        ...     index(block)
+
+        :param int start: Height of the first block
+        :param int end: Height of the last block; the tip when the scan starts by default
+        :param tuple checkpoint: The height and hash of the last block of a previous scan,
+         to resume after it instead of at `start`
+        :param bool follow: Whether to keep yielding the new blocks once the tip is reached
+        :param options: Options of `pybry.chainscan.ChainScanner`, such as `batch_size`,
+         `max_workers`, `verbosity` and `on_reorg`
+        :raises LBRYError: If a block cannot be requested
+        :return: Generator of the blocks returned by `getblock`
+        """
+        from pybry.chainscan import ChainScanner
+
+        scanner = ChainScanner(self, **options)
+        return scanner.follow(start, checkpoint) if follow else scanner.scan(start, end, checkpoint)
@@ -1,10 +1,11 @@
-from pybry.base_api import BaseApi
+from pybry.base_api import BaseApi, shared_method
+from pybry.callplan import CallPlans
 from pybry.constants import LBRYD_SERVER_ADDRESS as SERVER_ADDRESS
 
 
 class LbrydApi(BaseApi):
 
-    def __init__(self, timeout=600):
+    def __init__(self, timeout=600, **options):
         """
         LBRY daemon wrapper.
 
@@ -12,19 +13,33 @@ class LbrydApi(BaseApi):
         >>> lbry = LbrydApi()
         >>> response = lbry.claim_search(name='LBRYPlaylists')
 
+        The connections to the daemon are pooled and reused between calls;
+        call `close()`, or use the instance as a context manager, to release them.
+        >>> with LbrydApi() as lbry:
+        ...     response = lbry.status()
+
         :param float timeout: The number of seconds to wait for a connection until we time out
+        :param options: Options passed to `BaseApi`,
+         such as `pool_maxsize`, `keep_alive` and `cache`
         """
-        self.timeout = timeout
+        super().__init__(timeout=timeout, **options)
 
-    @classmethod
-    def call(cls, method, params=None, timeout=600):
+    @shared_method
+    def call(self, method, params=None, timeout=600, raw=None, fields=None):
         """Makes a call to the LBRY API.
 
+        It can also be called on the class, as `LbrydApi.call("status")`,
+        which runs it on an instance with the default options shared by such calls.
+
         :param str method: Method to call from the LBRY API. See the full list of methods at
          https://github.com/lbryio/lbry-sdk/blob/master/lbry/extras/daemon/daemon.py
          The daemon methods start with the string `jsonrpc_`
         :param dict params: Parameters to give the method selected
         :param float timeout: The number of seconds to wait for a connection until we time out; 600 By Default.
+        :param bool raw: Whether to return the undecoded body of the response, as `bytes`;
+         the `raw` mode of the instance by default.
+        :param list fields: Paths of the fields of the items of the result to return, such as 'value.title';
+         a `pybry.projection.ProjectedPage` of them is then returned, parsed as the response is received.
         :raises LBRYException: If the request returns an error when calling the API
         :return: A Python `dict` object containing the data requested from the API
         :rtype: dict
@@ -32,5 +47,47 @@ class LbrydApi(BaseApi):
 
         params = [] if params is None else params
 
-        return cls.make_request(SERVER_ADDRESS, method, params, timeout=timeout)
+        return self.make_request(SERVER_ADDRESS, method, params, timeout=timeout, raw=raw, fields=fields)
+
+    def call_many(self, calls, timeout=None):
+        """Makes several calls to the LBRY API in a single batch request.
+
+        :param list calls: Sequence of `(method, params)` pairs
+        :param float timeout: The number of seconds to wait for a connection until we time out;
+         the timeout of the instance by default.
+        :return: The result of each call, or the `LBRYError` raised by it, in the same order, and the response
+        :rtype: list, PreparedResponse
+        """
+        timeout = self.timeout if timeout is None else timeout
+
+        return self.make_batch_request(SERVER_ADDRESS, calls, timeout=timeout)
+
+    def stream(self, uri=None, file=None, resume=3, **params):
+        """Open the content of a claim, to stream it from the daemon.
+
+        The claim is resolved, and its download started, with `get` without saving it
+        to a file, unless a file returned by `get` or `file_list` is given instead.
+        The content is read over the pooled connections of this instance.
+        >>> with open("video.mp4", "wb") as video:
+        ...     lbry.stream("lbry://@channel#1/video#2").copy_to(video)
+
+        :param str uri: URI of the claim
+        :param dict file: A file returned by `get` or `file_list`, instead of the URI
+        :param int resume: Number of times in a row the reading is resumed after an error
+        :param params: Other parameters of `get`, such as `timeout` or `wallet_id`
+        :raises LBRYError: If the content cannot be streamed
+        :rtype: pybry.streaming.ContentStream
+        """
+        from pybry.streaming import ContentStream, streaming_url
+
+        if file is None:
+            params = dict(params, uri=uri, save_file=False)
+            file = self.make_request(SERVER_ADDRESS, "get", params, timeout=self.timeout)
+
+        url = streaming_url(file)
+        if isinstance(file, tuple):
+            file = file[0]
+
+        return ContentStream(self.session, url, mime_type=file.get("mime_type"),
+                             timeout=self.timeout, resume=resume)
 
@@ -7,82 +7,820 @@ needs (params).
 We want to be able to continuously make requests if we need to,
 so this is implemented as a class that is initialized once, and then
 it can make multiple requests to the API.
+Each instance owns a transport, a long-lived `requests.Session` by default,
+whose connection pool is reused by every call, so consecutive requests share
+keep-alive connections instead of opening a new TCP connection each time.
+
+The modules of the optional features, such as the cache, the models, the hooks
+and the retries, are imported when an instance first uses them, so that
+importing the package stays fast for the programs that don't.
 """
+import functools
+import threading
+import time
+
 import requests
+
 import pybry.exception as lbryex
+from pybry.batch import Batch, match_batch_results
+from pybry.callplan import PlannedParams, RequestTemplate, encode_call, last_request_id, next_request_id
+from pybry.codec import get_codec
+
+
+# What the calls return besides their result:
+# the `requests.Response`, a lightweight `ResponseMeta`, or nothing
+RESULT_MODES = ("response", "meta", "result")
+
+
+class ResponseMeta:
+    """Lightweight information about the response to a call.
+
+    It is returned instead of the full response object when the result mode
+    is "meta", so callers that keep results don't keep the headers,
+    the body and the connection of the response alive.
+    """
+
+    __slots__ = ("status_code", "elapsed", "request_id", "size")
+
+    def __init__(self, status_code, elapsed, request_id, size):
+        """
+        :param int status_code: HTTP Status code received from HTTP request
+        :param float elapsed: Seconds between sending the request and receiving the response
+        :param int | list request_id: The JSON-RPC ID of the request, or the IDs of a batch
+        :param int size: Size of the body of the response in bytes
+        """
+        self.status_code = status_code
+        self.elapsed = elapsed
+        self.request_id = request_id
+        self.size = size
+
+    def __repr__(self):
+        return (f"<ResponseMeta [{self.status_code}] id={self.request_id} "
+                f"elapsed={self.elapsed:.3f}s size={self.size}>")
+
+
+class shared_method:
+    """Decorator of the methods that can also be called on the class, like the class
+    methods they once were; such calls run on `shared_instance()` of the class.
+    >>> LbrydApi.call("status")
+    """
+
+    def __init__(self, func):
+        self.func = func
+        functools.update_wrapper(self, func)
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            instance = owner.shared_instance()
+        return self.func.__get__(instance, owner)
+
+
+class _LastRequestId:
+    """The `request_id` attribute of the wrappers and their classes: a read-only view
+    of the last request ID, which `pybry.callplan.next_request_id` now increments."""
+
+    def __get__(self, instance, owner):
+        return last_request_id()
+
+    def __set__(self, instance, value):
+        raise AttributeError("request_id is read-only; the IDs are given by pybry.callplan.next_request_id")
+
+
+# Guards the creation of the shared instances of the wrappers
+_shared_lock = threading.Lock()
+
+
+# Approximate memory kept by a response object besides the contents of its body and headers,
+# and by the request and the raw response a `requests.Response` also keeps
+RESPONSE_OVERHEAD = 1024
+REQUEST_OVERHEAD = 7 * 1024
+
+
+def headers_size(headers):
+    """Return the size in bytes of the names and values of some headers."""
+    return sum(len(name) + len(value) for name, value in headers.items())
+
+
+def response_size(response):
+    """Return the memory in bytes kept by a cached response, with its headers
+    and its request, or the size of the body of a `ResponseMeta`."""
+    if isinstance(response, ResponseMeta):
+        return response.size
+
+    size = RESPONSE_OVERHEAD + len(response.content) + headers_size(response.headers)
+    request = getattr(response, "request", None)
+    if request is not None:
+        size += (REQUEST_OVERHEAD + len(request.url or "") + len(request.body or b"")
+                 + headers_size(request.headers))
+    return size
 
 
 class BaseApi:
 
-    request_id = 0
+    # The last request ID sent by any wrapper; reading it on the class is still supported
+    request_id = _LastRequestId()
+
+    # What the calls return besides their result, one of `RESULT_MODES`.
+    # Set it on the class to change the default of every instance.
+    result_mode = "response"
+
+    # Method called by the health checks of a cluster given to the wrapper
+    health_method = "status"
+
+    def __init__(self, timeout=600, pool_connections=10, pool_maxsize=10,
+                 max_retries=0, keep_alive=True, cache=None, coalesce=False,
+                 codec=None, raw=False, result_mode=None,
+                 models=False, hooks=None, retry=None, circuit_breaker=None,
+                 deadline=None, cluster=None, rate_limiter=None, store=None, transport=None,
+                 compress=False, compress_requests=None, decode_pool=None):
+        """Initialize the connection pool shared by all the calls of this instance.
+
+        :param float timeout: Amount of seconds to wait for the server's response before we timeout.
+        :param int pool_connections: Number of distinct hosts to keep connection pools for.
+        :param int pool_maxsize: Maximum number of connections kept open per host;
+         it should be at least the number of threads sharing this instance.
+        :param int max_retries: Number of times a failed connection is retried by the transport.
+         Only connection errors are retried, never requests that reached the server.
+        :param bool keep_alive: Whether to keep connections open between calls.
+        :param pybry.cache.ResponseCache cache: Cache for the results of read-only commands;
+         it may be shared by several instances. Nothing is cached by default.
+         In the "response" result mode, the hits return the cached `requests.Response`,
+         whose headers and request are counted in the size of the cache.
+        :param bool | pybry.singleflight.SingleFlight coalesce: Whether identical calls
+         made at the same time share a single request; a `SingleFlight` object
+         may be given to choose the methods, or to share it between instances.
+        :param str codec: JSON codec used to encode the requests and decode the responses,
+         `orjson`, `ujson` or `json`, or an object with `dumps` and `loads` methods;
+         the fastest one installed by default.
+        :param bool raw: Whether calls return the undecoded body of the response,
+         as `bytes`, instead of its result.
+        :param str result_mode: What the calls return: "response" for the result
+         and the `requests.Response`, "meta" for the result and a `ResponseMeta`,
+         or "result" for the result alone; `BaseApi.result_mode` by default.
+        :param bool models: Whether the results of the commands described in `pybry.models`
+         are returned as compact models, or their pages as lists of models.
+        :param list hooks: Objects with the methods of `pybry.instrumentation.Hook`,
+         called around every request, such as a `MetricsCollector`.
+        :param bool | pybry.resilience.RetryPolicy retry: Whether the read-only commands
+         are retried after connection errors, timeouts and gateway errors;
+         a `RetryPolicy` may be given to choose how.
+        :param bool | pybry.resilience.CircuitBreaker circuit_breaker: Whether calls fail
+         immediately while the daemon keeps failing; a `CircuitBreaker` may be given
+         to configure it, or to share it between instances.
+        :param float deadline: Maximum number of seconds of a call, retries included.
+         With any of these three options, a call that cannot reach the daemon
+         raises `DaemonUnavailableError` instead of returning None.
+        :param pybry.cluster.Cluster cluster: Daemons to send the calls to,
+         instead of the URL given to each call.
+        :param pybry.ratelimit.RateLimiter rate_limiter: Rate limits and concurrency caps
+         of the methods; it may be shared by several instances.
+        :param pybry.store.PersistentStore store: On-disk store of the results that never change,
+         like transactions by their ID, which may be shared by several processes.
+         It is only used in the "meta" and "result" modes. Nothing is stored by default.
+        :param str | pybry.transport.Transport transport: Transport sending the requests,
+         "requests" or "http", or a `Transport` such as a `UnixTransport`;
+         a `RequestsTransport` with the pool options of this instance by default.
+        :param bool compress: Whether the responses are asked to be compressed,
+         when the transport is given by its name.
+        :param int compress_requests: Size in bytes above which the bodies of the requests are
+         compressed with gzip, when the transport is given by its name; never by default.
+        :param concurrent.futures.Executor decode_pool: Pool decoding the items of the pages
+         projected on some `fields`, such as a `ProcessPoolExecutor` for pages of several megabytes;
+         they are decoded in the thread reading the response by default.
+        """
+        self.timeout = timeout
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.keep_alive = keep_alive
+        self.cache = cache
+        if coalesce is True:
+            from pybry.singleflight import SingleFlight
+            coalesce = SingleFlight()
+        self.single_flight = coalesce or None
+        self.codec = get_codec(codec)
+        self.raw = raw
+        self.models = models
+        self.hooks = tuple(hooks or ())
+        if retry is True:
+            from pybry.resilience import RetryPolicy
+            retry = RetryPolicy()
+        self.retry = retry or None
+        if circuit_breaker is True:
+            from pybry.resilience import CircuitBreaker
+            circuit_breaker = CircuitBreaker()
+        self.circuit_breaker = circuit_breaker or None
+        self.deadline = deadline
+        self.cluster = cluster
+        if cluster is not None:
+            cluster.attach(self.health_method, getattr(self, "basic_auth", None))
+        self.rate_limiter = rate_limiter
+        self.store = store
+        # The transport is created on first use, see `transport`
+        self._transport = None
+        self._transport_options = {"transport": transport, "compress": compress,
+                                   "compress_requests": compress_requests}
+        self.decode_pool = decode_pool
+
+        if result_mode is not None:
+            if result_mode not in RESULT_MODES:
+                raise ValueError(f"The result mode must be one of {RESULT_MODES}")
+            self.result_mode = result_mode
+
+        # Transport of the requests that are not calls, like streaming, with another transport
+        self._session_transport = None
+        self._session_lock = threading.Lock()
+        # Prepared request of each URL and credentials
+        self._templates = {}
+
+    @property
+    def transport(self):
+        """The `Transport` sending the requests of this instance, created on first use.
+
+        :rtype: pybry.transport.Transport
+        """
+        transport = self._transport
+        if transport is None:
+            with self._session_lock:
+                if self._transport is None:
+                    from pybry.transport import make_transport
+                    self._transport = make_transport(pool_connections=self.pool_connections,
+                                                     pool_maxsize=self.pool_maxsize,
+                                                     max_retries=self.max_retries,
+                                                     **self._transport_options)
+                transport = self._transport
+        return transport
+
+    @transport.setter
+    def transport(self, transport):
+        self._transport = transport
+
+    @property
+    def session(self):
+        """The pooled `requests.Session` used by this instance, created on first use.
+
+        It sends the calls with the default transport, and streams content with any transport.
+        """
+        from pybry.transport import RequestsTransport
+
+        transport = self.transport
+        if not isinstance(transport, RequestsTransport):
+            with self._session_lock:
+                if self._session_transport is None:
+                    self._session_transport = RequestsTransport(self.pool_connections, self.pool_maxsize,
+                                                                self.max_retries)
+                transport = self._session_transport
+        return transport.session
+
+    def close(self):
+        """Close every pooled connection. A new pool is created if the instance is used again."""
+        if self._transport is not None:
+            self._transport.close()
+        if self._session_transport is not None:
+            self._session_transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     @classmethod
-    def make_request(cls, url, method, params=None, basic_auth=None, timeout=600):
+    def shared_instance(cls):
+        """Return the instance with the default options on which the methods called on the class run.
+
+        :rtype: BaseApi
+        """
+        instance = cls.__dict__.get("_shared_instance")
+        if instance is None:
+            with _shared_lock:
+                instance = cls.__dict__.get("_shared_instance")
+                if instance is None:
+                    instance = cls()
+                    setattr(cls, "_shared_instance", instance)
+        return instance
+
+    @staticmethod
+    def _next_request_id():
+        """Return a new request ID; safe to call from several threads."""
+        return next_request_id()
+
+    @staticmethod
+    def _clean_params(params):
+        """Return the parameters to send, without the ones whose value is None.
+
+        Positional parameters, as used by `lbrycrd`, are sent as they are.
+        """
+        # Default parameters
+        if params is None:
+            return {}
+
+        # Built by a call plan, without the None valued params
+        if type(params) is PlannedParams:
+            return params
+
+        if isinstance(params, (list, tuple)):
+            return list(params)
+
+        # Weed out all the None valued params
+        return {k: v for (k, v) in params.items() if v is not None}
+
+    def _build_payload(self, method, params):
+        """Return the JSON-RPC 2.0 object for a single call, with a new request ID."""
+        return {"method": method,
+                "params": params,
+                "jsonrpc": "2.0",
+                "id": self._next_request_id()}
+
+    def _prepare(self, url, data, basic_auth):
+        """Build the prepared POST request that sends `data` encoded as JSON."""
+        key = (url, tuple(basic_auth) if basic_auth else None, self.keep_alive)
+        template = self._templates.get(key)
+        if template is None:
+            template = self._templates[key] = RequestTemplate(url, basic_auth, self.keep_alive)
+
+        return template.prepare(encode_call(data, self.codec))
+
+    def _send(self, prepared, data, timeout, stream=False):
+        """Send a prepared request with the transport, and return its response.
+
+        With a rate limiter, the request waits until the limits of its methods allow it.
+        With `stream`, the response is returned before its body is read, with the permit
+        of the rate limiter, or None, to give to `RateLimiter.release` once the body is read.
+        """
+        limiter = self.rate_limiter
+        if limiter is None:
+            response = self._send_attempts(prepared, data, timeout, stream)
+            return (response, None) if stream else response
+
+        permit = limiter.acquire(data)
+        try:
+            response = self._send_attempts(prepared, data, timeout, stream)
+        except BaseException:
+            limiter.release(permit)
+            raise
+
+        if stream:
+            return response, permit
+        limiter.release(permit)
+        return response
+
+    def _send_attempts(self, prepared, data, timeout, stream=False):
+        """Send a prepared request, possibly several times, and return its response.
+
+        With a cluster, each attempt is sent to the daemon chosen by the cluster.
+        With a retry policy, a circuit breaker or a deadline, the failed attempts
+        are retried as they allow, and `DaemonUnavailableError` is raised
+        when the request cannot succeed.
+        """
+        cluster = self.cluster
+        resilient = (self.retry is not None or self.circuit_breaker is not None
+                     or self.deadline is not None)
+        if cluster is None and not resilient:
+            return self.transport.send(prepared, timeout, stream)
+
+        from pybry.resilience import Attempts, TRANSIENT_STATUSES
+
+        methods = [call["method"] for call in data] if isinstance(data, list) else [data["method"]]
+        attempts = None
+        if resilient:
+            attempts = Attempts(methods, timeout, self.retry, self.circuit_breaker,
+                                self.deadline, prepared)
+
+        while True:
+            attempt_timeout = attempts.next_timeout() if attempts is not None else timeout
+
+            node = None
+            if cluster is not None:
+                node = cluster.acquire(methods)
+                prepared.prepare_url(node.url, None)
+
+            start = time.perf_counter()
+            try:
+                response = self.transport.send(prepared, attempt_timeout, stream)
+            except (requests.ConnectionError, requests.Timeout) as err:
+                if node is not None:
+                    cluster.release(node, failed=True)
+                if attempts is None:
+                    raise
+                time.sleep(attempts.failed(err))
+                continue
+
+            except BaseException:
+                if node is not None:
+                    cluster.release(node)
+                raise
+
+            transient = (attempts.is_transient(response.status_code) if attempts is not None
+                         else response.status_code in TRANSIENT_STATUSES)
+            if node is not None:
+                cluster.release(node, time.perf_counter() - start, failed=transient)
+
+            if attempts is not None:
+                if transient:
+                    response.close()
+                    time.sleep(attempts.failed_status(response.status_code))
+                    continue
+                attempts.succeeded()
+
+            return response
+
+    def make_request(self, url, method, params=None, basic_auth=None, timeout=600, raw=None,
+                     fields=None):
         """ Makes a cURL POST request to the given URL, specifying the data to be passed in as
          {"method": method, "params": parameters}
 
+        If the instance has a cache, the results of cacheable methods are returned
+        from it while they are fresh, and other methods invalidate the entries they affect.
+        If it coalesces calls, a call identical to one in flight waits for its result.
+
+        In raw mode the body of the response is returned without decoding it,
+        so it can be forwarded as it is; it is neither cached nor checked for errors.
+
+        Depending on the result mode of the instance, the result is returned
+        with the response, with a `ResponseMeta`, or alone.
+
+        With `fields`, the `ProjectedPage` of `project` is returned instead.
+
         :param str url: URL to connect to.
         :param str method: The API method to call.
         :param dict params: Dictionary object of the parameters associated with the `method` given. None by default.
         :param list | tuple basic_auth: List containing your username and password as ['username', 'password'].
          This is empty by default, however it is required by all of the `lbrycrd` methods
         :param float timeout: Amount of seconds to wait for the server's response before we timeout.
+        :param bool raw: Whether to return the undecoded body of the response;
+         the `raw` mode of the instance by default.
+        :param list fields: Paths of the fields of the items to return, such as "value.title"
         :raises LBRYException: If the request returns an error when calling the API
-        :return: A `dict` of the JSON result member of the request
+        :return: A `dict` of the JSON result member of the request, or the `bytes` of the body in raw mode
         :rtype: dict, PreparedResponse
         """
-        # Default parameters
-        params = {} if params is None else params
+        if fields is not None:
+            return self.project(url, method, params, fields, basic_auth, timeout)
 
-        # Increment the request ID
-        cls.request_id += 1
+        value = self._make_request(url, method, params, basic_auth, timeout, raw)
 
-        # Weed out all the None valued params
-        params = {k: v for (k, v) in params.items() if v is not None}
+        if value is None:
+            return value
 
-        # This is the data to be sent
-        data = {"method": method,
-                "params": params,
-                "jsonrpc": "2.0",
-                "id": cls.request_id}
+        if self.models and not (raw or (raw is None and self.raw)):
+            value = self._with_models(method, value[0]), value[1]
+
+        if self.result_mode == "result":
+            return value[0]
+
+        return value
+
+    @staticmethod
+    def _with_models(method, result):
+        """Return the result of `method` with its models, if it has them."""
+        from pybry import models
+        from pybry.model import wrap_result
+
+        entry = models.RESULT_MODELS.get(method)
+        if entry is None or result is None:
+            return result
+
+        return wrap_result(result, *entry)
+
+    def _make_request(self, url, method, params, basic_auth, timeout, raw=None):
+        """Make a call, and return its result together with the response or its `ResponseMeta`."""
+        params = self._clean_params(params)
+
+        if raw or (raw is None and self.raw):
+            return self._send_request(url, method, params, basic_auth, timeout, raw=True)
+
+        cache, flight, store = self.cache, self.single_flight, self.store
+        if self.result_mode == "response":
+            # The stored results have no response to return with them
+            store = None
+        if cache is None and flight is None and store is None:
+            return self._send_request(url, method, params, basic_auth, timeout)
+
+        stored = store is not None and store.is_stored(method, params)
+        if cache is not None and not cache.is_cacheable(method):
+            if not stored:
+                try:
+                    return self._send_request(url, method, params, basic_auth, timeout)
+                finally:
+                    cache.invalidate(method)
+            cache = None
 
-        # Send the request as JSON, and with the specified user-agent
-        headers = {"Content-Type": "application/json-rpc",
-                   "user-agent": "LBRY python3-api"}
+        from pybry.cache import request_key
+
+        key = request_key(url, method, params)
+        if cache is not None:
+            value = cache.get(key)
+            if value is not None:
+                return value
+
+        if stored:
+            value = store.get(method, params)
+            if value is not None:
+                value = value[0], ResponseMeta(200, 0.0, None, value[1])
+                if cache is not None:
+                    cache.put(key, value, value[1].size)
+                return value
+
+        def send():
+            value = self._send_request(url, method, params, basic_auth, timeout)
+
+            response = value[1]
+            if cache is not None and response is not None:
+                cache.put(key, value, response_size(response))
+            if stored and response is not None:
+                store.put(method, params, value[0])
+
+            return value
+
+        if flight is not None and flight.is_coalesced(method):
+            return flight.do(key, send)
+
+        return send()
+
+    def _slim(self, value, response, request_id):
+        """Pair a value with its response, or with a `ResponseMeta` so the response can be freed."""
+        if self.result_mode == "response":
+            return value, response
+
+        return value, ResponseMeta(response.status_code, response.elapsed.total_seconds(),
+                                   request_id, len(response.content))
+
+    def _send_request(self, url, method, params, basic_auth, timeout, raw=False):
+        """Send a single call and return its result, or the raw body, and the response."""
+        # This is the data to be sent
+        data = self._build_payload(method, params)
 
-        # You could create a request object and then make a prepared request object
-        # And then be able to print the Request that will be sent
-        request = requests.Request('POST', url,
-                                   json=data,
-                                   headers=headers,
-                                   auth=basic_auth)
+        prepared = self._prepare(url, data, basic_auth)
 
-        prepared = request.prepare()
+        info = None
+        if self.hooks:
+            from pybry.instrumentation import CallInfo
+            info = CallInfo(self.hooks, url, method, data["id"])
+            info.sending(len(prepared.body))
 
         try:
-            # Send the prepared request object through
-            sesh = requests.Session()
-            response = sesh.send(prepared, timeout=timeout)
-            response_json = response.json()
+            # Send the prepared request object with the transport
+            response = self._send(prepared, data, timeout)
+
+            if info is not None:
+                info.received(response.status_code, len(response.content))
+
+            if raw:
+                if info is not None:
+                    info.succeeded()
+                return self._slim(response.content, response, data["id"])
+
+            response_json = self.codec.loads(response.content)
 
             # Returns the Result sub-JSON formatted as a dict
             if 'result' in response_json:
-                return response_json['result'], response
+                if info is not None:
+                    info.succeeded()
+                return self._slim(response_json['result'], response, data["id"])
 
             elif 'error' in response_json:
-                raise lbryex.LBRYError("POST Request made to LBRY received an error",
-                                       response_json,
-                                       response.status_code,
-                                       prepared)
+                error = lbryex.LBRYError("POST Request made to LBRY received an error",
+                                         response_json,
+                                         response.status_code,
+                                         prepared)
+                if info is not None:
+                    info.failed(error)
+                raise error
+
+        except lbryex.DaemonUnavailableError as DE:
+            if info is not None:
+                info.failed(DE)
+            raise
 
         except requests.HTTPError as HE:
+            if info is not None:
+                info.failed(HE)
             print(HE)
             return None, None
 
+        except (requests.RequestException, ValueError) as RE:
+            if info is not None:
+                info.failed(RE)
+            print(RE)
+            print("Printing request:")
+            lbryex.print_request(prepared)
+
+            return None, None
+
+    def project(self, url, method, params, fields, basic_auth=None, timeout=600):
+        """Make a call, and return the items of its result projected on `fields`, as they are received.
+
+        The response is streamed, and its items, the elements of `result.items`,
+        or of `result` when it is a list, are decoded as their bytes arrive, projected,
+        and yielded by the returned `ProjectedPage`. The other members of the result
+        are in its `info` once the items are read. The call is neither cached
+        nor coalesced, and it is returned in every result mode.
+        >>> page = lbry.project(url, "txo_list", {"page_size": 5000}, ["txid", "nout", "amount"])
+        >>> amounts = {(txo["txid"], txo["nout"]): txo["amount"] for txo in page}
+
+        :param str url: URL to connect to.
+        :param str method: The API method to call.
+        :param dict params: Parameters of the method.
+        :param list | str | pybry.projection.Projection fields: Paths of the fields of the items,
+         with the names of nested fields separated by dots, like "value.title".
+        :param list | tuple basic_auth: List containing your username and password as ['username', 'password'].
+        :param float timeout: Amount of seconds to wait for the server's response before we timeout.
+        :raises LBRYException: If the call cannot be made, or, while reading the items,
+         if the response is interrupted or the daemon returned an error
+        :rtype: pybry.projection.ProjectedPage
+        """
+        from pybry.projection import ProjectedPage, as_projection
+
+        projection = as_projection(fields)
+        data = self._build_payload(method, self._clean_params(params))
+        prepared = self._prepare(url, data, basic_auth)
+
+        info = None
+        if self.hooks:
+            from pybry.instrumentation import CallInfo
+            info = CallInfo(self.hooks, url, method, data["id"])
+            info.sending(len(prepared.body))
+
+        try:
+            response, permit = self._send(prepared, data, timeout, stream=True)
+        except lbryex.DaemonUnavailableError as DE:
+            if info is not None:
+                info.failed(DE)
+            raise
         except requests.RequestException as RE:
+            if info is not None:
+                info.failed(RE)
+            raise lbryex.LBRYError(f"'{method}' could not be requested", None, None, prepared) from RE
+
+        # The permit of the rate limiter is held until the items are read
+        on_close = functools.partial(self.rate_limiter.release, permit) if permit is not None else None
+        return ProjectedPage(response, projection, self.codec, method, prepared, self.decode_pool, info,
+                             on_close)
+
+    def iter_pages(self, url, method, params=None, basic_auth=None, timeout=600, prefetch=True,
+                   fields=None):
+        """Yield the items of every page of a paginated method, one page at a time.
+
+        The pages are requested in order, starting with the `page` given in `params`
+        or the first one, and the next page is requested in the background
+        while the items of the current one are consumed.
+
+        :param str url: URL to connect to.
+        :param str method: The paginated API method to call.
+        :param dict params: Parameters of the method, such as `page_size`.
+        :param list | tuple basic_auth: List containing your username and password as ['username', 'password'].
+        :param float timeout: Amount of seconds to wait for the server's response before we timeout.
+        :param bool prefetch: Whether to request the next page while the current one is consumed.
+        :param list fields: Paths of the fields of the items to yield, such as "value.title";
+         each page is then streamed and projected as with `project`, without prefetching.
+        :raises LBRYException: If a page returns an error, or cannot be requested
+        :return: Generator of the items of all the pages
+        """
+        params = self._clean_params(params)
+        first_page = params.pop("page", 1)
+
+        if fields is not None:
+            from pybry.projection import as_projection, iter_projected_pages
+
+            projection = as_projection(fields)
+            return iter_projected_pages(lambda page: self.project(url, method, dict(params, page=page),
+                                                                  projection, basic_auth, timeout),
+                                        first_page)
+
+        def fetch_page(page):
+            result, response = self._make_request(url, method, dict(params, page=page),
+                                                  basic_auth, timeout, raw=False)
+            if response is None:
+                raise lbryex.LBRYError(f"Page {page} of '{method}' could not be requested",
+                                       None, None, None)
+            return self._with_models(method, result) if self.models else result
+
+        from pybry.pagination import iter_pages
+
+        return iter_pages(fetch_page, first_page, prefetch)
+
+    def fan_out(self, func, kwargs_list, max_workers=8, max_pending=None, return_exceptions=False):
+        """Call an API method once for each set of keyword arguments, concurrently.
+
+        The calls are made from a pool of `max_workers` threads which share
+        the connection pool of this instance, so `pool_maxsize` should be
+        at least `max_workers`. The results are yielded in the same order
+        as the arguments, and the arguments are consumed lazily.
+        >>> params = ({"channel_ids": [channel_id]} for channel_id in channel_ids)
+        >>> for result, response in lbry.fan_out(lbry.claim_search, params, max_workers=16):
+        ...     print(result["total_items"])
+
+        :param callable func: The API method to call, such as `lbry.claim_search`.
+        :param iterable kwargs_list: Keyword arguments of each call.
+        :param int max_workers: Number of calls made at the same time.
+        :param int max_pending: Maximum number of calls submitted ahead of the results
+         that have been consumed; twice `max_workers` by default.
+        :param bool return_exceptions: Whether to yield the exception raised by a call,
+         such as `LBRYError`, in place of its result instead of raising it.
+        :return: Generator of the value returned by each call
+        """
+        from pybry.fanout import fan_out
+
+        return fan_out(lambda kwargs: func(**kwargs), kwargs_list,
+                       max_workers, max_pending, return_exceptions)
+
+    def fan_out_chunks(self, func, argument, values, chunk_size=50, max_workers=8,
+                       max_pending=None, return_exceptions=False, **kwargs):
+        """Split a multi-valued argument into chunks, and make one concurrent call per chunk.
+
+        >>> for result, response in lbry.fan_out_chunks(lbry.resolve, "urls", urls, chunk_size=100):
+        ...     resolved.update(result)
+
+        :param callable func: The API method to call, such as `lbry.resolve`.
+        :param str argument: Name of the argument that takes a list, such as `urls`.
+        :param iterable values: Values to split across the calls.
+        :param int chunk_size: Maximum number of values sent in a call.
+        :param int max_workers: Number of calls made at the same time.
+        :param int max_pending: Maximum number of calls submitted ahead of the results
+         that have been consumed; twice `max_workers` by default.
+        :param bool return_exceptions: Whether to yield the exception raised by a call
+         in place of its result instead of raising it.
+        :param kwargs: Other keyword arguments given to every call.
+        :return: Generator of the value returned by the call of each chunk
+        """
+        from pybry.fanout import chunked
+
+        kwargs_list = (dict(kwargs, **{argument: chunk}) for chunk in chunked(values, chunk_size))
+        return self.fan_out(func, kwargs_list, max_workers, max_pending, return_exceptions)
+
+    def make_batch_request(self, url, calls, basic_auth=None, timeout=600):
+        """Makes a single POST request containing a JSON-RPC 2.0 batch of several calls.
+
+        The results are matched to the calls by their request ID,
+        and returned in the same order as the calls.
+        A call that fails doesn't affect the others; its place in the results
+        is taken by the `LBRYError` describing the failure, which is returned, not raised.
+
+        :param str url: URL to connect to.
+        :param list calls: Sequence of `(method, params)` pairs to send.
+        :param list | tuple basic_auth: List containing your username and password as ['username', 'password'].
+        :param float timeout: Amount of seconds to wait for the server's response before we timeout.
+        :raises LBRYException: If the whole batch is rejected by the server
+        :return: The list of results, or `LBRYError` objects, and the response,
+         depending on the result mode of the instance
+        :rtype: list, PreparedResponse
+        """
+        value = self._make_batch_request(url, calls, basic_auth, timeout)
+
+        if self.result_mode == "result":
+            return value[0]
+
+        return value
+
+    def _make_batch_request(self, url, calls, basic_auth, timeout):
+        """Send a batch, and return its results together with the response or its `ResponseMeta`."""
+        data = [self._build_payload(method, self._clean_params(params)) for method, params in calls]
+
+        if not data:
+            return [], None
+
+        prepared = self._prepare(url, data, basic_auth)
+
+        info = None
+        if self.hooks:
+            from pybry.instrumentation import CallInfo
+            info = CallInfo(self.hooks, url, "batch", [item["id"] for item in data],
+                            [item["method"] for item in data])
+            info.sending(len(prepared.body))
+
+        try:
+            response = self._send(prepared, data, timeout)
+            if info is not None:
+                info.received(response.status_code, len(response.content))
+            response_json = self.codec.loads(response.content)
+            results = match_batch_results(data, response_json, response.status_code, prepared)
+
+        except (requests.RequestException, ValueError, lbryex.LBRYError) as RE:
+            if info is not None:
+                info.failed(RE)
+            if isinstance(RE, lbryex.LBRYError):
+                raise
+
             print(RE)
             print("Printing request:")
             lbryex.print_request(prepared)
 
             return None, None
 
+        if info is not None:
+            info.succeeded()
+
+        return self._slim(results, response, [call["id"] for call in data])
+
+    def batch(self):
+        """Return a builder that sends the calls made through it in a single batch request.
+
+        >>> with lbry.batch() as batch:
+        ...     first = batch.resolve(urls=["@LBRYPlaylists"])
+        ...     second = batch.call("claim_search", {"name": "LBRYPlaylists"})
+        >>> first.result()
+
+        The subclass must implement `call_many`.
+        """
+        return Batch(self)
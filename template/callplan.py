@@ -0,0 +1,171 @@
+"""Precompiled plans of the calls made by the generated methods.
+
+Every call used to build the parameters of its command as a dictionary,
+filter out the ones that are None into another one, encode the whole
+JSON-RPC envelope, and prepare a new `requests.Request` from scratch.
+The generated wrappers have a `CallPlan` for each command instead,
+in their `PLANS` attribute, which knows the names of the parameters
+and the encoded envelope of the command:
+>>> PLANS.resolve(["lbry://what"], None)
+{'urls': ['lbry://what']}
+
+The parameters it returns are `PlannedParams`, a `dict` that remembers
+its plan, so the request only encodes the parameters that are set,
+and joins them with the envelope. The requests themselves are copied
+from a `RequestTemplate` of their URL, whose headers and authentication
+are only prepared once.
+"""
+import itertools
+
+import requests
+
+# Headers of every request, with and without keep-alive
+HEADERS = {"Content-Type": "application/json-rpc",
+           "user-agent": "LBRY python3-api"}
+CLOSE_HEADERS = dict(HEADERS, Connection="close")
+
+# `next` on a `count` is atomic, so the IDs are unique without a lock
+_request_ids = itertools.count(1)
+_last_request_id = 0
+
+
+def next_request_id():
+    """Return a new request ID; safe to call from several threads.
+
+    :rtype: int
+    """
+    global _last_request_id
+    _last_request_id = request_id = next(_request_ids)
+    return request_id
+
+
+def last_request_id():
+    """Return the last request ID returned by `next_request_id`, or 0 before the first one.
+
+    :rtype: int
+    """
+    return _last_request_id
+
+
+class PlannedParams(dict):
+    """The parameters of a call that are set, built by the `CallPlan` of its command."""
+
+    __slots__ = ("plan",)
+
+
+class CallPlan:
+    """The parameters of a command, and the encoded envelope of its calls."""
+
+    __slots__ = ("method", "names", "envelope")
+
+    def __init__(self, method, names):
+        """
+        :param str method: Name of the command
+        :param tuple names: Names of its parameters, in the order of the arguments of its method
+        """
+        self.method = method
+        self.names = tuple(names)
+        # The JSON-RPC object up to its parameters, which are followed by the ID
+        self.envelope = f'{{"jsonrpc":"2.0","method":"{method}","params":'.encode("utf-8")
+
+    def __call__(self, *values):
+        """Return the parameters whose value is set, as `PlannedParams`.
+
+        :param values: The values of the parameters, in the order of `names`
+        :rtype: PlannedParams
+        """
+        params = PlannedParams()
+        for name, value in zip(self.names, values):
+            if value is not None:
+                params[name] = value
+        params.plan = self
+        return params
+
+    def encode(self, params, request_id, codec):
+        """Return the body of the request of a call.
+
+        :param dict params: The parameters of the call
+        :param int request_id: Its JSON-RPC ID
+        :param codec: The codec encoding the parameters, such as `pybry.codec.JsonCodec`
+        :rtype: bytes
+        """
+        encoded = codec.dumps(params)
+        if isinstance(encoded, str):
+            encoded = encoded.encode("utf-8")
+        return b"".join((self.envelope, encoded, b',"id":%d}' % request_id))
+
+    def __repr__(self):
+        return f"<CallPlan {self.method}({', '.join(self.names)})>"
+
+
+class CallPlans:
+    """The plans of the commands of a wrapper, as attributes named after the commands."""
+
+    def __init__(self, commands=None):
+        """
+        :param dict commands: Names of the parameters of each command
+        """
+        for method, names in (commands or {}).items():
+            self.add(method, names)
+
+    def add(self, method, names):
+        """Add the plan of a command, and return it.
+
+        :rtype: CallPlan
+        """
+        plan = CallPlan(method, names)
+        setattr(self, method, plan)
+        return plan
+
+
+def encode_call(data, codec):
+    """Return the body of the request of a call, or of a batch, encoded with its plan if it has one.
+
+    :param dict | list data: The JSON-RPC object of the call, or the list of those of a batch
+    :param codec: The codec encoding the request, such as `pybry.codec.JsonCodec`
+    :rtype: bytes
+    """
+    if type(data) is dict:
+        params = data["params"]
+        if type(params) is PlannedParams:
+            return params.plan.encode(params, data["id"], codec)
+    return codec.dumps(data)
+
+
+class RequestTemplate:
+    """A prepared POST request to a URL, copied for each call with its body.
+
+    The URL, the headers and the authentication are only prepared once.
+    """
+
+    __slots__ = ("url", "headers", "cookies", "hooks")
+
+    def __init__(self, url, basic_auth=None, keep_alive=True):
+        """
+        :param str url: URL of the requests
+        :param list | tuple basic_auth: Username and password, if the server requires them
+        :param bool keep_alive: Whether the connection is kept open after the request
+        """
+        prepared = requests.Request("POST", url, data=b"",
+                                    headers=HEADERS if keep_alive else CLOSE_HEADERS,
+                                    auth=tuple(basic_auth) if basic_auth else None).prepare()
+        self.url = prepared.url
+        self.headers = prepared.headers
+        self.cookies = prepared._cookies
+        self.hooks = prepared.hooks
+
+    def prepare(self, body):
+        """Return the prepared request sending `body`.
+
+        :param bytes body: The encoded body
+        :rtype: requests.PreparedRequest
+        """
+        prepared = requests.PreparedRequest()
+        prepared.method = "POST"
+        prepared.url = self.url
+        prepared.headers = self.headers.copy()
+        prepared.headers["Content-Length"] = str(len(body))
+        prepared.body = body
+        prepared._cookies = self.cookies
+        prepared.hooks = self.hooks
+        return prepared
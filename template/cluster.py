@@ -0,0 +1,253 @@
+"""Spread the calls of a wrapper across several daemons.
+
+A `Cluster` is given to a wrapper, which then sends its read-only calls
+to the healthy daemons of the cluster, and the calls that change the state
+of the wallet to its primary daemon, without changing the call sites:
+>>> cluster = Cluster(["http://10.0.0.1:5279", "http://10.0.0.2:5279"],
+...                   strategy="least_outstanding")
+>>> lbry = LbrydApi(cluster=cluster)
+>>> cluster.start()
+
+The daemons are chosen with one of the `STRATEGIES`:
+- "round_robin" takes them in turn,
+- "least_outstanding" takes the one with the fewest calls in flight,
+- "latency" takes them at random, weighted by the inverse of their recent latency.
+
+A daemon is ejected for a while when several calls to it fail in a row,
+or when its recent latency is too high; the health checks, which call
+`status` on every `lbrynet` daemon, or `getblockcount` on every `lbrycrd` node,
+periodically after `start()`, eject and readmit them too.
+If every daemon is ejected, the calls are spread across all of them anyway.
+"""
+import itertools
+import random
+import threading
+import time
+
+import requests
+
+from pybry import lbryd_spec
+from pybry.constants import LBRYCRD_READ_ONLY_COMMANDS
+
+STRATEGIES = ("round_robin", "least_outstanding", "latency")
+
+
+class Node:
+    """A daemon of a cluster, and what is known about its health."""
+
+    __slots__ = ("url", "outstanding", "latency", "failures", "ejected_until", "calls")
+
+    def __init__(self, url):
+        self.url = url
+        self.outstanding = 0
+        # Exponentially weighted moving average of the latency, in seconds
+        self.latency = None
+        self.failures = 0
+        self.ejected_until = 0.0
+        self.calls = 0
+
+    def __repr__(self):
+        return f"<Node {self.url} outstanding={self.outstanding} latency={self.latency}>"
+
+
+class Cluster:
+    """Thread-safe pool of equivalent daemons, shared by the calls of one or several wrappers."""
+
+    def __init__(self, urls, primary=None, strategy="round_robin", read_only=None,
+                 read_from_primary=True, max_failures=3, eject_time=30.0, slow_latency=None,
+                 smoothing=0.2, health_method=None, health_timeout=2.0, auth=None):
+        """
+        :param list urls: URLs of the daemons.
+        :param str primary: URL of the daemon receiving the calls that change the state
+         of the wallet; the first of `urls` by default.
+        :param str strategy: How the daemon of a read-only call is chosen, one of `STRATEGIES`.
+        :param iterable read_only: Methods that can be sent to any daemon; the read-only
+         commands of the `lbrynet` API, and of `lbrycrd`, by default.
+        :param bool read_from_primary: Whether the primary also receives read-only calls.
+        :param int max_failures: Number of consecutive failed calls that eject a daemon.
+        :param float eject_time: Seconds during which an ejected daemon receives no calls.
+        :param float slow_latency: Recent latency, in seconds, above which a daemon
+         is ejected; daemons are never ejected for being slow by default.
+        :param float smoothing: Weight of the latest call in the average latency.
+        :param str health_method: Method called by the health checks; that of the first wrapper
+         given the cluster by default, `status` for `lbrynet` and `getblockcount` for `lbrycrd`.
+        :param float health_timeout: Seconds after which a health check fails.
+        :param list | tuple auth: Username and password of the daemons, sent by the health checks;
+         those of the first wrapper given the cluster by default.
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"The strategy must be one of {STRATEGIES}")
+        if not urls:
+            raise ValueError("A cluster needs at least one daemon")
+
+        self.nodes = [Node(url) for url in urls]
+        primary = primary or urls[0]
+        if primary not in urls:
+            self.nodes.append(Node(primary))
+        self.primary = next(node for node in self.nodes if node.url == primary)
+
+        self.strategy = strategy
+        if read_only is None:
+            read_only = lbryd_spec.READ_ONLY | frozenset(LBRYCRD_READ_ONLY_COMMANDS)
+        self.read_only = frozenset(read_only)
+        self.read_from_primary = read_from_primary
+        self.max_failures = max_failures
+        self.eject_time = eject_time
+        self.slow_latency = slow_latency
+        self.smoothing = smoothing
+        self.health_method = health_method
+        self.health_timeout = health_timeout
+        self.auth = auth
+
+        self._turn = itertools.count()
+        self._lock = threading.Lock()
+        self._stopped = None
+        self._session = requests.Session()
+
+    def attach(self, health_method, auth=None):
+        """Set how the health checks call the daemons, unless it was given to the cluster;
+        called by the wrappers given the cluster.
+
+        :param str health_method: Method of the API of the wrapper that checks the health of a daemon
+        :param list | tuple auth: Username and password of the wrapper, if any
+        """
+        with self._lock:
+            if self.health_method is None:
+                self.health_method = health_method
+            if self.auth is None:
+                self.auth = auth
+
+    def _readers(self, now):
+        """Return the daemons that may receive a read-only call."""
+        nodes = [node for node in self.nodes
+                 if self.read_from_primary or node is not self.primary or len(self.nodes) == 1]
+        healthy = [node for node in nodes if node.ejected_until <= now]
+        return healthy or nodes
+
+    def acquire(self, methods):
+        """Choose the daemon of a request, and count it as in flight on that daemon.
+
+        Every call to `acquire` must be followed by a call to `release`.
+
+        :param list methods: The method of the call, or the methods of a batch
+        :rtype: Node
+        """
+        with self._lock:
+            if not all(method in self.read_only for method in methods):
+                node = self.primary
+            else:
+                nodes = self._readers(time.monotonic())
+
+                if self.strategy == "round_robin":
+                    node = nodes[next(self._turn) % len(nodes)]
+                elif self.strategy == "least_outstanding":
+                    node = min(nodes, key=lambda n: (n.outstanding, n.latency or 0.0))
+                else:
+                    known = [n.latency for n in nodes if n.latency]
+                    default = sum(known) / len(known) if known else 1.0
+                    node = random.choices(nodes, [1 / (n.latency or default) for n in nodes])[0]
+
+            node.outstanding += 1
+            node.calls += 1
+            return node
+
+    def release(self, node, elapsed=None, failed=False):
+        """Record the end of a request sent to a daemon.
+
+        :param Node node: The daemon returned by `acquire`
+        :param float elapsed: Seconds until the response was received
+        :param bool failed: Whether the daemon could not be reached, or was unavailable
+        """
+        with self._lock:
+            node.outstanding -= 1
+            self._record(node, elapsed, failed)
+
+    def _record(self, node, elapsed, failed):
+        now = time.monotonic()
+
+        if failed:
+            node.failures += 1
+            if node.failures >= self.max_failures:
+                node.ejected_until = now + self.eject_time
+            return
+
+        node.failures = 0
+        if elapsed is not None:
+            if node.latency is None:
+                node.latency = elapsed
+            else:
+                node.latency += self.smoothing * (elapsed - node.latency)
+
+            if self.slow_latency is not None and node.latency > self.slow_latency:
+                node.ejected_until = now + self.eject_time
+                # Measure it again once it is readmitted
+                node.latency = None
+
+    def check(self):
+        """Call the health method on every daemon, and eject or readmit them.
+
+        :return: Whether each daemon is healthy, by URL
+        :rtype: dict
+        """
+        health_method = self.health_method or "status"
+        health = {}
+        for node in self.nodes:
+            start = time.perf_counter()
+            try:
+                response = self._session.post(node.url,
+                                              json={"method": health_method, "params": {},
+                                                    "jsonrpc": "2.0", "id": 0},
+                                              auth=self.auth, timeout=self.health_timeout)
+                result = response.json().get("result")
+                healthy = response.ok and result is not None
+                if isinstance(result, dict) and result.get("is_running") is False:
+                    healthy = False
+            except (requests.RequestException, ValueError):
+                healthy = False
+            elapsed = time.perf_counter() - start
+
+            with self._lock:
+                if healthy:
+                    node.ejected_until = 0.0
+                    self._record(node, elapsed, False)
+                else:
+                    node.failures = max(node.failures, self.max_failures - 1)
+                    self._record(node, None, True)
+
+            health[node.url] = healthy and node.ejected_until <= time.monotonic()
+        return health
+
+    def start(self, interval=10.0):
+        """Check the health of the daemons every `interval` seconds, in a background thread."""
+        if self._stopped is not None:
+            return
+
+        self._stopped = stopped = threading.Event()
+
+        def run():
+            while not stopped.is_set():
+                self.check()
+                stopped.wait(interval)
+
+        threading.Thread(target=run, name="pybry-cluster-health", daemon=True).start()
+
+    def stop(self):
+        """Stop the health checks started by `start`."""
+        if self._stopped is not None:
+            self._stopped.set()
+            self._stopped = None
+
+    def stats(self):
+        """Return the state of every daemon, by URL.
+
+        :rtype: dict
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {node.url: {"primary": node is self.primary,
+                               "healthy": node.ejected_until <= now,
+                               "outstanding": node.outstanding,
+                               "latency": node.latency,
+                               "failures": node.failures,
+                               "calls": node.calls}
+                    for node in self.nodes}
@@ -34,3 +34,18 @@ class LBRYError(Exception):
         self.status_code = status_code
         self.request = request
 
+
+class DaemonUnavailableError(LBRYError):
+    """Exception raised when a daemon could not be reached, after the retries of the call.
+
+    It is only raised by the wrappers with a retry policy, a circuit breaker or a deadline;
+    the error of the last attempt is its `__cause__`.
+    """
+
+
+class CircuitOpenError(DaemonUnavailableError):
+    """Exception raised without calling the daemon, while its circuit breaker is open."""
+
+
+class DeadlineExceededError(DaemonUnavailableError):
+    """Exception raised when the deadline of a call passed before it succeeded."""
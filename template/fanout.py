@@ -0,0 +1,116 @@
+"""Run many calls to the daemons concurrently, with bounded concurrency.
+
+Bulk workloads, like resolving thousands of URLs, are spread over
+a fixed number of worker threads (or concurrent tasks for the
+asynchronous wrappers). Only a bounded number of calls is submitted
+ahead of the results that have been consumed, so the input can be
+a lazy iterable of any length, and the daemon is never sent more than
+`max_workers` calls at the same time.
+The results are always yielded in the same order as the input.
+"""
+import asyncio
+import collections
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+
+def chunked(values, size):
+    """Yield lists of at most `size` consecutive elements of `values`.
+
+    :param iterable values: Values to split
+    :param int size: Maximum number of values in a chunk
+    """
+    if size < 1:
+        raise ValueError("The chunk size must be at least 1")
+
+    values = iter(values)
+    while True:
+        chunk = list(islice(values, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def fan_out(func, items, max_workers=8, max_pending=None, return_exceptions=False):
+    """Call `func(item)` for every item in a pool of threads, yielding the results in order.
+
+    :param callable func: Function called with each item
+    :param iterable items: Arguments for `func`; it is consumed lazily
+    :param int max_workers: Number of calls made at the same time
+    :param int max_pending: Maximum number of calls submitted ahead of the results
+     that have been consumed; twice `max_workers` by default
+    :param bool return_exceptions: Whether to yield the exception raised by a call
+     in place of its result, instead of raising it
+    """
+    max_pending = max(max_pending or 2 * max_workers, max_workers)
+    items = iter(items)
+    pending = collections.deque()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for item in islice(items, max_pending):
+                pending.append(executor.submit(func, item))
+
+            while pending:
+                future = pending.popleft()
+
+                # Keep the pool busy while the result is consumed
+                for item in islice(items, 1):
+                    pending.append(executor.submit(func, item))
+
+                try:
+                    result = future.result()
+                except Exception as err:
+                    if not return_exceptions:
+                        raise
+                    result = err
+
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+async def afan_out(func, items, max_workers=8, max_pending=None, return_exceptions=False):
+    """Asynchronous version of `fan_out`, for coroutine functions.
+
+    At most `max_workers` coroutines run at the same time.
+
+    :param callable func: Coroutine function called with each item
+    :param iterable items: Arguments for `func`; it is consumed lazily
+    :param int max_workers: Number of calls made at the same time
+    :param int max_pending: Maximum number of calls scheduled ahead of the results
+     that have been consumed; twice `max_workers` by default
+    :param bool return_exceptions: Whether to yield the exception raised by a call
+     in place of its result, instead of raising it
+    """
+    max_pending = max(max_pending or 2 * max_workers, max_workers)
+    semaphore = asyncio.Semaphore(max_workers)
+    items = iter(items)
+    pending = collections.deque()
+
+    async def bounded(item):
+        async with semaphore:
+            return await func(item)
+
+    try:
+        for item in islice(items, max_pending):
+            pending.append(asyncio.ensure_future(bounded(item)))
+
+        while pending:
+            task = pending.popleft()
+
+            for item in islice(items, 1):
+                pending.append(asyncio.ensure_future(bounded(item)))
+
+            try:
+                result = await task
+            except Exception as err:
+                if not return_exceptions:
+                    raise
+                result = err
+
+            yield result
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,347 @@
+"""Subscriptions to the new claims of channels, tags or any other search.
+
+Watching channels for new uploads by calling `claim_search` in a loop
+requests the same first pages again and again. A `ClaimFeed` keeps a cursor,
+the creation height reached, for each search instead, and only requests
+the claims created since; each new claim is delivered once.
+>>> feed = ClaimFeed(LbrydApi(), interval=30)
+>>> feed.subscribe(channel_ids=["3c1fb2e6..."], claim_type="stream")
+>>> feed.subscribe(any_tags=["science"])
+>>> for claim, subscriptions in feed:
+...     print(claim["permanent_url"])
+
+The subscriptions whose other parameters are the same are multiplexed:
+their `channel_ids`, or their `any_tags`, are merged into a single search,
+and the claims found are routed back to the subscriptions they match.
+The searches that are due are sent together in a batch request.
+A search that finds nothing is polled less and less often, up to `max_interval`,
+and one that finds new claims more often, down to `min_interval`.
+
+A subscription without a `start_height` starts at the newest claim of its search,
+so it only receives the claims created after it subscribed.
+"""
+import asyncio
+import json
+import time
+
+from pybry.exception import LBRYError
+
+# Parameters whose values are merged into the search of several subscriptions
+MERGED = ("channel_ids", "any_tags")
+
+
+def creation_height(claim):
+    """Return the height of the block in which a claim was created.
+
+    :param dict claim: A claim returned by `claim_search`
+    :rtype: int
+    """
+    height = (claim.get("meta") or {}).get("creation_height")
+    if height is None:
+        height = claim.get("height")
+    return height or 0
+
+
+def merged_values(claim, parameter):
+    """Return the values of a merged parameter that a claim matches.
+
+    :param dict claim: A claim returned by `claim_search`
+    :param str parameter: "channel_ids" or "any_tags"
+    :rtype: set
+    """
+    if parameter == "channel_ids":
+        return {(claim.get("signing_channel") or {}).get("claim_id")}
+    return {tag.lower() for tag in (claim.get("value") or {}).get("tags") or ()}
+
+
+class Subscription:
+    """A `claim_search` whose new claims are delivered by a `ClaimFeed`."""
+
+    def __init__(self, params, start_height=None):
+        """
+        :param dict params: Parameters of `claim_search`
+        :param int start_height: Creation height from which the claims are delivered;
+         from the newest claim when it subscribes by default
+        """
+        self.params = params
+        self.start_height = start_height
+        self.merged = next((name for name in MERGED if params.get(name)), None)
+
+        values = params.get(self.merged) if self.merged else ()
+        values = [values] if isinstance(values, str) else values
+        if self.merged == "any_tags":
+            values = [value.lower() for value in values]
+        self.values = frozenset(values)
+
+        # Key of the searches this subscription can be merged into
+        others = {k: v for (k, v) in params.items() if k != self.merged and v is not None}
+        self.key = (self.merged, json.dumps(others, sort_keys=True, default=str))
+        self.search = None
+
+    def matches(self, claim):
+        """Return whether a claim found by the search of this subscription is one of its claims."""
+        if self.start_height is not None and creation_height(claim) < self.start_height:
+            return False
+        return not self.merged or not self.values.isdisjoint(merged_values(claim, self.merged))
+
+    def __repr__(self):
+        return f"<Subscription {self.params!r}>"
+
+
+class _Search:
+    """A `claim_search` polled for several subscriptions, with its cursor and interval."""
+
+    def __init__(self, subscription, interval):
+        self.merged = subscription.merged
+        self.params = {k: v for (k, v) in subscription.params.items()
+                       if k != self.merged and v is not None}
+        self.subscriptions = []
+        # Creation height from which the claims are requested; None until the newest claim is known
+        self.cursor = subscription.start_height
+        self.interval = interval
+        self.next_poll = 0.0
+
+    def values(self):
+        values = set()
+        for subscription in self.subscriptions:
+            values |= subscription.values
+        return values
+
+    def request(self, cursor, page, page_size):
+        """Return the parameters of `claim_search` for a page of the claims created since `cursor`."""
+        params = dict(self.params, page=page, page_size=page_size, no_totals=True)
+        if self.merged:
+            params[self.merged] = sorted(self.values())
+
+        if cursor is None:
+            # Only the newest claims, to find where the subscriptions start
+            params["order_by"] = ["creation_height"]
+        else:
+            params["order_by"] = ["^creation_height"]
+            params["creation_height"] = f">={cursor}"
+        return params
+
+
+class ClaimFeed:
+    """Polls the searches of its subscriptions, and yields the new claims they find."""
+
+    def __init__(self, api, interval=30, min_interval=5, max_interval=600,
+                 page_size=50, max_pages=20, max_values=200, overlap=1):
+        """
+        :param LbrydApi api: The wrapper the searches are sent with; it must support `call_many`
+        :param float interval: Seconds between the first polls of a search
+        :param float min_interval: Shortest interval, for searches that keep finding claims
+        :param float max_interval: Longest interval, for searches that don't find any
+        :param int page_size: Number of claims requested in each page
+        :param int max_pages: Maximum number of pages of a search requested in a poll;
+         the next poll continues from there
+        :param int max_values: Maximum number of channels or tags merged into a search
+        :param int overlap: Number of blocks below the cursor that are searched again,
+         for the claims the hub indexed late
+        """
+        self.api = api
+        self.interval = interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.max_values = max_values
+        self.overlap = overlap
+
+        self.searches = []
+        # Claim id of the claims delivered recently, with their height and subscriptions
+        self._seen = {}
+
+    def subscribe(self, start_height=None, **params):
+        """Subscribe to the new claims of a search.
+
+        :param int start_height: Creation height from which the claims are delivered;
+         from the newest claim when it subscribes by default
+        :param params: Parameters of `claim_search`, such as `channel_ids`, `any_tags`
+         or `claim_type`; `page`, `page_size` and `order_by` are set by the feed
+        :rtype: Subscription
+        """
+        for name in ("page", "page_size", "order_by", "creation_height"):
+            if name in params:
+                raise ValueError(f"The '{name}' of the searches is set by the feed")
+
+        subscription = Subscription(params, start_height)
+        search = next((search for search in self.searches if self._can_join(search, subscription)), None)
+        if search is None:
+            search = _Search(subscription, self.interval)
+            self.searches.append(search)
+
+        if subscription.start_height is None and search.cursor is not None:
+            subscription.start_height = search.cursor
+        search.subscriptions.append(subscription)
+        subscription.search = search
+        return subscription
+
+    def _can_join(self, search, subscription):
+        first = search.subscriptions[0]
+        if first.key != subscription.key:
+            return False
+        if subscription.merged and len(search.values() | subscription.values) > self.max_values:
+            return False
+        if search.cursor is None:
+            return subscription.start_height is None
+        # A search doesn't go back for a subscription that starts lower
+        return subscription.start_height is None or subscription.start_height >= search.cursor
+
+    def unsubscribe(self, subscription):
+        """Stop delivering the claims of a subscription."""
+        search = subscription.search
+        if search is None:
+            return
+        search.subscriptions.remove(subscription)
+        if not search.subscriptions:
+            self.searches.remove(search)
+        subscription.search = None
+
+    # Polling
+
+    def _due(self, now, force):
+        return [search for search in self.searches if force or search.next_poll <= now]
+
+    def _calls(self, pending):
+        return [("claim_search", search.request(cursor, page, self.page_size))
+                for (search, cursor, page) in pending]
+
+    def _receive(self, pending, results, found):
+        """Add the new claims of a round of requests to `found`, and return the requests of the next round."""
+        next_round = []
+        for (search, cursor, page), result in zip(pending, results or [None] * len(pending)):
+            if result is None or isinstance(result, LBRYError):
+                # Polled again at the next interval, from the same cursor
+                continue
+
+            claims = (result.get("items") or []) if isinstance(result, dict) else result
+            if cursor is None:
+                # The newest claims only mark where the subscriptions start
+                search.cursor = max((creation_height(claim) for claim in claims), default=0)
+                for claim in claims:
+                    _, notified = self._seen.get(claim["claim_id"], (None, ()))
+                    self._seen[claim["claim_id"]] = (creation_height(claim),
+                                                     set(notified) | set(search.subscriptions))
+                for subscription in search.subscriptions:
+                    subscription.start_height = search.cursor
+                continue
+
+            for claim in claims:
+                self._deliver(search, claim, found)
+                search.cursor = max(search.cursor, creation_height(claim))
+
+            if len(claims) >= self.page_size and page < self.max_pages:
+                next_round.append((search, cursor, page + 1))
+        return next_round
+
+    def _deliver(self, search, claim, found):
+        height, notified = self._seen.get(claim["claim_id"], (None, ()))
+        subscriptions = [subscription for subscription in search.subscriptions
+                         if subscription not in notified and subscription.matches(claim)]
+        if not subscriptions:
+            return
+
+        self._seen[claim["claim_id"]] = (creation_height(claim), set(notified) | set(subscriptions))
+        # Several searches of a round can find the same claim; it is delivered once
+        entry = found.get(claim["claim_id"])
+        if entry is None:
+            found[claim["claim_id"]] = (claim, subscriptions)
+        else:
+            entry[1].extend(subscriptions)
+
+    def _reschedule(self, due, found, now):
+        searches = {id(subscription.search) for (_, subscriptions) in found.values()
+                    for subscription in subscriptions}
+        for search in due:
+            if id(search) in searches:
+                search.interval = max(self.min_interval, search.interval / 2)
+            else:
+                search.interval = min(self.max_interval, search.interval * 1.5)
+            search.next_poll = now + search.interval
+
+        # Only the claims at or above the lowest cursor can be found again
+        cursors = [search.cursor for search in self.searches if search.cursor is not None]
+        if cursors:
+            floor = min(cursors) - self.overlap
+            self._seen = {claim_id: seen for (claim_id, seen) in self._seen.items() if seen[0] >= floor}
+
+    def poll(self, force=False):
+        """Request the claims created since the last poll of the searches that are due.
+
+        The first page of every search is requested in a single batch request,
+        and so are their next pages.
+
+        :param bool force: Whether every search is polled, even if it is not due
+        :return: The new claims, with the subscriptions each one matches, in the order they were created
+        :rtype: list
+        """
+        now = time.monotonic()
+        due = self._due(now, force)
+        found = {}
+
+        pending = [(search, self._floor(search), 1) for search in due]
+        while pending:
+            results = self._call_many(self._calls(pending))
+            pending = self._receive(pending, results, found)
+
+        self._reschedule(due, found, now)
+        return sorted(found.values(), key=lambda entry: creation_height(entry[0]))
+
+    def _floor(self, search):
+        return None if search.cursor is None else max(search.cursor - self.overlap, 0)
+
+    def _call_many(self, calls):
+        value = self.api.call_many(calls)
+        # In the "response" and "meta" result modes, the results come with the response
+        return value[0] if isinstance(value, tuple) else value
+
+    def next_poll(self):
+        """Return the seconds until a search is due, or None without subscriptions.
+
+        :rtype: float
+        """
+        if not self.searches:
+            return None
+        return max(0.0, min(search.next_poll for search in self.searches) - time.monotonic())
+
+    def __iter__(self):
+        """Yield the new claims and the subscriptions they match, waiting for them, while there are subscriptions."""
+        while self.searches:
+            yield from self.poll()
+            delay = self.next_poll()
+            if delay:
+                time.sleep(delay)
+
+
+class AsyncClaimFeed(ClaimFeed):
+    """`ClaimFeed` for an `AsyncLbrydApi`; `poll` is a coroutine, and it is iterated with `async for`."""
+
+    async def poll(self, force=False):
+        """Request the claims created since the last poll of the searches that are due.
+
+        The arguments and the result are the same as in `ClaimFeed.poll`.
+        """
+        now = time.monotonic()
+        due = self._due(now, force)
+        found = {}
+
+        pending = [(search, self._floor(search), 1) for search in due]
+        while pending:
+            value = await self.api.call_many(self._calls(pending))
+            results = value[0] if isinstance(value, tuple) else value
+            pending = self._receive(pending, results, found)
+
+        self._reschedule(due, found, now)
+        return sorted(found.values(), key=lambda entry: creation_height(entry[0]))
+
+    def __iter__(self):
+        raise TypeError("Iterate over an AsyncClaimFeed with 'async for'")
+
+    async def __aiter__(self):
+        while self.searches:
+            for entry in await self.poll():
+                yield entry
+            delay = self.next_poll()
+            if delay:
+                await asyncio.sleep(delay)
@@ -0,0 +1,319 @@
+"""Hooks called around every request to the daemons, for metrics and tracing.
+
+A hook is an object with the methods of `Hook`; the hooks given to a wrapper
+are called, in order, before each request is sent, and after its response
+is received or it fails:
+>>> metrics = MetricsCollector()
+>>> lbry = LbrydApi(hooks=[metrics])
+>>> lbry.resolve(urls=["@LBRYPlaylists"])
+>>> print(metrics.to_prometheus())
+
+Each request is described by a `CallInfo`, which is only created
+when the wrapper has hooks, so instrumentation costs nothing otherwise.
+An exception raised by a hook is not caught, so hooks should not fail.
+"""
+import threading
+import time
+
+# Upper bounds of the latency histograms, in seconds
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class CallInfo:
+    """A request to a daemon, as seen by the hooks.
+
+    A batch is a single request whose `method` is "batch";
+    the methods of its calls are in `methods`.
+    The hooks may keep their own state about the request in `context`.
+    """
+
+    __slots__ = ("hooks", "url", "method", "methods", "request_id", "request_size",
+                 "start", "elapsed", "status_code", "response_size", "error", "context")
+
+    def __init__(self, hooks, url, method, request_id, methods=None):
+        """
+        :param tuple hooks: The hooks of the wrapper
+        :param str url: URL of the daemon
+        :param str method: The API method called, or "batch"
+        :param int | list request_id: The JSON-RPC ID of the request, or the IDs of a batch
+        :param list methods: The API methods of a batch
+        """
+        self.hooks = hooks
+        self.url = url
+        self.method = method
+        self.methods = methods
+        self.request_id = request_id
+        self.request_size = None
+        self.start = None
+        self.elapsed = None
+        self.status_code = None
+        self.response_size = None
+        self.error = None
+        self.context = {}
+
+    def sending(self, request_size):
+        """Call `before_request` on the hooks, once the body of the request is encoded."""
+        self.request_size = request_size
+        for hook in self.hooks:
+            hook.before_request(self)
+        self.start = time.perf_counter()
+
+    def received(self, status_code, size):
+        """Record the response, before it is decoded."""
+        self.elapsed = time.perf_counter() - self.start
+        self.status_code = status_code
+        self.response_size = size
+
+    def succeeded(self):
+        """Call `after_response` on the hooks."""
+        if self.elapsed is None:
+            self.elapsed = time.perf_counter() - (self.start or time.perf_counter())
+        for hook in self.hooks:
+            hook.after_response(self)
+
+    def failed(self, error):
+        """Call `on_error` on the hooks, with the exception describing the failure."""
+        if self.elapsed is None:
+            self.elapsed = time.perf_counter() - (self.start or time.perf_counter())
+        self.error = error
+        for hook in self.hooks:
+            hook.on_error(self, error)
+
+
+class Hook:
+    """Interface of the hooks; every method does nothing by default.
+
+    Each request ends either with `after_response`, when a result was received,
+    or with `on_error`, when the daemon returned an error or could not be reached.
+    """
+
+    def before_request(self, call):
+        """Called before the request is sent.
+
+        :param CallInfo call: The request
+        """
+
+    def after_response(self, call):
+        """Called after a successful response is received and decoded.
+
+        :param CallInfo call: The request, with its `elapsed` time, `status_code` and `response_size`
+        """
+
+    def on_error(self, call, error):
+        """Called when the request failed.
+
+        :param CallInfo call: The request; `status_code` and `response_size` are None
+         if no response was received
+        :param Exception error: The `LBRYError`, or the connection or decoding error
+        """
+
+
+class MethodMetrics:
+    """Counters of the requests made to a single API method."""
+
+    __slots__ = ("calls", "errors", "latency_sum", "buckets", "request_bytes", "response_bytes")
+
+    def __init__(self, bucket_count):
+        self.calls = 0
+        self.errors = 0
+        self.latency_sum = 0.0
+        # The last bucket counts the requests slower than every bound
+        self.buckets = [0] * (bucket_count + 1)
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+
+class MetricsCollector(Hook):
+    """Hook recording the number of calls, the errors, the latency and the sizes of each method.
+
+    It can be shared by several wrappers, and used from several threads.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        """
+        :param tuple buckets: Increasing upper bounds of the latency histograms, in seconds
+        """
+        self.bounds = tuple(buckets)
+        self._methods = {}
+        self._lock = threading.Lock()
+
+    def _record(self, call, error):
+        elapsed = call.elapsed
+        bucket = 0
+        for bound in self.bounds:
+            if elapsed <= bound:
+                break
+            bucket += 1
+
+        with self._lock:
+            metrics = self._methods.get(call.method)
+            if metrics is None:
+                metrics = self._methods[call.method] = MethodMetrics(len(self.bounds))
+
+            metrics.calls += 1
+            if error:
+                metrics.errors += 1
+            metrics.latency_sum += elapsed
+            metrics.buckets[bucket] += 1
+            metrics.request_bytes += call.request_size or 0
+            metrics.response_bytes += call.response_size or 0
+
+    def after_response(self, call):
+        self._record(call, False)
+
+    def on_error(self, call, error):
+        self._record(call, True)
+
+    def reset(self):
+        """Forget everything that was recorded."""
+        with self._lock:
+            self._methods = {}
+
+    def quantile(self, method, fraction):
+        """Estimate a quantile of the latency of a method from its histogram.
+
+        :param str method: The API method
+        :param float fraction: The quantile, such as 0.99
+        :return: The upper bound of the bucket containing the quantile, in seconds;
+         infinity if it is slower than every bound, and None if the method was not called
+        :rtype: float
+        """
+        with self._lock:
+            metrics = self._methods.get(method)
+            if metrics is None or not metrics.calls:
+                return None
+            buckets, calls = list(metrics.buckets), metrics.calls
+
+        count = 0
+        for bound, in_bucket in zip(self.bounds + (float("inf"),), buckets):
+            count += in_bucket
+            if count >= fraction * calls:
+                return bound
+        return float("inf")
+
+    def to_dict(self):
+        """Return what was recorded for each method.
+
+        :return: A `dict` of the metrics of each method, with the cumulative
+         counts of the latency histogram by upper bound
+        :rtype: dict
+        """
+        with self._lock:
+            methods = {method: (metrics.calls, metrics.errors, metrics.latency_sum,
+                                list(metrics.buckets), metrics.request_bytes,
+                                metrics.response_bytes)
+                       for method, metrics in self._methods.items()}
+
+        result = {}
+        for method, (calls, errors, latency_sum, buckets, sent, received) in methods.items():
+            cumulative, count = {}, 0
+            for bound, in_bucket in zip(self.bounds + (float("inf"),), buckets):
+                count += in_bucket
+                cumulative[bound] = count
+
+            result[method] = {"calls": calls,
+                              "errors": errors,
+                              "error_rate": errors / calls if calls else 0.0,
+                              "latency_sum": latency_sum,
+                              "latency_buckets": cumulative,
+                              "request_bytes": sent,
+                              "response_bytes": received}
+        return result
+
+    def to_prometheus(self, prefix="pybry"):
+        """Return what was recorded in the Prometheus text exposition format.
+
+        :param str prefix: Prefix of the names of the metrics
+        :rtype: str
+        """
+        metrics = self.to_dict()
+        lines = []
+
+        def family(name, kind, description):
+            lines.append(f"# HELP {prefix}_{name} {description}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+        family("calls_total", "counter", "Requests made to the daemon.")
+        for method, values in metrics.items():
+            lines.append(f'{prefix}_calls_total{{method="{method}"}} {values["calls"]}')
+
+        family("errors_total", "counter", "Requests that failed.")
+        for method, values in metrics.items():
+            lines.append(f'{prefix}_errors_total{{method="{method}"}} {values["errors"]}')
+
+        family("request_duration_seconds", "histogram", "Time until the response was received.")
+        for method, values in metrics.items():
+            for bound, count in values["latency_buckets"].items():
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{prefix}_request_duration_seconds_bucket'
+                             f'{{method="{method}",le="{le}"}} {count}')
+            lines.append(f'{prefix}_request_duration_seconds_sum{{method="{method}"}} '
+                         f'{values["latency_sum"]}')
+            lines.append(f'{prefix}_request_duration_seconds_count{{method="{method}"}} '
+                         f'{values["calls"]}')
+
+        family("request_bytes_total", "counter", "Bytes sent in the bodies of the requests.")
+        for method, values in metrics.items():
+            lines.append(f'{prefix}_request_bytes_total{{method="{method}"}} '
+                         f'{values["request_bytes"]}')
+
+        family("response_bytes_total", "counter", "Bytes received in the bodies of the responses.")
+        for method, values in metrics.items():
+            lines.append(f'{prefix}_response_bytes_total{{method="{method}"}} '
+                         f'{values["response_bytes"]}')
+
+        return "\n".join(lines) + "\n"
+
+
+class TracingHook(Hook):
+    """Hook emitting an OpenTelemetry client span for each request.
+
+    `opentelemetry-api` is an optional dependency; it is only needed
+    when this hook is used.
+    """
+
+    def __init__(self, tracer=None):
+        """
+        :param opentelemetry.trace.Tracer tracer: Tracer creating the spans;
+         the one of the global tracer provider by default.
+        """
+        # Imported here, so that importing the package doesn't import OpenTelemetry when it is installed
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise ImportError("'opentelemetry-api' is required to emit tracing spans") from None
+
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer("pybry")
+
+    def before_request(self, call):
+        attributes = {"rpc.system": "jsonrpc",
+                      "rpc.method": call.method,
+                      "server.address": call.url,
+                      "http.request.body.size": call.request_size}
+        if call.methods:
+            attributes["pybry.batch.methods"] = call.methods
+
+        call.context[self] = self.tracer.start_span(f"lbry {call.method}",
+                                                    kind=self._trace.SpanKind.CLIENT,
+                                                    attributes=attributes)
+
+    def _end(self, call):
+        # Requests failing before they are sent have no span
+        span = call.context.pop(self, None)
+        if span is not None and call.status_code is not None:
+            span.set_attribute("http.response.status_code", call.status_code)
+            span.set_attribute("http.response.body.size", call.response_size)
+        return span
+
+    def after_response(self, call):
+        span = self._end(call)
+        if span is not None:
+            span.end()
+
+    def on_error(self, call, error):
+        span = self._end(call)
+        if span is not None:
+            span.record_exception(error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(error)))
+            span.end()
@@ -0,0 +1,177 @@
+"""Base classes of the compact result models.
+
+The results of the daemons are nested dictionaries, which use a lot
+of memory when many of them are kept. The models generated in
+`pybry.models` store the fields of the most common results,
+like claims, transaction outputs, transactions and files,
+in `__slots__` instead, and their fields are read as attributes.
+>>> lbry = LbrydApi(models=True)
+>>> result, response = lbry.claim_search(name="LBRYPlaylists")
+>>> result["items"][0].claim_id
+
+The conversion is lazy: the items of a page are kept as they were
+received, and each one is converted the first time it is accessed.
+"""
+from collections.abc import Sequence
+
+
+class Model:
+    """A result of the API with its fields stored in `__slots__`.
+
+    The fields that are not described in the API documentation are kept
+    in the `extra` dictionary, and the fields missing from the result are None.
+    """
+
+    __slots__ = ("extra",)
+
+    # Model of the fields that contain another result, or a list of them
+    _nested = {}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create the model from a result of the API.
+
+        :param dict data: The result as received from the daemon
+        :rtype: Model
+        """
+        obj = cls.__new__(cls)
+        extra = None
+        nested = cls._nested
+        fields = cls.__slots__
+
+        for key, value in data.items():
+            if key in nested and value is not None:
+                model = nested[key]
+                if isinstance(value, list):
+                    value = ModelList(value, model)
+                elif isinstance(value, dict):
+                    value = model.from_dict(value)
+
+            if key in fields and key != "extra":
+                setattr(obj, key, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+
+        obj.extra = extra
+        return obj
+
+    def __getattr__(self, name):
+        # Only called for the fields that were not set
+        if name in type(self).__slots__:
+            return None
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __getitem__(self, key):
+        """Read a field like in the original dictionary."""
+        if key in type(self).__slots__ and key != "extra":
+            return getattr(self, key)
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self):
+        """Return the result as a dictionary, like it was received from the daemon.
+
+        :rtype: dict
+        """
+        data = {}
+        for key in type(self).__slots__:
+            if key == "extra":
+                continue
+            try:
+                value = object.__getattribute__(self, key)
+            except AttributeError:
+                continue
+            if isinstance(value, (Model, ModelList)):
+                value = value.to_dict() if isinstance(value, Model) else value.to_list()
+            data[key] = value
+
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def __eq__(self, other):
+        if not isinstance(other, Model):
+            return NotImplemented
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ", ".join(f"{key}={getattr(self, key)!r}"
+                           for key in type(self).__slots__[:3] if key != "extra")
+        return f"{type(self).__name__}({fields}, ...)"
+
+
+class ModelList(Sequence):
+    """A list of results that are converted to models the first time they are accessed.
+
+    The converted items are kept apart from the list of results, which is never modified,
+    since it may be shared with a cache.
+    """
+
+    __slots__ = ("_items", "_model", "_models")
+
+    def __init__(self, items, model):
+        """
+        :param list items: The results as received from the daemon
+        :param type model: The `Model` subclass of the items
+        """
+        self._items = items
+        self._model = model
+        # The items converted so far, at the index of their result
+        self._models = [None] * len(items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._items)))]
+
+        model = self._models[index]
+        if model is not None:
+            return model
+
+        item = self._items[index]
+        if isinstance(item, dict):
+            item = self._models[index] = self._model.from_dict(item)
+        return item
+
+    def to_list(self):
+        """Return the items as dictionaries, like they were received from the daemon."""
+        return [model.to_dict() if model is not None else item
+                for item, model in zip(self._items, self._models)]
+
+    def __repr__(self):
+        return f"<ModelList of {len(self._items)} {self._model.__name__}>"
+
+
+def wrap_result(result, model, paginated):
+    """Return the result with its models, converted lazily.
+
+    The result is not modified, so it can be shared with a cache.
+
+    :param dict | list result: The result of a call
+    :param type model: The `Model` subclass of the result, or of its items
+    :param bool paginated: Whether the result is a page whose `items` are models
+    """
+    if paginated:
+        if isinstance(result, list):
+            return ModelList(result, model)
+        if isinstance(result, dict) and isinstance(result.get("items"), list):
+            return dict(result, items=ModelList(result["items"], model))
+        return result
+
+    if isinstance(result, dict):
+        return model.from_dict(result)
+
+    return result
@@ -0,0 +1,117 @@
+"""Iterators that stream the items of paginated commands across all their pages.
+
+The `lbrynet` commands that take `page` and `page_size` return a single page
+at a time. These iterators request the pages one after the other,
+yielding their items as they go, while the next page is already being
+requested in the background. Only the current page and the next one
+are held in memory, regardless of the total number of items.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+
+def page_items(result):
+    """Return the items of a page, and whether it is known to be the last page.
+
+    Paginated commands usually return a `dict` with the `items` of the page,
+    and the `page` and `total_pages` numbers; some older commands return
+    the list of items directly.
+
+    :param dict | list result: The result of a paginated command
+    :rtype: list, bool
+    """
+    if isinstance(result, list):
+        return result, not result
+
+    items = result.get("items") or []
+    return items, last_page(result, len(items))
+
+
+def last_page(result, count):
+    """Whether a page is known to be the last one.
+
+    :param dict result: The result of a paginated command; only its `page`,
+     `page_size` and `total_pages` numbers are used
+    :param int count: Number of items of the page
+    :rtype: bool
+    """
+    if not count:
+        return True
+
+    page, total_pages = result.get("page"), result.get("total_pages")
+    if page is not None and total_pages is not None:
+        return page >= total_pages
+
+    # Without totals, a page shorter than requested is the last one
+    page_size = result.get("page_size")
+    return page_size is not None and count < page_size
+
+
+def iter_pages(fetch_page, first_page=1, prefetch=True):
+    """Yield the items of every page returned by `fetch_page`.
+
+    :param callable fetch_page: Function that returns the result for a page number
+    :param int first_page: Number of the first page to request
+    :param bool prefetch: Whether to request the next page in a background thread
+     while the items of the current one are consumed
+    """
+    if not prefetch:
+        page = first_page
+        while True:
+            items, last = page_items(fetch_page(page))
+            yield from items
+            if last:
+                return
+            page += 1
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        page = first_page
+        future = executor.submit(fetch_page, page)
+        try:
+            while True:
+                items, last = page_items(future.result())
+                future = None
+                if last:
+                    yield from items
+                    return
+
+                page += 1
+                future = executor.submit(fetch_page, page)
+                yield from items
+        finally:
+            # Don't wait for a page nobody is going to read
+            if future is not None:
+                future.cancel()
+
+
+async def aiter_pages(fetch_page, first_page=1, prefetch=True):
+    """Asynchronous version of `iter_pages`, for coroutine `fetch_page` functions.
+
+    :param callable fetch_page: Coroutine function that returns the result for a page number
+    :param int first_page: Number of the first page to request
+    :param bool prefetch: Whether to request the next page in a background task
+     while the items of the current one are consumed
+    """
+    page = first_page
+    task = asyncio.ensure_future(fetch_page(page))
+    try:
+        while True:
+            items, last = page_items(await task)
+            task = None
+            if last:
+                for item in items:
+                    yield item
+                return
+
+            page += 1
+            if prefetch:
+                task = asyncio.ensure_future(fetch_page(page))
+
+            for item in items:
+                yield item
+
+            if task is None:
+                task = asyncio.ensure_future(fetch_page(page))
+    finally:
+        if task is not None:
+            task.cancel()
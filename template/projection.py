@@ -0,0 +1,726 @@
+"""Projection of the items of large pages on a few of their fields, parsed as they are received.
+
+A page of `claim_search`, `txo_list` or `transaction_list` can be several
+megabytes, when only a few fields of its items are needed. With `fields`,
+the paginated methods stream the response instead of decoding it whole:
+the items are decoded as soon as they are received, a chunk at a time,
+projected on the paths of `fields`, and yielded, so only the items
+of the current chunk are ever held in full.
+>>> page = lbry.claim_search(channel=channel, page_size=1000,
+...                          fields=["claim_id", "name", "meta.effective_amount"])
+>>> for claim in page:
+...     print(claim["claim_id"], claim["meta"]["effective_amount"])
+>>> page.info["total_pages"]
+
+The `iter_` methods do the same for every page:
+>>> for txo in lbry.iter_txo_list(type="claim", fields=["txid", "nout", "amount", "height"]):
+...     print(txo["txid"])
+
+A path goes through the lists it meets, so "outputs.amount" keeps the amount
+of every output of a transaction. Fields missing from an item are left out.
+Projected pages are neither cached nor stored, and are returned without models.
+
+With the `decode_pool` of the wrapper, a `ProcessPoolExecutor` for example,
+the items are decoded and projected in the pool, in batches of `DECODE_BATCH_SIZE`
+bytes, while the response is still being received.
+"""
+import asyncio
+import collections
+import re
+
+import requests
+
+import pybry.exception as lbryex
+from pybry.pagination import last_page
+
+# Size of the chunks in which the responses are read
+CHUNK_SIZE = 64 * 1024
+
+# Size of the encoded items decoded by each task of a decode pool
+DECODE_BATCH_SIZE = 1024 * 1024
+
+# Number of batches submitted to a decode pool ahead of the items consumed
+MAX_PENDING_BATCHES = 4
+
+# Size of the items received without a boundary between two of them,
+# after which they are split bracket by bracket
+EXACT_SCAN_SIZE = 4 * CHUNK_SIZE
+
+STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+
+# Outside the items: a complete string, or a lone quote starting a string not received yet,
+# or a bracket
+TOKEN = re.compile(STRING + rb'|["\[\]{}]')
+
+# Inside the items: everything up to the next bracket, complete strings included
+SKIP = re.compile(rb'(?:[^"\[\]{}]+|' + STRING + rb')*')
+
+# Between two items: the separator, and the opening of the next item up to its first key
+NEXT_ITEM = re.compile(rb'\s*,\s*\{\s*' + STRING)
+
+# What may still become `NEXT_ITEM` once more of the body is received
+NEXT_ITEM_PREFIX = re.compile(rb'\s*(?:,\s*(?:\{\s*(?:"[^"\\]*(?:\\.[^"\\]*)*\\?)?)?)?')
+
+SEPARATORS = re.compile(rb'[\s,]*')
+
+QUOTE, OPEN_OBJECT, OPEN_ARRAY, CLOSE_OBJECT = b'"'[0], b"{"[0], b"["[0], b"}"[0]
+
+# Parts of the body read by an `ItemScanner`
+ENVELOPE, ITEMS, REST = range(3)
+
+# Paths of the items in the response: the items of a page, or a result that is a list
+ITEMS_PATHS = ([b"result", b"items"], [b"result"])
+
+
+class Projection:
+    """The paths of the fields kept from each item."""
+
+    __slots__ = ("fields", "tree")
+
+    def __init__(self, fields):
+        """
+        :param list fields: Paths of the fields, with their names separated by dots, like "value.title";
+         a single string may separate them with commas
+        :raises ValueError: If no field is given
+        """
+        if isinstance(fields, str):
+            fields = fields.split(",")
+        self.fields = tuple(field.strip() for field in fields if field.strip())
+        if not self.fields:
+            raise ValueError("At least one field must be projected")
+
+        # Nested dicts of the names of the fields, None for the fields kept whole
+        self.tree = {}
+        for field in self.fields:
+            node = self.tree
+            *parents, name = field.split(".")
+            for parent in parents:
+                child = node.get(parent)
+                if child is None:
+                    child = node[parent] = {}
+                node = child
+            node[name] = None
+
+    def __call__(self, item):
+        """Return the projection of an item.
+
+        :param dict item: The decoded item
+        :rtype: dict
+        """
+        return _project(item, self.tree)
+
+    def __repr__(self):
+        return f"<Projection {', '.join(self.fields)}>"
+
+
+def _project(value, tree):
+    if type(value) is list:
+        return [_project(element, tree) for element in value if isinstance(element, (dict, list))]
+
+    projected = {}
+    for name, subtree in tree.items():
+        if name in value:
+            field = value[name]
+            if subtree is None:
+                projected[name] = field
+            elif isinstance(field, (dict, list)):
+                projected[name] = _project(field, subtree)
+    return projected
+
+
+def as_projection(fields):
+    """Return the `Projection` of the given fields, or the projection given.
+
+    :param list | str | Projection fields: Paths of the fields
+    :rtype: Projection
+    """
+    return fields if isinstance(fields, Projection) else Projection(fields)
+
+
+def decode_items(encoded, projection, codec):
+    """Decode runs of items, and return their projections; called in the decode pool, if any.
+
+    :param list encoded: The runs of encoded items, as `bytes` separated by commas inside each run
+    :param Projection projection: The projected fields
+    :param codec: The codec decoding them, such as `pybry.codec.JsonCodec`
+    :rtype: list
+    """
+    items = codec.loads(b"[" + b",".join(encoded) + b"]")
+    return [projection(item) for item in items]
+
+
+class ItemScanner:
+    """Splits the body of a response into runs of encoded items, as its chunks are received.
+
+    The items are the elements of `result.items`, or of `result` when it is a list;
+    only the items that are objects or lists are found. Up to the items, every string and bracket is read, to find their path.
+    The first item is split bracket by bracket, which teaches the boundary
+    between two items, such as `},{"address"`; the following items are then
+    split at the last boundary of each chunk, found without reading them.
+    Such a boundary may also be inside an item, in which case the run ending
+    there fails to decode: `rewind` then splits the items bracket by bracket
+    from that run on. So do the items that are not objects, or whose boundary
+    is not found within `EXACT_SCAN_SIZE` bytes. The rest of the body,
+    with an empty list of items, is kept to be decoded at the end.
+    """
+
+    def __init__(self):
+        # Whether the items are only split bracket by bracket
+        self.exact = False
+        self._state = ENVELOPE
+        # The body not split yet, and the offset of its start in the body
+        self._buffer = b""
+        self._base = 0
+        # Offset up to which the body was split, and the start of the runs not confirmed yet
+        self._pos = 0
+        self._retain = 0
+        # Number of open objects and lists, and the last string at the first levels, up to the items
+        self._depth = 0
+        self._keys = {}
+        self._path = []
+        # The boundary between two items, and its start up to the end of the first one
+        self._boundary = None
+        self._closing = b""
+        # The item being split bracket by bracket: its start, the offset scanned and its level
+        self._item_start = None
+        self._cursor = None
+        self._item_depth = 0
+        # The body outside the items, the number of its parts before them,
+        # and the offset of its part not saved yet
+        self._rest = []
+        self._envelope = 0
+        self._mark = 0
+
+    def feed(self, data):
+        """Scan a chunk of the body, and return the runs of items it completes.
+
+        :param bytes data: The next chunk of the body
+        :return: The runs of encoded items, as `(offset, bytes)` with the offset of each run in the body
+        :rtype: list
+        """
+        if self._state == REST:
+            self._rest.append(data)
+            return []
+
+        buffer = self._buffer + data if self._buffer else data
+        base = self._base
+        pos = self._pos - base
+        runs = []
+        if self._state == ENVELOPE:
+            pos = self._scan_envelope(buffer, pos)
+        if self._state == ITEMS:
+            pos = self._scan_items(buffer, pos, runs)
+
+        # Only the body not split yet is kept, and the runs that may have to be split again
+        if self._state == ENVELOPE:
+            self._rest.append(buffer[self._mark - base:pos])
+            self._mark = base + pos
+            keep = pos
+        else:
+            if self._state == REST:
+                self._rest.append(buffer[self._mark - base:])
+            keep = min(pos, self._retain - base)
+        self._buffer = buffer[keep:]
+        self._base = base + keep
+        self._pos = base + pos
+        return runs
+
+    def confirm(self, end):
+        """Tell that the runs of items up to an offset of the body were decoded.
+
+        :param int end: The offset of the end of the last run decoded
+        """
+        self._retain = max(self._retain, end)
+
+    def rewind(self, offset):
+        """Split the items bracket by bracket from the start of a run that failed to decode;
+        `feed(b"")` then returns the runs of the body already received.
+
+        :param int offset: The offset of the run in the body
+        """
+        buffer = self._buffer
+        if self._state == REST:
+            buffer = buffer[:self._mark - self._base] + b"".join(self._rest[self._envelope:])
+            del self._rest[self._envelope:]
+        self._buffer = buffer[offset - self._base:]
+        self._base = self._pos = self._retain = offset
+        self._state = ITEMS
+        self._cursor = None
+        self.exact = True
+
+    def close(self):
+        """Return the last runs of items, once the whole body is received.
+
+        :rtype: list
+        :raises ValueError: If the body ends inside the items
+        """
+        runs = []
+        if self._state == ITEMS:
+            self._scan_exact(self._buffer, self._pos - self._base, runs)
+            if self._state == ITEMS:
+                raise ValueError("The body ends inside the items")
+            self._rest.append(self._buffer[self._mark - self._base:])
+        return runs
+
+    def rest(self):
+        """Return the body outside the items, with an empty list of items.
+
+        :rtype: bytes
+        """
+        if self._state == ENVELOPE:
+            self._rest.append(self._buffer)
+            self._buffer = b""
+        return b"".join(self._rest)
+
+    def _scan_envelope(self, buffer, pos):
+        end = len(buffer)
+        while True:
+            match = TOKEN.search(buffer, pos)
+            if match is None:
+                return end
+
+            start = match.start()
+            if buffer[start] == QUOTE:
+                if match.end() - start == 1:
+                    # The rest of the string is not received yet
+                    return start
+                if self._depth <= 2:
+                    self._keys[self._depth] = buffer[start + 1:match.end() - 1]
+                pos = match.end()
+                continue
+
+            pos = start + 1
+            char = buffer[start]
+            depth = self._depth
+            if char != OPEN_OBJECT and char != OPEN_ARRAY:
+                self._depth = depth - 1
+                continue
+
+            self._depth = depth + 1
+            if 1 <= depth <= 2:
+                path = self._path[:depth - 1] + [self._keys.get(depth)]
+                if char == OPEN_ARRAY and path in ITEMS_PATHS:
+                    self._rest.append(buffer[self._mark - self._base:pos])
+                    self._envelope = len(self._rest)
+                    self._retain = self._base + pos
+                    self._state = ITEMS
+                    return pos
+                self._path = path
+
+    def _scan_items(self, buffer, pos, runs):
+        if self.exact:
+            return self._scan_exact(buffer, pos, runs)
+        if self._boundary is None:
+            return self._learn_boundary(buffer, pos, runs)
+
+        found = buffer.rfind(self._boundary, pos)
+        if found == -1:
+            if len(buffer) - pos < EXACT_SCAN_SIZE:
+                return pos
+            return self._scan_exact(buffer, pos, runs)
+
+        start = SEPARATORS.match(buffer, pos).end()
+        end = found + len(self._closing)
+        self._cursor = None
+        runs.append((self._base + start, buffer[start:end]))
+        return end
+
+    def _learn_boundary(self, buffer, pos, runs):
+        if not self._closing:
+            count = len(runs)
+            pos = self._scan_exact(buffer, pos, runs, single=True)
+            if len(runs) == count:
+                return pos
+            item = runs[-1][1]
+            if item[-1] != CLOSE_OBJECT:
+                self.exact = True
+                return self._scan_exact(buffer, pos, runs)
+            inner = item[:-1]
+            self._closing = inner[len(inner.rstrip()):] + b"}"
+
+        match = NEXT_ITEM.match(buffer, pos)
+        if match is None:
+            if NEXT_ITEM_PREFIX.fullmatch(buffer, pos) is None:
+                # The end of the items, or items that are not objects with a first key
+                self.exact = True
+                return self._scan_exact(buffer, pos, runs)
+            return pos
+
+        self._boundary = self._closing + match.group()
+        return self._scan_items(buffer, pos, runs)
+
+    def _scan_exact(self, buffer, pos, runs, single=False):
+        base, end = self._base, len(buffer)
+        if self._cursor is None:
+            depth, cursor, item_start = 0, pos, None
+        else:
+            depth, cursor, item_start = self._item_depth, self._cursor - base, self._item_start - base
+
+        while True:
+            cursor = SKIP.match(buffer, cursor).end()
+            if cursor == end or buffer[cursor] == QUOTE:
+                # The rest of the item, or of a string, is not received yet
+                break
+
+            char = buffer[cursor]
+            if char == OPEN_OBJECT or char == OPEN_ARRAY:
+                if not depth:
+                    item_start = cursor
+                depth += 1
+            elif not depth:
+                # The end of the list of items
+                self._state = REST
+                self._mark = base + cursor
+                self._cursor = None
+                return cursor
+            else:
+                depth -= 1
+                if not depth:
+                    runs.append((base + item_start, buffer[item_start:cursor + 1]))
+                    pos = cursor + 1
+                    if single:
+                        break
+            cursor += 1
+
+        if depth:
+            self._cursor, self._item_depth, self._item_start = base + cursor, depth, base + item_start
+        else:
+            self._cursor = None
+        return pos
+
+
+class ProjectedPage:
+    """The projected items of a page, yielded while its response is received.
+
+    The page can only be iterated once. Once its items are consumed,
+    the other members of the result, like `page` and `total_pages`, are in `info`.
+    """
+
+    def __init__(self, response, projection, codec, method, request=None, pool=None, call_info=None,
+                 on_close=None):
+        """
+        :param requests.Response response: The streamed response of the call
+        :param Projection projection: The projected fields
+        :param codec: The codec decoding the response, such as `pybry.codec.JsonCodec`
+        :param str method: The API method called
+        :param requests.PreparedRequest request: The request of the call
+        :param concurrent.futures.Executor pool: Pool decoding the items, if any
+        :param pybry.instrumentation.CallInfo call_info: The call, as seen by the hooks
+        :param callable on_close: Called once the response is closed,
+         such as the release of the permit of a rate limiter
+        """
+        self.response = response
+        self.projection = projection
+        self.codec = codec
+        self.method = method
+        self.request = request
+        self.pool = pool
+        self.call_info = call_info
+        self.on_close = on_close
+        self._open = True
+
+        # Number of items yielded, and the result without its items, once they are all read
+        self.count = 0
+        self.info = None
+        self.size = 0
+        self._scanner = ItemScanner()
+        # Batches submitted to the pool, as `(future, offset, end)`, and the runs of the next one
+        self._pending = collections.deque()
+        self._batch = []
+        self._batch_size = 0
+        self._items = self._iter_items()
+
+    def __iter__(self):
+        return self._items
+
+    def _iter_items(self):
+        error = None
+        try:
+            for chunk in self.response.iter_content(CHUNK_SIZE):
+                yield from self._received(chunk)
+                while self._pending and (self._pending[0][0].done() or
+                                         len(self._pending) > MAX_PENDING_BATCHES):
+                    yield from self._result()
+
+            self._submit()
+            while self._pending:
+                yield from self._result()
+            yield from self._decode(self._scanner.close(), exact=True)
+
+            self.info = finish_page(self._scanner.rest(), self.codec, self.method,
+                                    self.response.status_code, self.request)
+
+        except lbryex.LBRYError as err:
+            error = err
+            raise
+        except (requests.RequestException, ValueError) as err:
+            error = lbryex.LBRYError(f"The response to '{self.method}' could not be read",
+                                     None, self.response.status_code, self.request)
+            raise error from err
+        finally:
+            self._cancel()
+            self._close_response()
+            _report(self.call_info, self.response.status_code, self.size, error)
+
+    def _received(self, chunk):
+        """Split a chunk of the body, and return the items decoded in this process."""
+        self.size += len(chunk)
+        runs = self._scanner.feed(chunk)
+        if not runs:
+            return ()
+        if self.pool is None:
+            return self._decode(runs)
+
+        self._batch += runs
+        self._batch_size += sum(len(run) for _, run in runs)
+        if self._batch_size >= DECODE_BATCH_SIZE:
+            self._submit()
+        return ()
+
+    def _decode(self, runs, exact=False):
+        """Decode runs of items in this process, splitting them again if they were not split exactly."""
+        if not runs:
+            return []
+        try:
+            items = decode_items([run for _, run in runs], self.projection, self.codec)
+        except ValueError:
+            if exact or self._scanner.exact:
+                raise
+            return self._rewind(runs[0][0])
+        self._scanner.confirm(runs[-1][0] + len(runs[-1][1]))
+        return self._counted(items)
+
+    def _submit(self):
+        if not self._batch:
+            return
+        offset, (last, run) = self._batch[0][0], self._batch[-1]
+        future = self.pool.submit(decode_items, [run for _, run in self._batch], self.projection, self.codec)
+        self._pending.append((future, offset, last + len(run)))
+        self._batch, self._batch_size = [], 0
+
+    def _result(self):
+        """Return the items of the first batch submitted to the pool, once it is done."""
+        future, offset, end = self._pending.popleft()
+        try:
+            items = future.result()
+        except ValueError:
+            if self._scanner.exact:
+                raise
+            return self._rewind(offset)
+        self._scanner.confirm(end)
+        return self._counted(items)
+
+    def _rewind(self, offset):
+        """Split the items again from a run that failed to decode, and decode them in this process."""
+        self._cancel()
+        self._batch, self._batch_size = [], 0
+        self._scanner.rewind(offset)
+        return self._decode(self._scanner.feed(b""))
+
+    def _cancel(self):
+        for future, _, _ in self._pending:
+            future.cancel()
+        self._pending.clear()
+
+    def _counted(self, items):
+        self.count += len(items)
+        return items
+
+    def finish(self):
+        """Read the items left without projecting them, and return `info`.
+
+        :rtype: dict
+        """
+        self.projection = _discard
+        for _ in self._items:
+            pass
+        return self.info
+
+    def _close_response(self, complete=False):
+        """Close the response, or release its connection once it was read, and call `on_close`, once."""
+        if not self._open:
+            return
+        self._open = False
+        self.response.close()
+        if self.on_close is not None:
+            self.on_close()
+
+    def close(self):
+        """Stop reading the response, and close its connection."""
+        self._items.close()
+        self._close_response()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.method} {self.projection!r} count={self.count}>"
+
+
+class AsyncProjectedPage(ProjectedPage):
+    """Asynchronous version of `ProjectedPage`, iterated with `async for`."""
+
+    def __init__(self, response, projection, codec, method, request=None, pool=None, call_info=None,
+                 on_close=None):
+        """
+        :param aiohttp.ClientResponse response: The response of the call, whose body is not read yet
+        :param Projection projection: The projected fields
+        :param codec: The codec decoding the response, such as `pybry.codec.JsonCodec`
+        :param str method: The API method called
+        :param request: Information about the request of the call
+        :param concurrent.futures.Executor pool: Pool decoding the items, if any
+        :param pybry.instrumentation.CallInfo call_info: The call, as seen by the hooks
+        :param callable on_close: Called once the response is closed,
+         such as the release of the permit of a rate limiter
+        """
+        super().__init__(response, projection, codec, method, request, pool, call_info, on_close)
+
+    def __iter__(self):
+        raise TypeError(f"{type(self).__name__} is iterated with 'async for'")
+
+    def __aiter__(self):
+        return self._items
+
+    async def _iter_items(self):
+        import aiohttp
+
+        error = None
+        complete = False
+        try:
+            async for chunk in self.response.content.iter_chunked(CHUNK_SIZE):
+                for item in self._received(chunk):
+                    yield item
+                while self._pending and (self._pending[0][0].done() or
+                                         len(self._pending) > MAX_PENDING_BATCHES):
+                    for item in await self._async_result():
+                        yield item
+
+            self._submit()
+            while self._pending:
+                for item in await self._async_result():
+                    yield item
+            for item in self._decode(self._scanner.close(), exact=True):
+                yield item
+
+            complete = True
+            self.info = finish_page(self._scanner.rest(), self.codec, self.method,
+                                    self.response.status, self.request)
+
+        except lbryex.LBRYError as err:
+            error = err
+            raise
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as err:
+            error = lbryex.LBRYError(f"The response to '{self.method}' could not be read",
+                                     None, self.response.status, self.request)
+            raise error from err
+        finally:
+            self._cancel()
+            self._close_response(complete)
+            _report(self.call_info, self.response.status, self.size, error)
+
+    def _close_response(self, complete=False):
+        if not self._open:
+            return
+        self._open = False
+        if complete:
+            self.response.release()
+        else:
+            self.response.close()
+        if self.on_close is not None:
+            self.on_close()
+
+    async def _async_result(self):
+        # Wait for the batch without blocking the loop, then read it like `ProjectedPage`
+        try:
+            await asyncio.wrap_future(self._pending[0][0])
+        except Exception:
+            pass
+        return self._result()
+
+    async def finish(self):
+        """Read the items left without projecting them, and return `info`.
+
+        :rtype: dict
+        """
+        self.projection = _discard
+        async for _ in self._items:
+            pass
+        return self.info
+
+    async def close(self):
+        """Stop reading the response, and close its connection."""
+        await self._items.aclose()
+        self._close_response()
+
+    def __enter__(self):
+        raise TypeError(f"{type(self).__name__} is used with 'async with'")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+
+def _discard(item):
+    return None
+
+
+def _report(call_info, status_code, size, error):
+    """Tell the hooks that the response was read, or failed."""
+    if call_info is None or call_info.elapsed is not None:
+        return
+    call_info.received(status_code, size)
+    if error is None:
+        call_info.succeeded()
+    else:
+        call_info.failed(error)
+
+
+def finish_page(rest, codec, method, status_code, request):
+    """Return the members of the result of a page other than its items.
+
+    :param bytes rest: The body of the response outside the items
+    :raises LBRYError: If the daemon returned an error
+    :rtype: dict
+    """
+    response_json = codec.loads(rest)
+
+    if "result" in response_json:
+        result = response_json["result"]
+        if not isinstance(result, dict):
+            return {}
+        return {name: value for name, value in result.items() if name != "items"}
+
+    raise lbryex.LBRYError("POST Request made to LBRY received an error",
+                           response_json, status_code, request)
+
+
+def iter_projected_pages(open_page, first_page=1):
+    """Yield the projected items of every page opened by `open_page`, one page after the other.
+
+    :param callable open_page: Function that returns the `ProjectedPage` of a page number
+    :param int first_page: Number of the first page to request
+    """
+    page = first_page
+    while True:
+        with open_page(page) as projected:
+            yield from projected
+        if last_page(projected.info, projected.count):
+            return
+        page += 1
+
+
+async def aiter_projected_pages(open_page, first_page=1):
+    """Asynchronous version of `iter_projected_pages`, for coroutine `open_page` functions."""
+    page = first_page
+    while True:
+        async with await open_page(page) as projected:
+            async for item in projected:
+                yield item
+        if last_page(projected.info, projected.count):
+            return
+        page += 1
@@ -0,0 +1,107 @@
+"""Coalescing of identical concurrent calls ("single-flight").
+
+While a call is in flight, identical calls, with the same server,
+method and parameters, don't send their own request; they wait for
+the first one and share its result, or its exception.
+This avoids sending the same request many times when many threads
+or tasks ask for the same popular claim at the same time.
+>>> lbry = LbrydApi(coalesce=True)
+
+Only read-only commands are coalesced by default, as two identical calls
+to a command that changes the daemon, like `wallet_send`, must both be sent.
+The shared results should not be modified.
+"""
+import asyncio
+import threading
+
+from pybry import lbryd_spec
+
+
+class _Call:
+
+    __slots__ = ("done", "value", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesces identical calls made at the same time from several threads."""
+
+    def __init__(self, methods=None):
+        """
+        :param iterable methods: Methods whose calls are coalesced;
+         the read-only commands of the `lbrynet` API by default.
+        """
+        self.methods = frozenset(lbryd_spec.READ_ONLY if methods is None else methods)
+        self.coalesced = 0
+
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def is_coalesced(self, method):
+        """Whether identical calls to `method` are coalesced."""
+        return method in self.methods
+
+    def do(self, key, func):
+        """Return `func()`, or the result of the identical call already in flight.
+
+        :param tuple key: Key identifying the call, as returned by `pybry.cache.request_key`
+        :param callable func: Function that makes the call
+        :raises: The exception raised by the call in flight
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = func()
+            return call.value
+        except BaseException as err:
+            call.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def in_flight(self):
+        """Number of distinct calls in flight."""
+        return len(self._calls)
+
+
+class AsyncSingleFlight(SingleFlight):
+    """Coalesces identical calls made at the same time from several tasks of an event loop."""
+
+    async def do(self, key, func):
+        """Return `await func()`, or the result of the identical call already in flight.
+
+        The call runs in its own task, so cancelling one of the callers
+        doesn't cancel it for the others.
+
+        :param tuple key: Key identifying the call, as returned by `pybry.cache.request_key`
+        :param callable func: Coroutine function that makes the call
+        :raises: The exception raised by the call in flight
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(task)
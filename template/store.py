@@ -0,0 +1,278 @@
+"""Persistent store of the results that never change, shared by several processes.
+
+Some results only depend on the content they are looked up by: a transaction
+by its ID, or a block by its hash. A `PersistentStore` keeps them in a SQLite
+database on disk, in WAL mode, so every process using the same file reads
+what the others stored, like the workers of a web server:
+>>> store = PersistentStore("/var/cache/pybry/store.db")
+>>> lbry = LbrydApi(store=store, result_mode="meta")
+>>> lbrycrd = LbrycrdApi("user", "password", store=store, result_mode="meta")
+
+Only the calls of `rules` are stored, when they have the parameters that
+identify their content, and only once their result is confirmed,
+by `min_confirmations` blocks when it has a number of confirmations.
+The entries are keyed on the method and the normalized parameters,
+but not on the URL, so every daemon of the same chain shares them.
+The least recently used entries are evicted when the store holds
+more than `max_bytes`. The stored results come with a `ResponseMeta`,
+so the store is only used in the "meta" and "result" modes.
+
+Fields that change after the result is stored are as they were then,
+such as `confirmations`, which is a lower bound.
+"""
+import os
+import sqlite3
+import threading
+import time
+
+from pybry.cache import request_key
+from pybry.codec import get_codec
+
+# Parameters identifying the content of the results of each method;
+# positional parameters, as used by `lbrycrd`, only need to be given
+DEFAULT_RULES = {"transaction_show": ("txid",),
+                 "getrawtransaction": ("txid",),
+                 "getblock": ("blockhash",),
+                 "getblockheader": ("blockhash",)}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entry (
+    key TEXT PRIMARY KEY,
+    method TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    used INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entry_used ON entry (used);
+CREATE TABLE IF NOT EXISTS usage (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO usage (id, bytes) VALUES (1, 0);
+"""
+
+
+class PersistentStore:
+    """On-disk store of the immutable results of API calls, safe to share between processes and threads."""
+
+    def __init__(self, path, rules=None, min_confirmations=6, max_bytes=256 * 1024 * 1024,
+                 namespace="", timeout=1.0, touch_interval=60):
+        """
+        :param str path: Path of the database file; it is created if needed
+        :param dict rules: Parameters identifying the content of the results of each stored method;
+         `DEFAULT_RULES` by default
+        :param int min_confirmations: Number of confirmations of a result before it is stored
+        :param int max_bytes: Maximum total size of the stored results, in bytes
+        :param str namespace: Prefix of the keys, to keep the results of several chains,
+         such as the main network and the test network, in the same file
+        :param float timeout: Seconds to wait for another process writing to the store;
+         a result is requested from the daemon, or not stored, after that
+        :param float touch_interval: Seconds between the updates of the last use of an entry,
+         so that reading an entry rarely writes to the database
+        """
+        self.path = path
+        self.rules = DEFAULT_RULES if rules is None else rules
+        self.min_confirmations = min_confirmations
+        self.max_bytes = max_bytes
+        self.namespace = namespace
+        self.timeout = timeout
+        self.touch_interval = touch_interval
+        self.codec = get_codec()
+
+        # Counters of this process
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.errors = 0
+
+        # A connection for each thread, opened again in forked processes
+        self._local = threading.local()
+        self._connect().executescript(SCHEMA)
+
+    def _connect(self):
+        local = self._local
+        if getattr(local, "pid", None) != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            # The results can be requested again, so it doesn't wait for every commit to reach the disk
+            connection.execute("PRAGMA synchronous=NORMAL")
+            local.connection, local.pid = connection, os.getpid()
+        return local.connection
+
+    def close(self):
+        """Close the connection of the current thread."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None and self._local.pid == os.getpid():
+            connection.close()
+        self._local = threading.local()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # Rules
+
+    def is_stored(self, method, params):
+        """Whether the result of a call is looked up in the store.
+
+        :param str method: The API method
+        :param dict | list params: Its parameters, without those that are None
+        :rtype: bool
+        """
+        names = self.rules.get(method)
+        if names is None:
+            return False
+        if isinstance(params, list):
+            return len(params) >= len(names)
+        return all(params.get(name) is not None for name in names)
+
+    def is_final(self, result):
+        """Whether a result is confirmed deeply enough to be stored.
+
+        :param result: The result of a call whose `is_stored` is true
+        :rtype: bool
+        """
+        if isinstance(result, str):
+            # Serialized transactions and blocks, which are their own content
+            return bool(result)
+        if not isinstance(result, dict):
+            return False
+        if "items" in result:
+            items = result["items"]
+            return bool(items) and all(self.is_final(item) for item in items)
+
+        confirmations = result.get("confirmations")
+        if confirmations is not None:
+            return confirmations >= self.min_confirmations
+        height = result.get("height")
+        if height is not None:
+            return height > 0
+        # A transaction without confirmations is still in the mempool
+        return "txid" not in result
+
+    def key(self, method, params):
+        """Return the key of a call in the store.
+
+        :rtype: str
+        """
+        return "\x00".join(request_key(self.namespace, method, params))
+
+    # Entries
+
+    def get(self, method, params):
+        """Return the stored result of a call, and the size of its encoding, or None.
+
+        :param str method: The API method
+        :param dict | list params: Its parameters, without those that are None
+        :rtype: tuple
+        """
+        key = self.key(method, params)
+        try:
+            connection = self._connect()
+            row = connection.execute("SELECT value, used FROM entry WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error:
+            self.errors += 1
+            row = None
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        now = time.time()
+        if row[1] < now - self.touch_interval:
+            try:
+                connection.execute("UPDATE entry SET used = ? WHERE key = ?", (int(now), key))
+            except sqlite3.Error:
+                # Another process is writing; the entry is touched by a later read
+                self.errors += 1
+        return self.codec.loads(row[0]), len(row[0])
+
+    def put(self, method, params, result):
+        """Store the result of a call if it is final, evicting the least recently used entries if needed.
+
+        :param str method: The API method
+        :param dict | list params: Its parameters, without those that are None
+        :param result: Its result
+        :return: Whether the result was stored
+        :rtype: bool
+        """
+        if not self.is_final(result):
+            return False
+
+        value = self.codec.dumps(result)
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        if len(value) > self.max_bytes:
+            return False
+
+        key = self.key(method, params)
+        try:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._insert(connection, key, method, value)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        except sqlite3.Error:
+            # Another process is writing for too long; the result is not stored this time
+            self.errors += 1
+            return False
+
+        self.stores += 1
+        return True
+
+    def _insert(self, connection, key, method, value):
+        row = connection.execute("SELECT size FROM entry WHERE key = ?", (key,)).fetchone()
+        added = len(value) - (row[0] if row else 0)
+        connection.execute("INSERT OR REPLACE INTO entry (key, method, value, size, used) VALUES (?, ?, ?, ?, ?)",
+                           (key, method, value, len(value), int(time.time())))
+        connection.execute("UPDATE usage SET bytes = bytes + ? WHERE id = 1", (added,))
+        total = connection.execute("SELECT bytes FROM usage").fetchone()[0]
+        if total > self.max_bytes:
+            self._evict(connection, total)
+
+    def _evict(self, connection, total):
+        """Remove the least recently used entries, until a tenth of `max_bytes` is free."""
+        target = self.max_bytes * 9 // 10
+        removed, freed = [], 0
+        for key, size in connection.execute("SELECT key, size FROM entry ORDER BY used"):
+            if total - freed <= target:
+                break
+            removed.append((key,))
+            freed += size
+
+        connection.executemany("DELETE FROM entry WHERE key = ?", removed)
+        connection.execute("UPDATE usage SET bytes = bytes - ? WHERE id = 1", (freed,))
+        self.evictions += len(removed)
+
+    def clear(self):
+        """Remove every entry, for every process."""
+        connection = self._connect()
+        connection.execute("BEGIN IMMEDIATE")
+        connection.execute("DELETE FROM entry")
+        connection.execute("UPDATE usage SET bytes = 0 WHERE id = 1")
+        connection.execute("COMMIT")
+
+    def __len__(self):
+        return self._connect().execute("SELECT COUNT(*) FROM entry").fetchone()[0]
+
+    def stats(self):
+        """Return the counters of this process, and the size of the store.
+
+        :rtype: dict
+        """
+        lookups = self.hits + self.misses
+        return {"hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "errors": self.errors,
+                "entries": len(self),
+                "bytes": self._connect().execute("SELECT bytes FROM usage").fetchone()[0]}
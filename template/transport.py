@@ -0,0 +1,461 @@
+"""Transports sending the requests of the synchronous wrappers to the daemons.
+
+A transport sends a prepared request and returns its response, which has
+at least the `status_code`, the `content` and the `elapsed` time of a
+`requests.Response`. Connection errors and timeouts are raised as
+`requests.ConnectionError` and `requests.Timeout` by every transport,
+so the retries and the circuit breakers work the same with all of them.
+- `RequestsTransport`, the default, sends them with a pooled `requests.Session`;
+- `HttpTransport` sends them with `http.client` over its own keep-alive
+  connections, without the proxies, hooks and adapters of `requests`;
+- `UnixTransport` sends them like `HttpTransport`, over a Unix domain socket,
+  to a daemon behind a proxy listening on that socket.
+>>> lbry = LbrydApi(transport=UnixTransport("/run/lbrynet.sock"))
+
+With `compress=True`, a transport asks for the responses to be compressed
+with gzip or deflate, and the server compresses them if it supports it.
+With `compress_requests`, the bodies of the requests larger than that
+many bytes are compressed with gzip; a server that answers them with
+"415 Unsupported Media Type" is sent uncompressed bodies from then on.
+
+With `stream=True`, a transport returns the response as soon as its headers
+are received, and its body is read, decompressed, with `iter_content`;
+the connection is reused once the body is read, or closed with the response.
+"""
+import collections
+import datetime
+import gzip
+import http.client
+import json
+import select
+import socket
+import threading
+import time
+import zlib
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import resolve_proxies
+
+# Encodings accepted for the responses, when they are compressed
+ACCEPT_ENCODING = "gzip, deflate"
+
+# Errors of writing to a keep-alive connection that the server closed while it was idle
+STALE_ERRORS = (ConnectionResetError, BrokenPipeError)
+
+
+def decode_content(content, encoding):
+    """Return the decompressed body of a response.
+
+    :param bytes content: The body as received
+    :param str encoding: Its `Content-Encoding`, if any
+    :rtype: bytes
+    """
+    if not encoding or not content:
+        return content
+    encoding = encoding.strip().lower()
+    try:
+        if encoding == "gzip":
+            return zlib.decompress(content, 16 + zlib.MAX_WBITS)
+        if encoding == "deflate":
+            try:
+                return zlib.decompress(content)
+            except zlib.error:
+                # Some servers send a raw deflate stream, without the zlib header
+                return zlib.decompress(content, -zlib.MAX_WBITS)
+    except zlib.error as err:
+        raise requests.exceptions.ContentDecodingError(err)
+    return content
+
+
+class Response:
+    """Response of a request sent by `HttpTransport`, with the attributes of a `requests.Response` it needs."""
+
+    __slots__ = ("status_code", "reason", "headers", "content", "elapsed", "url")
+
+    def __init__(self, status_code, reason, headers, content, elapsed, url):
+        """
+        :param int status_code: HTTP Status code of the response
+        :param str reason: Its reason phrase
+        :param http.client.HTTPMessage headers: Its headers
+        :param bytes content: Its decompressed body
+        :param datetime.timedelta elapsed: Time between sending the request and receiving the response
+        :param str url: URL of the request
+        """
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+        self.elapsed = elapsed
+        self.url = url
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8")
+
+    def json(self):
+        return json.loads(self.content)
+
+    def close(self):
+        """Nothing to release, the body was read with the response."""
+
+    def __repr__(self):
+        return f"<Response [{self.status_code}]>"
+
+
+class StreamedResponse:
+    """Response of a request sent by `HttpTransport` with `stream=True`, whose body is read in chunks."""
+
+    def __init__(self, transport, pool, connection, response, elapsed, prepared):
+        """
+        :param HttpTransport transport: The transport that sent the request
+        :param collections.deque pool: Idle connections of its host
+        :param http.client.HTTPConnection connection: Connection of the response
+        :param http.client.HTTPResponse response: The response, whose headers are read
+        :param datetime.timedelta elapsed: Time between sending the request and receiving the headers
+        :param requests.PreparedRequest prepared: The request
+        """
+        self.status_code = response.status
+        self.reason = response.reason
+        self.headers = response.headers
+        self.elapsed = elapsed
+        self.url = prepared.url
+
+        self._transport = transport
+        self._pool = pool
+        self._connection = connection
+        self._response = response
+        self._request = prepared
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    def iter_content(self, chunk_size=64 * 1024):
+        """Yield the decompressed body in chunks of about `chunk_size` bytes.
+
+        :raises requests.ConnectionError: If the connection is lost
+        :raises requests.Timeout: If the server stops sending the body
+        """
+        response = self._response
+        encoding = (response.getheader("Content-Encoding") or "").strip().lower()
+        # Both the gzip and the zlib headers are detected
+        decompressor = zlib.decompressobj(32 + zlib.MAX_WBITS) if encoding in ("gzip", "deflate") else None
+
+        try:
+            while True:
+                try:
+                    chunk = response.read(chunk_size)
+                except socket.timeout as err:
+                    raise requests.Timeout(err, request=self._request)
+                except (http.client.HTTPException, OSError) as err:
+                    raise requests.ConnectionError(err, request=self._request)
+                if not chunk:
+                    break
+                if decompressor is not None:
+                    try:
+                        chunk = decompressor.decompress(chunk)
+                    except zlib.error as err:
+                        raise requests.exceptions.ContentDecodingError(err)
+                if chunk:
+                    yield chunk
+        except BaseException:
+            self.close()
+            raise
+
+        if self._connection is not None:
+            self._transport._release(self._pool, self._connection, response)
+            self._connection = None
+
+    def close(self):
+        """Close the connection, unless the body was read and it went back to the pool."""
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            connection.close()
+
+    def __repr__(self):
+        return f"<StreamedResponse [{self.status_code}]>"
+
+
+class Transport:
+    """Sends prepared requests, and returns their responses; subclasses implement `_send`."""
+
+    def __init__(self, compress=False, compress_requests=None):
+        """
+        :param bool compress: Whether the responses are asked to be compressed
+        :param int compress_requests: Size in bytes above which the bodies of the requests
+         are compressed with gzip; they are never compressed by default
+        """
+        self.compress = compress
+        self.compress_requests = compress_requests
+        # URLs whose server rejected a compressed body
+        self._plain = set()
+
+    def send(self, prepared, timeout, stream=False):
+        """Send a prepared request, and return its response.
+
+        :param requests.PreparedRequest prepared: The request, which may be modified
+        :param float timeout: Seconds to wait for the server
+        :param bool stream: Whether the response is returned before its body is read
+        :raises requests.ConnectionError: If the server cannot be reached
+        :raises requests.Timeout: If the server doesn't answer in time
+        """
+        if self.compress:
+            prepared.headers["Accept-Encoding"] = ACCEPT_ENCODING
+
+        body = prepared.body
+        compressed = (self.compress_requests is not None and len(body) > self.compress_requests
+                      and prepared.url not in self._plain)
+        if compressed:
+            self._set_body(prepared, gzip.compress(body), "gzip")
+
+        response = self._send(prepared, timeout, stream)
+        if compressed and response.status_code == 415:
+            response.close()
+            self._plain.add(prepared.url)
+            self._set_body(prepared, body, None)
+            response = self._send(prepared, timeout, stream)
+        return response
+
+    @staticmethod
+    def _set_body(prepared, body, encoding):
+        prepared.body = body
+        prepared.headers["Content-Length"] = str(len(body))
+        if encoding:
+            prepared.headers["Content-Encoding"] = encoding
+        else:
+            prepared.headers.pop("Content-Encoding", None)
+
+    def _send(self, prepared, timeout, stream):
+        raise NotImplementedError
+
+    def close(self):
+        """Close every pooled connection."""
+
+
+class RequestsTransport(Transport):
+    """Sends the requests with a pooled `requests.Session`, created on first use."""
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, max_retries=0, **options):
+        """
+        :param int pool_connections: Number of distinct hosts to keep connection pools for
+        :param int pool_maxsize: Maximum number of connections kept open per host
+        :param int max_retries: Number of times a failed connection is retried by the adapter
+        :param options: Compression options of `Transport`
+        """
+        super().__init__(**options)
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+
+        self._session = None
+        self._lock = threading.Lock()
+        # Proxies of each URL
+        self._proxies = {}
+
+    @property
+    def session(self):
+        """The pooled `requests.Session`, created on first use."""
+        session = self._session
+        if session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._create_session()
+                session = self._session
+        return session
+
+    def _create_session(self):
+        """Create a session with pooled adapters for both HTTP and HTTPS."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_connections,
+                              pool_maxsize=self.pool_maxsize,
+                              max_retries=self.max_retries)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _send(self, prepared, timeout, stream):
+        # The proxies of each URL are resolved once, instead of reading
+        # the environment for every request
+        session = self.session
+        proxies = self._proxies.get(prepared.url)
+        if proxies is None:
+            proxies = self._proxies[prepared.url] = resolve_proxies(prepared, session.proxies,
+                                                                    session.trust_env)
+        return session.send(prepared, timeout=timeout, proxies=proxies, stream=stream)
+
+    def close(self):
+        with self._lock:
+            session, self._session = self._session, None
+            self._proxies = {}
+        if session is not None:
+            session.close()
+
+
+class HttpTransport(Transport):
+    """Sends the requests with `http.client`, over keep-alive connections kept for each host."""
+
+    def __init__(self, pool_maxsize=10, **options):
+        """
+        :param int pool_maxsize: Maximum number of idle connections kept open per host
+        :param options: Compression options of `Transport`
+        """
+        super().__init__(**options)
+        self.pool_maxsize = pool_maxsize
+        # Idle connections of each host, and host and path of each URL
+        self._pools = {}
+        self._targets = {}
+
+    def _target(self, url):
+        target = self._targets.get(url)
+        if target is None:
+            parts = urlsplit(url)
+            port = parts.port or (443 if parts.scheme == "https" else 80)
+            path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+            target = self._targets[url] = ((parts.scheme, parts.hostname, port), path)
+        return target
+
+    def _connect(self, host, timeout):
+        """Return a new connection to a host.
+
+        :param tuple host: Scheme, host name and port
+        :rtype: http.client.HTTPConnection
+        """
+        scheme, name, port = host
+        connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return connection_class(name, port, timeout=timeout)
+
+    def _send(self, prepared, timeout, stream):
+        host, path = self._target(prepared.url)
+        pool = self._pools.get(host)
+        if pool is None:
+            pool = self._pools.setdefault(host, collections.deque())
+
+        while True:
+            try:
+                connection, reused = pool.pop(), True
+            except IndexError:
+                connection, reused = self._connect(host, timeout), False
+            else:
+                if self._is_dropped(connection):
+                    connection.close()
+                    continue
+                connection.timeout = timeout
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout)
+
+            start = time.perf_counter()
+            try:
+                try:
+                    connection.request("POST", path, prepared.body, prepared.headers)
+                except STALE_ERRORS:
+                    # The server closed the idle connection before the request was written,
+                    # so it is sent on another one; once written, it may have been run
+                    if not reused:
+                        raise
+                    connection.close()
+                    continue
+                response = connection.getresponse()
+                content = None if stream else response.read()
+                break
+            except socket.timeout as err:
+                connection.close()
+                raise requests.Timeout(err, request=prepared)
+            except (http.client.HTTPException, OSError) as err:
+                connection.close()
+                raise requests.ConnectionError(err, request=prepared)
+
+        elapsed = datetime.timedelta(seconds=time.perf_counter() - start)
+        if stream:
+            return StreamedResponse(self, pool, connection, response, elapsed, prepared)
+
+        self._release(pool, connection, response)
+        content = decode_content(content, response.getheader("Content-Encoding"))
+        return Response(response.status, response.reason, response.headers, content, elapsed, prepared.url)
+
+    @staticmethod
+    def _is_dropped(connection):
+        """Return whether the server closed an idle connection, which is then readable."""
+        if connection.sock is None:
+            return False
+        try:
+            return bool(select.select([connection.sock], [], [], 0)[0])
+        except (OSError, ValueError):
+            return True
+
+    def _release(self, pool, connection, response):
+        """Keep a connection whose response was read for the next requests, or close it."""
+        if response.will_close or len(pool) >= self.pool_maxsize:
+            connection.close()
+        else:
+            pool.append(connection)
+
+    def close(self):
+        pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            while pool:
+                pool.pop().close()
+
+
+class UnixConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix domain socket."""
+
+    def __init__(self, socket_path, host="localhost", timeout=None):
+        super().__init__(host, timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+class UnixTransport(HttpTransport):
+    """Sends the requests over a Unix domain socket, like `HttpTransport`; the host of the URLs is only sent."""
+
+    def __init__(self, socket_path, pool_maxsize=10, **options):
+        """
+        :param str socket_path: Path of the socket of the daemon, or of the proxy in front of it
+        :param int pool_maxsize: Maximum number of idle connections kept open
+        :param options: Compression options of `Transport`
+        """
+        super().__init__(pool_maxsize, **options)
+        self.socket_path = socket_path
+
+    def _connect(self, host, timeout):
+        return UnixConnection(self.socket_path, host[1] or "localhost", timeout)
+
+
+TRANSPORTS = {"requests": RequestsTransport,
+              "http": HttpTransport}
+
+
+def make_transport(transport=None, pool_connections=10, pool_maxsize=10, max_retries=0, **options):
+    """Return the transport of a wrapper.
+
+    :param str | Transport transport: A transport, or the name of one in `TRANSPORTS`;
+     "requests" by default
+    :param int pool_connections: Number of distinct hosts to keep connection pools for
+    :param int pool_maxsize: Maximum number of connections kept open per host
+    :param int max_retries: Number of times a failed connection is retried by `requests`
+    :param options: Compression options of `Transport`, for a transport given by its name;
+     a given `Transport` keeps its own
+    :rtype: Transport
+    """
+    if transport is None or transport == "requests":
+        return RequestsTransport(pool_connections, pool_maxsize, max_retries, **options)
+    if transport == "http":
+        return HttpTransport(pool_maxsize, **options)
+    if isinstance(transport, str):
+        raise ValueError(f"Unknown transport {transport!r}, expected one of {sorted(TRANSPORTS)}")
+    return transport